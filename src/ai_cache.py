@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+AI Response Cache
+LRU + TTL cache for AI answers, optionally persisted to sqlite
+
+Author: SSV
+Date: October 2026
+"""
+
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from config import get_setting
+
+_PUNCTUATION = re.compile(r"[^\w\s]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query):
+    """Fold case, punctuation and spacing so trivially different questions share an entry"""
+    query = _PUNCTUATION.sub(" ", query.lower())
+    return _WHITESPACE.sub(" ", query).strip()
+
+
+class ResponseCache:
+    """Bounded cache of AI answers keyed by (namespace, normalized query).
+
+    The namespace should capture everything else that shapes an answer
+    (model, generation options, data fingerprint), so entries for stale
+    portfolio data are simply never looked up again.
+    """
+
+    def __init__(self, max_entries=None, ttl=None, path=None):
+        self.max_entries = max_entries or get_setting("ai_cache_size")
+        self.ttl = ttl if ttl is not None else get_setting("ai_cache_ttl")
+        self.path = path if path is not None else get_setting("ai_cache_path")
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.path:
+            self._open(self.path)
+
+    def _open(self, path):
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS answers "
+            "(key TEXT PRIMARY KEY, answer TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        now = time.time()
+        self._db.execute("DELETE FROM answers WHERE created < ?", (now - self.ttl,))
+        rows = self._db.execute(
+            "SELECT key, answer, created FROM answers ORDER BY created DESC LIMIT ?",
+            (self.max_entries,),
+        ).fetchall()
+        self._db.commit()
+        # Oldest first so the most recent answers end up most recently used
+        for key, answer, created in reversed(rows):
+            self._entries[key] = (answer, created)
+
+    @staticmethod
+    def make_key(query, namespace=""):
+        return f"{namespace}\x00{normalize_query(query)}"
+
+    def get(self, query, namespace=""):
+        """Return a cached answer or None"""
+        key = self.make_key(query, namespace)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                answer, created = entry
+                if time.time() - created <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return answer
+                del self._entries[key]
+                self._delete(key)
+            self.misses += 1
+            return None
+
+    def put(self, query, answer, namespace=""):
+        """Store an answer, evicting the least recently used beyond the size bound"""
+        key = self.make_key(query, namespace)
+        created = time.time()
+        with self._lock:
+            self._entries[key] = (answer, created)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                old_key, _ = self._entries.popitem(last=False)
+                self.evictions += 1
+                self._delete(old_key)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO answers (key, answer, created) VALUES (?, ?, ?)",
+                    (key, answer, created),
+                )
+                self._db.commit()
+
+    def _delete(self, key):
+        if self._db is not None:
+            self._db.execute("DELETE FROM answers WHERE key = ?", (key,))
+            self._db.commit()
+
+    def clear(self):
+        """Drop every entry, in memory and on disk"""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM answers")
+                self._db.commit()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Return hit/miss counters and size"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
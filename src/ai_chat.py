@@ -8,27 +8,66 @@ Date: June 2025
 """
 
 import os
-import json
-from pathlib import Path
+import time
+
+from ai_cache import ResponseCache
+from answers import PrecomputedAnswers
+from batching import MicroBatcher, pipeline_generate
+from config import get_setting
+from datastore import get_store
+from memory import ConversationMemory, estimate_tokens, is_follow_up
+from metrics import count_tokens, get_metrics
+from models import get_registry
+from prefix_cache import PrefixCache, prefix_generate
+from retrieval import RetrievalIndex
+from streaming import StreamCleaner, stream_pipeline
 
 try:
-    from transformers import pipeline, set_seed
+    from transformers import set_seed
     import torch
     AI_AVAILABLE = True
 except ImportError:
     AI_AVAILABLE = False
     print("⚠️  AI features require transformers. Install with: pip install transformers torch")
 
+# Shared request metrics (no-ops unless enabled)
+metrics = get_metrics()
+
+# Answers are cut off after this many sentences
+MAX_SENTENCES = 3
+
+# data.json keys that feed the persona preamble of every prompt
+PERSONA_FIELDS = frozenset({'name', 'title'})
+
 class AIChat:
     """AI-powered chat functionality for the portfolio assistant"""
     
-    def __init__(self, model_name="gpt2"):
+    def __init__(self, model_name="gpt2", deterministic=None):
         self.model_name = model_name
+        # Greedy decoding makes repeated questions safe to answer from cache
+        if deterministic is None:
+            deterministic = get_setting("ai_deterministic")
+        self.deterministic = deterministic
+        self.cache = ResponseCache()
         self.chatbot = None
-        self.context_data = None
+        self.batcher = None
+        self.prefix_cache = None
+        self.store = None
+        self._persona = None
+        self._index = None
+        # Precomputed answers to common questions (see answers.py)
+        self.answers = None
+        self.top_k = get_setting("ai_retrieval_top_k")
         self.initialize_ai()
+        # The conversation so far, unless a caller passes its own session's
+        self.memory = self.new_memory()
         self.load_context()
         
+    @property
+    def context_data(self):
+        """Portfolio data from the shared, hot-reloaded store"""
+        return self.store.data if self.store else {}
+        
     def initialize_ai(self):
         """Initialize the AI model"""
         if not AI_AVAILABLE:
@@ -41,13 +80,20 @@ class AIChat:
             set_seed(42)
             
             # Initialize the text generation pipeline
-            self.chatbot = pipeline(
-                "text-generation",
-                model=self.model_name,
-                max_length=200,
+            # One copy of the weights per process, shared with the assistant
+            self.chatbot = get_registry().acquire(
+                self.model_name,
+                max_new_tokens=150,
                 temperature=0.7,
                 pad_token_id=50256  # GPT-2 pad token
             )
+            # Concurrent questions share one batched forward pass; a lone
+            # question reuses the persona's cached keys/values instead
+            if get_setting("ai_prefix_cache"):
+                self.prefix_cache = PrefixCache(self.chatbot)
+                self.batcher = MicroBatcher(prefix_generate(self.chatbot, self.prefix_cache))
+            else:
+                self.batcher = MicroBatcher(pipeline_generate(self.chatbot))
             
             print("✅ AI model loaded successfully!")
             return True
@@ -58,34 +104,83 @@ class AIChat:
             
     def load_context(self):
         """Load personal context data for AI responses"""
+        store = get_store()
         try:
-            data_path = Path(__file__).parent / "data.json"
-            with open(data_path, 'r', encoding='utf-8') as file:
-                self.context_data = json.load(file)
+            store.ensure_loaded()
         except FileNotFoundError:
             print("⚠️  No context data found. AI responses will be generic.")
-            self.context_data = {}
+            return
+        except ValueError as e:
+            print(f"⚠️  {e}. AI responses will be generic.")
+            return
+        self.store = store
+        self.store.subscribe(self.on_data_change)
+        if get_setting("answer_table"):
+            self.answers = PrecomputedAnswers(store)
+        
+    def on_data_change(self, changed, snapshot):
+        """Rebuild the persona preamble only if its fields changed"""
+        if changed & PERSONA_FIELDS:
+            self._persona = None
+        self._index = None
+        # Cached answers need no clearing: they are keyed by the data's
+        # fingerprint (cache_namespace), so edits simply miss the old ones
             
-    def generate_context_prompt(self, user_query):
-        """Generate a context-aware prompt based on personal data"""
-        if not self.context_data:
-            return f"Answer this question professionally: {user_query}"
+    def persona_prompt(self):
+        """Return the constant part of the context prompt"""
+        persona = self._persona
+        if persona is None:
+            # Extract relevant context
+            name = self.context_data.get('name', 'the developer')
+            title = self.context_data.get('title', 'Software Developer')
             
-        # Extract relevant context
-        name = self.context_data.get('name', 'the developer')
-        title = self.context_data.get('title', 'Software Developer')
-        skills = ', '.join(self.context_data.get('skills', [])[:5])  # Top 5 skills
-        
-        context_prompt = f"""
-You are {name}, a {title} with expertise in {skills}.
+            persona = self._persona = f"""
+You are {name}, a {title}.
 Answer the following question about your background professionally and concisely:
 
-Question: {user_query}
+"""
+        return persona
+        
+    def retrieval_index(self):
+        """Return the search index over the portfolio, built once per data version"""
+        index = self._index
+        if index is None:
+            index = self._index = RetrievalIndex.from_data(self.context_data)
+        return index
+        
+    def retrieve(self, query, k=None, kinds=None):
+        """Return the portfolio facts most relevant to a query"""
+        return self.retrieval_index().search(query, k or self.top_k, kinds)
+            
+    def new_memory(self):
+        """Empty conversation memory measured with this model's tokenizer"""
+        def count(text):
+            return count_tokens(self.chatbot, text) or estimate_tokens(text)
+        return ConversationMemory(count=count)
+        
+    def history_prefix(self, memory):
+        """Persona plus earlier turns: the part of the prompt that only grows"""
+        return self.persona_prompt() + memory.render()
+        
+    def generate_context_prompt(self, user_query, memory=None):
+        """Generate a context-aware prompt based on personal data"""
+        history = memory.render() if memory is not None else ""
+        if not self.context_data:
+            return f"{history}Answer this question professionally: {user_query}"
+            
+        # Only the facts relevant to this question go into the prompt; a
+        # follow-up with nothing of its own borrows the previous question's
+        snippets = self.retrieve(user_query)
+        if not snippets and memory is not None and memory.last_question:
+            snippets = self.retrieve(memory.last_question)
+        facts = ''.join(f"- {snippet.text}\n" for snippet in snippets)
+        if facts:
+            facts = f"Relevant facts:\n{facts}\n"
+            
+        return f"""{self.persona_prompt()}{history}{facts}Question: {user_query}
 
 Answer:"""
         
-        return context_prompt
-        
     def clean_response(self, generated_text, original_prompt):
         """Clean and format the AI response"""
         # Remove the original prompt from the response
@@ -95,10 +190,10 @@ Answer:"""
         response = response.replace("Answer:", "").strip()
         response = response.replace("Question:", "").strip()
         
-        # Limit response length
+        # Limit response length (generation normally stops here already)
         sentences = response.split('.')
-        if len(sentences) > 3:
-            response = '. '.join(sentences[:3]) + '.'
+        if len(sentences) > MAX_SENTENCES:
+            response = '. '.join(sentences[:MAX_SENTENCES]) + '.'
             
         # Remove incomplete sentences at the end
         if response and not response.endswith(('.', '!', '?')):
@@ -108,39 +203,162 @@ Answer:"""
                 
         return response.strip()
         
-    def generate_response(self, user_query, max_length=150):
-        """Generate AI response to user query"""
+    def generate_response(self, user_query, max_new_tokens=150, memory=None):
+        """Generate AI response to user query.
+
+        The answer is remembered in `memory` (this chat's own conversation
+        by default) so later questions can refer back to it.
+        """
         if not self.chatbot:
             return "🤖 AI chat is not available. Please install required dependencies."
             
+        if memory is None:
+            memory = self.memory
+        namespace = self.cache_namespace(max_new_tokens)
+        # Only a question that stands on its own has one right answer to cache
+        standalone = not memory.render() or not is_follow_up(user_query)
+        if self.deterministic and standalone:
+            cached = self.cache.get(user_query, namespace)
+            if metrics.enabled:
+                metrics.inc("ai_cache_total", result="hit" if cached is not None else "miss")
+            if cached is not None:
+                memory.add(user_query, cached)
+                return cached
+                
         try:
             # Create context-aware prompt
-            prompt = self.generate_context_prompt(user_query)
+            with metrics.timer("ai_prompt_seconds"):
+                prompt = self.generate_context_prompt(user_query, memory)
+            self.prepare_prefix(memory)
             
             # Generate response
-            result = self.chatbot(
+            if self.deterministic:
+                sampling = {"do_sample": False}
+            else:
+                sampling = {"do_sample": True, "temperature": 0.7}
+            # Budgets count generated tokens only (not the long context
+            # prompt), and generation ends as soon as the answer has its
+            # sentences instead of running on to be trimmed afterwards
+            started = time.perf_counter()
+            result = self.batcher(
                 prompt,
-                max_length=max_length,
+                max_new_tokens=max_new_tokens,
+                max_sentences=MAX_SENTENCES,
                 num_return_sequences=1,
-                temperature=0.7,
-                do_sample=True,
-                pad_token_id=50256
+                pad_token_id=50256,
+                **sampling
             )
             
             # Extract and clean the response
             generated_text = result[0]['generated_text']
             cleaned_response = self.clean_response(generated_text, prompt)
+            if metrics.enabled:
+                metrics.observe("ai_generate_seconds", time.perf_counter() - started, model=self.model_name, mode="batch")
+                metrics.inc("ai_prompt_tokens_total", count_tokens(self.chatbot, prompt), model=self.model_name)
+                metrics.inc("ai_generated_tokens_total", count_tokens(self.chatbot, generated_text[len(prompt):]),
+                            model=self.model_name)
             
             if not cleaned_response:
                 return "🤔 I'm not sure how to respond to that. Try asking about my skills, projects, or experience!"
                 
+            if self.deterministic and standalone:
+                self.cache.put(user_query, cleaned_response, namespace)
+            memory.add(user_query, cleaned_response)
             return cleaned_response
             
         except Exception as e:
             return f"🤖 AI processing error: {str(e)}"
             
+    def prepare_prefix(self, memory):
+        """Bring the prefix cache up to date with the persona and the history"""
+        if self.prefix_cache is None:
+            return
+        # Only recomputed when the persona (name/title) changes
+        self.prefix_cache.prepare(self.persona_prompt())
+        if memory.render():
+            # Extended by the last turn's tokens, recomputed only after a compaction
+            self.prefix_cache.prepare(self.history_prefix(memory), key=memory.key)
+
+    def stream_response(self, user_query, max_new_tokens=150, memory=None):
+        """Yield the AI response in pieces as the model generates it"""
+        if not self.chatbot:
+            yield "🤖 AI chat is not available. Please install required dependencies."
+            return
+            
+        if memory is None:
+            memory = self.memory
+        namespace = self.cache_namespace(max_new_tokens)
+        standalone = not memory.render() or not is_follow_up(user_query)
+        answer = self.precomputed_answer(user_query, memory) if standalone else None
+        if answer is not None:
+            yield answer
+            return
+        if self.deterministic and standalone:
+            cached = self.cache.get(user_query, namespace)
+            if cached is not None:
+                memory.add(user_query, cached)
+                yield cached
+                return
+                
+        prompt = self.generate_context_prompt(user_query, memory)
+        if self.deterministic:
+            sampling = {"do_sample": False}
+        else:
+            sampling = {"do_sample": True, "temperature": 0.7}
+            
+        # Prompt stripping happens in the streamer; artifacts and the
+        # sentence limit are handled as the text arrives
+        cleaner = StreamCleaner(max_sentences=MAX_SENTENCES)
+        try:
+            self.prepare_prefix(memory)
+            for chunk in stream_pipeline(self.chatbot, prompt, prefix_cache=self.prefix_cache,
+                                         max_new_tokens=max_new_tokens, max_sentences=MAX_SENTENCES,
+                                         pad_token_id=50256, **sampling):
+                text = cleaner.feed(chunk)
+                if text:
+                    yield text
+                if cleaner.done:
+                    break
+            tail = cleaner.finish()
+            if tail:
+                yield tail
+        except Exception as e:
+            yield f"🤖 AI processing error: {str(e)}"
+            return
+            
+        cleaned_response = cleaner.result()
+        if not cleaned_response:
+            yield "🤔 I'm not sure how to respond to that. Try asking about my skills, projects, or experience!"
+            return
+        if self.deterministic and standalone:
+            self.cache.put(user_query, cleaned_response, namespace)
+        memory.add(user_query, cleaned_response)
+            
+    def precomputed_answer(self, user_query, memory):
+        """Answer from the precomputed table (remembering it), or None to generate one"""
+        if self.answers is None:
+            return None
+        answer = self.answers.lookup(user_query)
+        if metrics.enabled:
+            metrics.inc("answer_table_total", result="hit" if answer is not None else "miss")
+        if answer is not None:
+            memory.add(user_query, answer)
+        return answer
+            
+    def cache_namespace(self, max_new_tokens):
+        """Everything besides the question that determines an answer"""
+        fingerprint = self.store.snapshot.fingerprint if self.store else ""
+        # Quantized or fused backends do not reproduce fp32 answers exactly
+        backend = getattr(self.chatbot, 'backend', 'fp32')
+        return f"{self.model_name}:{backend}:{max_new_tokens}:{fingerprint}"
+            
     def get_smart_response(self, query):
         """Get intelligent response based on query type"""
+        # Common questions are answered straight from the data
+        if not (self.memory.render() and is_follow_up(query)):
+            answer = self.precomputed_answer(query, self.memory)
+            if answer is not None:
+                return answer
         query_lower = query.lower()
         
         # Handle specific query types with custom prompts
@@ -158,43 +376,72 @@ Answer:"""
         if not self.context_data.get('projects'):
             return "I have several exciting projects! Check out my GitHub for the latest work."
             
-        projects = self.context_data['projects'][:3]  # Top 3 projects
-        project_names = [p.get('name', 'Project') for p in projects if isinstance(p, dict)]
+        # The projects most relevant to the question, else the first few
+        projects = [snippet.item for snippet in self.retrieve(query, k=3, kinds={'project'})]
+        projects = projects or self.context_data['projects'][:3]
+        project_names = [p.get('name', 'Project') if isinstance(p, dict) else str(p) for p in projects]
         
         prompt = f"I've worked on projects like {', '.join(project_names)}. {query}"
-        return self.generate_response(prompt, max_length=120)
+        return self.generate_response(prompt, max_new_tokens=120)
         
     def generate_skill_response(self, query):
         """Generate skill-focused response"""
         if not self.context_data.get('skills'):
             return "I have experience with various programming languages and technologies."
             
-        skills = ', '.join(self.context_data['skills'][:6])
+        relevant = [snippet.item for snippet in self.retrieve(query, k=6, kinds={'skill'})]
+        skills = ', '.join(relevant or self.context_data['skills'][:6])
         prompt = f"My technical skills include {skills}. {query}"
-        return self.generate_response(prompt, max_length=100)
+        return self.generate_response(prompt, max_new_tokens=100)
         
     def generate_experience_response(self, query):
         """Generate experience-focused response"""
         if not self.context_data.get('experience'):
             return "I have professional experience in software development and engineering."
             
-        experience = self.context_data['experience'][0]  # Most recent experience
-        role = experience.get('role', 'Developer')
-        company = experience.get('company', 'a tech company')
-        
-        prompt = f"I worked as {role} at {company}. {query}"
-        return self.generate_response(prompt, max_length=120)
+        matches = self.retrieve(query, k=1, kinds={'experience'})
+        # Most relevant experience, else the most recent one
+        experience = matches[0].item if matches else self.context_data['experience'][0]
+        if isinstance(experience, dict):
+            role = experience.get('role', 'Developer')
+            company = experience.get('company', 'a tech company')
+            prompt = f"I worked as {role} at {company}. {query}"
+        else:
+            prompt = f"I worked as {experience}. {query}"
+        return self.generate_response(prompt, max_new_tokens=120)
         
     def is_available(self):
         """Check if AI functionality is available"""
         return self.chatbot is not None
         
+    def close(self):
+        """Release the shared model; it is unloaded once nobody else uses it"""
+        if self.batcher is not None:
+            self.batcher.close()
+        if self.chatbot is not None:
+            get_registry().release(self.chatbot)
+        self.chatbot = None
+        self.batcher = None
+        self.prefix_cache = None
+        
     def get_model_info(self):
         """Get information about the loaded model"""
         if not self.chatbot:
             return "No AI model loaded"
             
-        return f"Using {self.model_name} for AI responses"
+        stats = self.batcher.stats()
+        cache = self.cache.stats()
+        backend = getattr(self.chatbot, 'backend', 'fp32')
+        info = (f"Using {self.model_name} ({backend}) for AI responses "
+                f"({stats['requests']} requests in {stats['batches']} batches, "
+                f"{stats['requests_per_second']} req/s; "
+                f"cache {cache['hits']} hits / {cache['misses']} misses")
+        if self.prefix_cache is not None:
+            prefix = self.prefix_cache.stats()
+            info += f"; cached prefix reused {prefix['hits']} times"
+        memory = self.memory.stats()
+        info += f"; remembering {memory['turns']} turns in {memory['tokens']}/{memory['budget']} tokens"
+        return info + ")"
 
 # Utility functions for the main assistant
 def create_ai_chat(model_name="gpt2"):
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Precomputed Answers
+Answers the common recruiter questions from a table built offline
+
+Most AI questions are the same handful (where are you based, when do you
+graduate, what do your projects use), and their answers follow from
+data.json. Each curated question names the fields its answer depends on;
+the build step answers it once, from a template or with AIChat, and
+stores the answer with a digest of those fields. Rebuilding redoes only
+the questions whose fields changed. At runtime a question is matched to
+the nearest curated one (the intent classifier's n-gram TF-IDF) before
+any model is loaded.
+
+Usage:
+    python src/answers.py                    # templated answers only
+    python src/answers.py --model gpt2       # plus AIChat answers
+
+Author: SSV
+Date: October 2026
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+from config import get_setting
+from datastore import DEFAULT_DATA_PATH, get_store
+from intents import IntentClassifier
+
+# Bump when the table layout changes; older tables are ignored
+TABLE_FORMAT = 2
+
+
+class Question:
+    """A curated question: its phrasings, the fields its answer uses, and
+    a template that answers it from the data (None: ask the model)"""
+
+    __slots__ = ("key", "phrasings", "fields", "template")
+
+    def __init__(self, key, phrasings, fields, template=None):
+        self.key = key
+        self.phrasings = tuple(phrasings)
+        self.fields = frozenset(fields)
+        self.template = template
+
+
+def _join(items):
+    items = list(items)
+    if len(items) < 2:
+        return "".join(items)
+    return f"{', '.join(items[:-1])} and {items[-1]}"
+
+
+def _projects(data):
+    return [project for project in data.get('projects') or () if isinstance(project, dict)]
+
+
+def _location(data):
+    location = data.get('location')
+    return f"I'm based in {location}." if location else None
+
+
+def _graduation(data):
+    year = data.get('graduation_year')
+    if not year:
+        return None
+    answer = f"I graduate in {year}"
+    if data.get('degree'):
+        answer += f" with a degree in {data['degree']}"
+    if data.get('school'):
+        answer += f" from {data['school']}"
+    return answer + "."
+
+
+def _bio(data):
+    bio = data.get('bio')
+    if not bio:
+        return None
+    if data.get('name') and data.get('title'):
+        return f"I'm {data['name']}, {data['title']}. {bio}"
+    return bio
+
+
+def _skills(data):
+    skills = [skill for skill in data.get('skills') or () if isinstance(skill, str)]
+    if not skills:
+        return None
+    if len(skills) > 8:
+        return f"My main skills are {_join(skills[:8])}, among {len(skills)} in total."
+    return f"My main skills are {_join(skills)}."
+
+
+def _project_tech(data):
+    counts = Counter(tech for project in _projects(data) for tech in project.get('tech') or ())
+    if not counts:
+        return None
+    used = [f"{tech} ({n} projects)" if n > 1 else tech for tech, n in counts.most_common()]
+    return f"Across my projects I've used {_join(used)}."
+
+
+def _projects_using(tech):
+    def template(data):
+        names = [project.get('name', 'a project') for project in _projects(data)
+                 if tech in (project.get('tech') or ())]
+        return f"I used {tech} in {_join(names)}." if names else None
+    return template
+
+
+# The curated set; extend it here, or at build time with --questions FILE
+QUESTIONS = (
+    Question('location', ("where are you based", "where are you located", "where do you live",
+                          "which city are you in", "where are you from"), {'location'}, _location),
+    Question('graduation', ("when do you graduate", "what is your graduation year",
+                            "when will you finish your degree", "what year do you graduate"),
+             {'graduation_year', 'degree', 'school'}, _graduation),
+    Question('bio', ("tell me about yourself", "introduce yourself", "describe yourself",
+                     "give me your elevator pitch"), {'bio', 'name', 'title'}, _bio),
+    Question('skills', ("what are your skills", "what are your main skills", "what are your strengths"),
+             {'skills'}, _skills),
+    Question('project_tech', ("what technologies do your projects use", "what tech stack do you use",
+                              "which technologies have you built projects with"), {'projects'}, _project_tech),
+    Question('hire', ("why should we hire you", "why are you a good fit",
+                      "what makes you a strong candidate"), {'bio', 'skills', 'experience'}),
+    Question('goals', ("what are your career goals", "where do you see yourself in five years",
+                       "what kind of role are you looking for"), {'bio', 'interests'}),
+)
+
+
+def questions_for(data, extra=()):
+    """The curated questions plus one per technology used in the projects"""
+    questions = list(QUESTIONS) + list(extra)
+    techs = dict.fromkeys(tech for project in _projects(data) for tech in project.get('tech') or ())
+    for tech in techs:
+        name = tech.lower()
+        questions.append(Question(f"tech:{name}", (f"which projects use {name}", f"have you used {name}",
+                                                   f"projects with {name}"),
+                                  {'projects'}, _projects_using(tech)))
+    return questions
+
+
+def _mentions(query, name):
+    """True if the query names `name` as a whole word (c, c++ and node.js included)"""
+    return re.search(rf"(?<!\w){re.escape(name)}(?!\w)", query.lower()) is not None
+
+
+def load_questions(path):
+    """Extra questions from a JSON list of {key, phrasings, fields}; the model answers them"""
+    with open(path, encoding='utf-8') as file:
+        entries = json.load(file)
+    return [Question(entry['key'], entry['phrasings'], entry.get('fields', ())) for entry in entries]
+
+
+def field_digest(data, question):
+    """Hash of everything the question's answer is derived from"""
+    values = [question.phrasings[0]] + [[field, data.get(field)] for field in sorted(question.fields)]
+    encoded = json.dumps(values, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+
+def default_table_path(data_path=DEFAULT_DATA_PATH):
+    """data.json -> data.answers.json.gz, next to it"""
+    data_path = Path(data_path)
+    return data_path.with_name(f"{data_path.stem}.answers.json.gz")
+
+
+class AnswerTable:
+    """Question key -> (phrasings, fields, digest, source, answer), matched by nearest phrasing.
+
+    `source` is 'template' or the model that wrote the answer. Keeping the
+    fields lets questions added at build time be checked and served without
+    the file they came from. Questions
+    nobody could answer yet stay in the table with answer None, so a query
+    closest to one of them goes to the model instead of to the next best
+    answered question. On disk the table is gzipped JSON, one short row
+    per question.
+    """
+
+    def __init__(self, entries=None, threshold=None):
+        self.entries = dict(entries or {})
+        self.threshold = get_setting("answer_threshold") if threshold is None else threshold
+        self._classifier = None
+
+    def __len__(self):
+        """Number of questions with an answer"""
+        return sum(1 for entry in self.entries.values() if entry[4] is not None)
+
+    def answer(self, key):
+        entry = self.entries.get(key)
+        return entry[4] if entry else None
+
+    def lookup(self, query):
+        """Return (key, answer) for the nearest curated question, or None"""
+        if not self.entries:
+            return None
+        if self._classifier is None:
+            self._classifier = IntentClassifier({key: entry[0] for key, entry in self.entries.items()},
+                                                threshold=self.threshold)
+        match = self._classifier.classify(query)
+        if match is None or self.entries[match[0]][4] is None:
+            return None
+        if match[0].startswith("tech:") and not _mentions(query, match[0][len("tech:"):]):
+            # "have you used java" is near "have you used python" but asks about Java
+            return None
+        return match[0], self.entries[match[0]][4]
+
+    @classmethod
+    def load(cls, path, threshold=None):
+        """Read a saved table; None if it is missing, unreadable or from another format"""
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as file:
+                stored = json.load(file)
+        except (OSError, EOFError, ValueError):
+            return None
+        if not isinstance(stored, dict) or stored.get('format') != TABLE_FORMAT:
+            return None
+        entries = {key: (tuple(phrasings), tuple(fields), digest, source, answer)
+                   for key, (phrasings, fields, digest, source, answer) in stored['entries'].items()}
+        return cls(entries, threshold)
+
+    def save(self, path):
+        path = Path(path)
+        stored = {'format': TABLE_FORMAT,
+                  'entries': {key: list(entry) for key, entry in sorted(self.entries.items())}}
+        encoded = json.dumps(stored, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        fd, temp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, 'wb') as file:
+            # mtime=0 keeps rebuilds of unchanged data byte-identical
+            file.write(gzip.compress(encoded, mtime=0))
+        # mkstemp files are private; the table ships alongside data.json
+        os.chmod(temp, 0o644)
+        os.replace(temp, path)
+
+
+def build_table(data, questions=None, generate=None, source=None, previous=None, threshold=None):
+    """Answer every question whose fields changed since `previous`.
+
+    Templated questions are answered from the data; the rest only with
+    `generate(question)` (labelled `source`), and otherwise keep their
+    previous answer while it is still current. Questions only `previous`
+    has (added earlier with --questions) are kept on the same terms; the
+    per-technology ones are not, as they follow the projects. Returns
+    (table, rebuilt keys).
+    """
+    if questions is None:
+        questions = questions_for(data)
+    old = previous.entries if previous is not None else {}
+    asked = {question.key for question in questions}
+    questions = list(questions) + [Question(key, entry[0], entry[1]) for key, entry in old.items()
+                                   if key not in asked and not key.startswith("tech:")]
+    entries = {}
+    rebuilt = []
+    for question in questions:
+        digest = field_digest(data, question)
+        fields = tuple(sorted(question.fields))
+        kept = old.get(question.key)
+        if (kept is not None and kept[2] == digest and kept[4] is not None
+                and (question.template or generate is None or kept[3] == source)):
+            entries[question.key] = (question.phrasings, fields, digest, kept[3], kept[4])
+            continue
+        answer, by = None, None
+        if question.template is not None:
+            answer, by = question.template(data), 'template'
+        elif generate is not None:
+            answer, by = generate(question.phrasings[0]), source
+        if answer:
+            entries[question.key] = (question.phrasings, fields, digest, by, answer)
+            rebuilt.append(question.key)
+        else:
+            entries[question.key] = (question.phrasings, fields, digest, None, None)
+    return AnswerTable(entries, threshold), rebuilt
+
+
+class PrecomputedAnswers:
+    """Runtime view of a data store's answer table.
+
+    The saved table is read once; whenever the store's data changes the
+    table is rebuilt in memory without a model, so templated answers
+    follow the data and model-written answers are kept only while the
+    fields they were written from are unchanged.
+    """
+
+    def __init__(self, store, path=None, threshold=None):
+        self.store = store
+        self.path = Path(path) if path else default_table_path(store.path)
+        self.threshold = threshold
+        self._table = None
+        self._version = None
+        self.hits = 0
+        self.misses = 0
+
+    def table(self):
+        snapshot = self.store.snapshot
+        if self._version != snapshot.version:
+            previous = self._table
+            if previous is None:
+                previous = AnswerTable.load(self.path, self.threshold)
+            self._table = build_table(snapshot.data, previous=previous, threshold=self.threshold)[0]
+            self._version = snapshot.version
+        return self._table
+
+    def lookup(self, query):
+        """Return the precomputed answer for the nearest curated question, or None"""
+        match = self.table().lookup(query)
+        if match is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return match[1]
+
+    def stats(self):
+        return {"answers": len(self.table()), "hits": self.hits, "misses": self.misses}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="answers", description="Build the precomputed answer table")
+    parser.add_argument("--data", default=str(DEFAULT_DATA_PATH), help="portfolio file to answer from")
+    parser.add_argument("--output", help="table path (default: next to the data file)")
+    parser.add_argument("--model", help="also answer the non-templated questions with this AIChat model")
+    parser.add_argument("--questions", help="JSON file of extra questions for the model to answer")
+    parser.add_argument("--full", action="store_true", help="rebuild every answer, not just the stale ones")
+    args = parser.parse_args(argv)
+
+    store = get_store(args.data)
+    data = store.ensure_loaded().data
+    output = Path(args.output) if args.output else default_table_path(args.data)
+    extra = load_questions(args.questions) if args.questions else ()
+    previous = None if args.full else AnswerTable.load(output)
+
+    generate = None
+    if args.model:
+        from ai_chat import AIChat
+        from memory import ConversationMemory
+
+        chat = AIChat(args.model, deterministic=True)
+        # Answer from the file being built for, not the default data.json
+        chat.store = store
+        if not chat.is_available():
+            print(f"❌ Could not load {args.model}; only templated answers will be built")
+        else:
+            def generate(question):
+                # Every question is answered on its own, without history
+                answer = chat.generate_response(question, memory=ConversationMemory(budget=0))
+                # Failures and non-answers are left for the model at runtime
+                return None if answer.startswith(("🤖", "🤔")) else answer
+
+    table, rebuilt = build_table(data, questions_for(data, extra), generate, args.model, previous)
+    table.save(output)
+    print(f"✅ {len(table)} of {len(table.entries)} questions answered "
+          f"({len(rebuilt)} rebuilt, {len(table) - len(rebuilt)} reused) -> {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
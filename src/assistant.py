@@ -7,52 +7,282 @@ Author: SSV
 Date: June 2025
 """
 
+import functools
 import json
 import os
 import random
+import re
 import sys
-import subprocess
-from pathlib import Path
-from colorama import Fore, Style
+import threading
+import time
 
-def auto_install(package):
-    try:
-        __import__(package)
-    except ImportError:
-        print(f"🔄 Installing missing package: {package}")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+from datastore import DEFAULT_DATA_PATH, get_store
+from config import get_setting
+from deps import Fore, Style, OPTIONAL_PACKAGES, check_dependencies, is_available
+from intents import INTENT_EXAMPLES, IntentClassifier
+from memory import ConversationMemory, estimate_tokens, is_follow_up
+from metrics import add_metrics_arguments, configure_metrics, count_tokens, get_metrics
+from models import get_registry
+from portfolio import PAGE_SIZES, paginate, parse_listing_query
+from router import FuzzyIndex, KeywordRouter
+from streaming import StreamCleaner, stream_pipeline
+
+# Optional packages are never installed at runtime; they are only looked up
+# here and imported on first use, with built-in fallbacks when missing
+JOKES_AVAILABLE = is_available("pyjokes")
+
+# Optional AI integration: transformers (and the model) load on the first 'ai:' query
+AI_AVAILABLE = is_available("transformers")
+
+# Request timings and counters; every call site is a no-op while disabled
+metrics = get_metrics()
+
+# Command aliases in priority order: when a query contains several of them,
+# the one listed first wins regardless of where it appears in the text.
+COMMAND_ALIASES = (
+    ('resume', 'get_resume_info'),
+    ('cv', 'get_resume_info'),
+    ('school', 'get_education_info'),
+    ('education', 'get_education_info'),
+    ('university', 'get_education_info'),
+    ('projects', 'get_projects_info'),
+    ('work', 'get_projects_info'),
+    ('skills', 'get_skills_info'),
+    ('tech', 'get_skills_info'),
+    ('contact', 'get_contact_info'),
+    ('email', 'get_contact_info'),
+    ('social', 'get_contact_info'),
+    ('certifications', 'get_certifications_info'),
+    ('certificates', 'get_certifications_info'),
+    ('experience', 'get_experience_info'),
+    ('job', 'get_experience_info'),
+    ('joke', 'get_joke'),
+    ('funny', 'get_joke'),
+    ('help', 'get_help'),
+    ('commands', 'get_help'),
+    ('about', 'get_about_info'),
+    ('info', 'get_about_info'),
+    ('stats', 'get_stats'),
+    ('metrics', 'get_stats'),
+)
+
+# Handlers whose lists are paged ('projects page 2'), and those that can
+# also be filtered by technology or tag ('projects using python')
+LISTING_HANDLERS = frozenset({
+    'get_projects_info', 'get_skills_info', 'get_certifications_info', 'get_experience_info',
+})
+FILTERABLE_HANDLERS = frozenset({'get_projects_info'})
+PAGE_PATTERN = re.compile(r"page\s+(\d+)")
+NEXT_PAGE_WORDS = frozenset({'next', 'more', 'next page'})
+
+# Section handler name -> data.json keys its rendered text depends on
+SECTION_FIELDS = {}
+
+def cached_section(*fields):
+    """Cache a section's rendered text until one of its data fields changes"""
+    def decorator(render):
+        name = render.__name__
+        SECTION_FIELDS[name] = frozenset(fields)
+
+        @functools.wraps(render)
+        def wrapper(self, *options):
+            if options:
+                # Later pages and filtered views are cheap slices of the
+                # indexed model; only the default view is cached, which
+                # keeps the cache bounded whatever visitors type
+                return render(self, *options)
+            cache = self._section_cache
+            text = cache.get(name)
+            if metrics.enabled:
+                metrics.inc("section_cache_total", section=name, result="hit" if text is not None else "miss")
+                if text is None:
+                    with metrics.timer("render_seconds", section=name):
+                        text = cache[name] = render(self)
+            elif text is None:
+                text = cache[name] = render(self)
+            return text
+        return wrapper
+    return decorator
+
+class AIEngine:
+    """A model pipeline and its micro-batcher, loaded on first use.
+
+    Each assistant gets its own engine by default; hosting several
+    portfolios, one engine is passed to all of them so every tenant's
+    questions go through the same model and the same batches.
+
+    With ai_worker_processes set, the model lives in a WorkerPool of
+    separate processes instead, and `pool` stands in for the pipeline.
+    Otherwise `prefix_cache` (if enabled) keeps each conversation's
+    history prefilled between its turns. The AI answer cache belongs to
+    the engine too, so tenants share one bounded cache (and one sqlite
+    connection), kept apart by their cache namespaces.
+    """
+
+    def __init__(self, model_name):
+        self.model_name = model_name
+        self.pipe = None
+        self.batcher = None
+        self.pool = None
+        self.prefix_cache = None
+        self._cache = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self):
+        """Cache of AI answers, opened on the first AI question.
 
-auto_install("colorama")
-auto_install("pyjokes")
+        Phi-2 decodes greedily by default, so repeated questions can be cached.
+        """
+        if self._cache is None:
+            with self._lock:
+                if self._cache is None:
+                    from ai_cache import ResponseCache
 
-import pyjokes
+                    self._cache = ResponseCache()
+        return self._cache
 
-# Optional AI integration
-try:
-    from transformers import pipeline
-    AI_AVAILABLE = True
-    print(f"{Fore.GREEN}🧠 AI mode available! Use 'ai: your question' for smart responses{Style.RESET_ALL}")
-except ImportError:
-    AI_AVAILABLE = False
+    def load(self):
+        """Return the pipeline (or worker pool), building it at most once (None if unavailable)"""
+        if self._loaded:
+            return self.pipe
+        with self._lock:
+            if self._loaded:
+                return self.pipe
+            # The AI-only modules are imported here, keeping startup fast
+            if AI_AVAILABLE and get_setting("ai_worker_processes") > 0:
+                from workers import WorkerPool, pipeline_worker
+
+                self.pool = WorkerPool(pipeline_worker, (self.model_name,))
+                # Workers load the model in the background from here on
+                self.pool.start()
+                self.pipe = self.pool
+            elif AI_AVAILABLE:
+                try:
+                    # Shared with any AIChat (or other engine) using the same model
+                    from batching import MicroBatcher, pipeline_generate
+                    from prefix_cache import PrefixCache, prefix_generate
+
+                    self.pipe = get_registry().acquire(self.model_name, max_new_tokens=150, truncation=True)
+                    if get_setting("ai_prefix_cache"):
+                        self.prefix_cache = PrefixCache(self.pipe)
+                        self.batcher = MicroBatcher(prefix_generate(self.pipe, self.prefix_cache))
+                    else:
+                        self.batcher = MicroBatcher(pipeline_generate(self.pipe))
+                except Exception as e:
+                    print(f"{Fore.YELLOW}⚠️  AI setup failed: {e}{Style.RESET_ALL}")
+                    self.pipe = None
+            self._loaded = True
+        return self.pipe
+
+    def close(self):
+        """Release the model and answer cache (both are opened again on next use)"""
+        with self._lock:
+            if self._cache is not None:
+                self._cache.close()
+                self._cache = None
+            if self.pool is not None:
+                self.pool.close()
+            if self.batcher is not None:
+                self.batcher.close()
+            if self.pipe is not None and self.pool is None:
+                get_registry().release(self.pipe)
+            self.pipe = None
+            self.batcher = None
+            self.pool = None
+            self.prefix_cache = None
+            self._loaded = False
+
+class Route:
+    """How one input will be answered, decided once and carried along.
+
+    `handler` is a section handler, 'ai' or 'default', and `query` the
+    normalised text it answers ('ai:' stripped). `typo` is (typed, alias)
+    for a corrected command; `page` and `term` continue the last listing.
+    """
+
+    __slots__ = ("handler", "query", "typo", "page", "term")
+
+    def __init__(self, handler, query, typo=None, page=None, term=None):
+        self.handler = handler
+        self.query = query
+        self.typo = typo
+        self.page = page
+        self.term = term
+
+    def __repr__(self):
+        return f"Route({self.handler!r}, {self.query!r})"
 
 class PortfolioAssistant:
-    def __init__(self):
+    # Compiled once and shared by every instance
+    router = KeywordRouter(COMMAND_ALIASES)
+    # Typo-tolerant alias lookup ('skils'); words from the intent examples
+    # are real words, so they are never "corrected"
+    spelling = FuzzyIndex(COMMAND_ALIASES, ignore={
+        word for phrases in INTENT_EXAMPLES.values() for phrase in phrases for word in phrase.split()
+    })
+    # Free-text fallback for questions without a command word (built on first use)
+    intents = IntentClassifier()
+    # Use Microsoft's Phi-2 model for better Q&A
+    ai_model_name = "microsoft/phi-2"
+    _answers = None
+
+    def __init__(self, warm_ai=False, banner=True, data_path=DEFAULT_DATA_PATH, ai_engine=None):
+        # Conversation state for the local (single-visitor) session
+        self.session = {}
+        self.data_path = data_path
         self.load_data()
-        self.setup_ai()
-        self.show_banner()
+        self.setup_ai(ai_engine)
+        if banner:
+            self.show_banner()
+        if warm_ai:
+            self.warm_ai()
         
+    @property
+    def data(self):
+        """Portfolio data currently being served"""
+        return self.store.data
+
+    @data.setter
+    def data(self, value):
+        self.store.replace(value)
+
+    @property
+    def data_version(self):
+        """Version of the data snapshot, bumped on every reload or update"""
+        return self.store.version
+
     def load_data(self):
         """Load personal data from JSON file"""
+        self._section_cache = {}
+        self.store = get_store(self.data_path)
+        self.store.subscribe(self.on_data_change)
+        self._answers = None
         try:
-            data_path = Path(__file__).parent / "data.json"
-            with open(data_path, 'r', encoding='utf-8') as file:
-                self.data = json.load(file)
+            self.store.ensure_loaded()
         except FileNotFoundError:
-            print(f"{Fore.RED}❌ data.json not found! Creating a sample file...{Style.RESET_ALL}")
+            print(f"{Fore.RED}❌ data.json not found! Showing sample data instead.{Style.RESET_ALL}")
+            self.create_sample_data()
+        except ValueError as e:
+            # Keep running on sample data; the watcher picks up a fixed file
+            print(f"{Fore.RED}❌ {e}{Style.RESET_ALL}")
             self.create_sample_data()
+
+    def on_data_change(self, changed, snapshot):
+        """Drop only the cached sections that depend on the changed keys"""
+        stale = [name for name, fields in SECTION_FIELDS.items() if fields & changed]
+        if stale:
+            # Copy-on-write, so a render racing with the update can't put
+            # text built from the old data into the new cache
+            cache = dict(self._section_cache)
+            for name in stale:
+                cache.pop(name, None)
+            self._section_cache = cache
+        # AI answers are keyed by the data's fingerprint, so they need no clearing
             
-    def create_sample_data(self):
-        """Create sample data file"""
+    def create_sample_data(self, path=None):
+        """Serve sample data, writing it to `path` as a starting point if given"""
         sample_data = {
             "name": "Your Name",
             "title": "AI Engineer & Developer",
@@ -81,27 +311,69 @@ class PortfolioAssistant:
             ]
         }
         
-        data_path = Path(__file__).parent / "data.json"
-        with open(data_path, 'w', encoding='utf-8') as file:
-            json.dump(sample_data, file, indent=2)
+        if path is not None:
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(sample_data, file, indent=2)
         self.data = sample_data
         
-    def setup_ai(self):
-        """Initialize AI chatbot if available"""
-        if AI_AVAILABLE:
-            try:
-                # Use Microsoft's Phi-2 model for better Q&A
-                self.ai_chatbot = pipeline(
-                    "text-generation",
-                    model="microsoft/phi-2",
-                    max_length=150,
-                    truncation=True
-                )
-            except Exception as e:
-                print(f"{Fore.YELLOW}⚠️  AI setup failed: {e}{Style.RESET_ALL}")
-                self.ai_chatbot = None
-        else:
+    def setup_ai(self, ai_engine=None):
+        """Prepare lazy AI initialization (the model loads on first use)"""
+        self.ai_chatbot = None
+        self.ai_batcher = None
+        # Assistants handed an engine (e.g. tenants) share its model and
+        # batcher and leave releasing them to its owner
+        self._owns_ai_engine = ai_engine is None
+        self.ai_engine = ai_engine or AIEngine(self.ai_model_name)
+        self._ai_loaded = False
+        self._ai_lock = threading.Lock()
+
+    @property
+    def ai_cache(self):
+        """Cache of AI answers, shared with every assistant on the same engine"""
+        return self.ai_engine.cache
+
+    @property
+    def answers(self):
+        """Common AI questions answered from the data without the model (None if disabled)"""
+        if self._answers is None and get_setting("answer_table"):
+            from answers import PrecomputedAnswers
+
+            self._answers = PrecomputedAnswers(self.store)
+        return self._answers
+
+    def load_ai(self):
+        """Import transformers and build the AI pipeline, at most once"""
+        if self._ai_loaded:
+            return self.ai_chatbot
+
+        with self._ai_lock:
+            if self._ai_loaded:
+                return self.ai_chatbot
+            self.ai_chatbot = self.ai_engine.load()
+            self.ai_batcher = self.ai_engine.batcher
+            self._ai_loaded = True
+        return self.ai_chatbot
+
+    def unload_ai(self):
+        """Release this assistant's hold on the AI model (it reloads on next use)"""
+        with self._ai_lock:
+            if self._owns_ai_engine:
+                self.ai_engine.close()
             self.ai_chatbot = None
+            self.ai_batcher = None
+            self._ai_loaded = False
+
+    def close(self):
+        """Free everything this assistant holds apart from shared state"""
+        self.unload_ai()
+
+    def warm_ai(self):
+        """Start loading the AI model in a background thread"""
+        if not AI_AVAILABLE or self._ai_loaded:
+            return None
+        thread = threading.Thread(target=self.load_ai, name="botfolio-ai-warmup", daemon=True)
+        thread.start()
+        return thread
             
     def show_banner(self):
         """Display welcome banner"""
@@ -115,163 +387,282 @@ Type 'help' for available commands or 'exit' to quit.{Style.RESET_ALL}
 
 {Fore.YELLOW}💡 Pro tip: Try 'resume', 'projects', 'skills', or 'joke'!{Style.RESET_ALL}
 """
+        if AI_AVAILABLE:
+            banner += f"\n{Fore.GREEN}🧠 AI mode available! Use 'ai: your question' for smart responses{Style.RESET_ALL}\n"
         print(banner)
         
-    def get_response(self, user_input):
-        """Generate response based on user input"""
+    def is_ai_query(self, user_input):
+        """Check whether input will be answered by the (slow) AI model"""
+        return self.route(user_input).handler == 'ai'
+
+    def route(self, user_input, session=None):
+        """Decide how input will be answered, without answering it.
+
+        Returns a Route that get_response() can be handed, so callers that
+        need the decision first (the server and batch mode keep AI answers
+        off their main thread) don't pay for routing twice.
+        """
         query = user_input.lower().strip()
+        if session is None:
+            session = self.session
+
+        # Asked for with 'ai:'; common questions are answered from the
+        # answer table, model or not
+        if query.startswith('ai:') and (AI_AVAILABLE or get_setting("answer_table")):
+            return Route('ai', query[3:].strip())
+
+        # Find matching command
+        match = self.router.match(query)
+        if match:
+            return Route(match[1], query)
+
+        # Paging through the previous listing
+        page_match = PAGE_PATTERN.fullmatch(query)
+        paging = page_match is not None or query in NEXT_PAGE_WORDS
+        last = session.get('listing')
+        if paging and last:
+            handler, page, term = last
+            return Route(handler, query, page=int(page_match.group(1)) if page_match else page + 1, term=term)
+
+        # Misspelt commands ('skils', 'projcts page 2')
+        typo = self.spelling.match(query, self.portfolio.vocabulary)
+        intent = None
+        if typo and self.spelling.correct(typo[0])[2] > 1:
+            # Two edits away may be a real word; a confident intent match wins
+            intent = self.intents.classify(query)
+            if intent:
+                typo = None
+        if typo:
+            typed, alias, handler = typo
+            return Route(handler, query, typo=(typed, alias))
+
+        # Free text like "where did you study" that names no command
+        if intent is None:
+            intent = self.intents.classify(query)
+        if metrics.enabled:
+            metrics.inc("intent_total", result="hit" if intent else "miss")
+        if intent:
+            return Route(intent[0], query)
+
+        # Questions nothing above can answer go to the model, if there is one
+        if AI_AVAILABLE and get_setting("intent_ai_fallback") and query and not paging:
+            return Route('ai', query)
+        return Route('default', query)
+
+    def get_response(self, user_input, stream=None, session=None, route=None):
+        """Generate response based on user input (`route` from route(), if already decided)"""
+        if not metrics.enabled:
+            return self.route_response(user_input, stream, session, route)[1]
+
+        started = time.perf_counter()
+        handler, response = self.route_response(user_input, stream, session, route)
+        metrics.observe("request_seconds", time.perf_counter() - started, route=handler)
+        metrics.inc("requests_total", route=handler)
+        return response
+
+    def route_response(self, user_input, stream=None, session=None, route=None):
+        """Answer input; returns (route, response) where route is the handler used.
+
+        `session` remembers the last paged listing so a bare 'page 2' or
+        'next' continues it; it defaults to this assistant's own session.
+        """
+        if session is None:
+            session = self.session
+        if route is None:
+            route = self.route(user_input, session)
+        handler, query = route.handler, route.query
+
+        # AI-powered responses (optionally streamed piece by piece)
+        if handler == 'ai':
+            return 'ai', self.ai_response(query, stream=stream, session=session)
+        if handler == 'default':
+            return 'default', self.get_default_response(query)
+        if route.page is not None:
+            return handler, self.render_listing(handler, route.page, route.term, session)
+        if route.typo:
+            # Answered as if spelt right, with the fix noted
+            typed, alias = route.typo
+            if metrics.enabled:
+                metrics.inc("spelling_corrections_total", command=alias)
+            corrected = re.sub(rf"\b{re.escape(typed)}\b", alias, query)
+            note = f"{Fore.YELLOW}🔎 Showing results for '{alias}' (you typed '{typed}'){Style.RESET_ALL}\n\n"
+            return handler, note + self.run_handler(handler, corrected, session)
+        return handler, self.run_handler(handler, query, session)
         
-        # AI-powered responses
-        if query.startswith('ai:') and self.ai_chatbot:
-            return self.ai_response(query[3:].strip())
-            
-        # Command mapping
-        responses = {
-            'resume': self.get_resume_info,
-            'cv': self.get_resume_info,
-            'school': self.get_education_info,
-            'education': self.get_education_info,
-            'university': self.get_education_info,
-            'projects': self.get_projects_info,
-            'work': self.get_projects_info,
-            'skills': self.get_skills_info,
-            'tech': self.get_skills_info,
-            'contact': self.get_contact_info,
-            'email': self.get_contact_info,
-            'social': self.get_contact_info,
-            'certifications': self.get_certifications_info,
-            'certificates': self.get_certifications_info,
-            'experience': self.get_experience_info,
-            'job': self.get_experience_info,
-            'joke': self.get_joke,
-            'funny': self.get_joke,
-            'help': self.get_help,
-            'commands': self.get_help,
-            'about': self.get_about_info,
-            'info': self.get_about_info
-        }
+    def run_handler(self, handler, query, session):
+        """Call a section handler, with paging and filters for listings"""
+        if handler not in LISTING_HANDLERS:
+            return getattr(self, handler)()
+        page, term = parse_listing_query(query)
+        if handler not in FILTERABLE_HANDLERS or term is None:
+            return self.render_listing(handler, page, None, session)
+        if self.portfolio.filters_by(term):
+            return self.render_listing(handler, page, term, session)
+        # "projects you worked on with your team" names no technology: list them all
+        response = self.render_listing(handler, page, None, session)
+        if ' ' not in term:
+            note = f"{Fore.YELLOW}🔎 No projects using '{term}' yet, so here are all of them{Style.RESET_ALL}\n\n"
+            response = note + response
+        return response
         
-        # Find matching command
-        for keyword, handler in responses.items():
-            if keyword in query:
-                return handler()
-                
-        # Default responses for unrecognized input
-        return self.get_default_response(query)
+    def render_listing(self, handler, page, term, session):
+        """Render one page of a listing command and remember it for 'next'"""
+        session['listing'] = (handler, page, term)
+        if page == 1 and term is None:
+            return getattr(self, handler)()
+        return getattr(self, handler)(page, term)
+        
+    @property
+    def portfolio(self):
+        """Typed, indexed view of the current data (built once per version)"""
+        return self.store.snapshot.portfolio
+        
+    def page_footer(self, listing, command, term=None):
+        """Tell the visitor where they are in a multi-page listing"""
+        if listing.pages <= 1:
+            return ""
+        if term:
+            command = f"{command} using {term}"
+        footer = f"\n📄 Page {listing.number} of {listing.pages} ({listing.total} total)"
+        if listing.number < listing.pages:
+            footer += f" - type '{command} page {listing.number + 1}' or 'next' for more"
+        return footer + "\n"
         
+    @cached_section('name', 'title', 'degree', 'school', 'resume_url')
     def get_resume_info(self):
         """Return resume information"""
-        # Instead of using resume_path, use your Google Drive link
-        drive_link = "https://drive.google.com/drive/folders/1pX6i1j9g70Vmc3gSqYIFTHmeTpX0HlCP?usp=sharing"
-        
-        response = f"{Fore.BLUE}📄 Resume Information:{Style.RESET_ALL}\n\n"
-        response += f"📋 {self.data.get('name', 'N/A')} - {self.data.get('title', 'Developer')}\n"
-        response += f"🎓 {self.data.get('degree', 'N/A')} from {self.data.get('school', 'N/A')}\n"
-        response += f"\n📎 View or download full resume here: {drive_link}"
-        return response
+        parts = [
+            f"{Fore.BLUE}📄 Resume Information:{Style.RESET_ALL}\n\n",
+            f"📋 {self.data.get('name', 'N/A')} - {self.data.get('title', 'Developer')}\n",
+            f"🎓 {self.data.get('degree', 'N/A')} from {self.data.get('school', 'N/A')}\n",
+        ]
+        # A shareable link (e.g. Google Drive) to the full resume
+        if self.data.get('resume_url'):
+            parts.append(f"\n📎 View or download full resume here: {self.data['resume_url']}")
+        return "".join(parts)
         
+    @cached_section('school', 'degree', 'graduation_year', 'certifications')
     def get_education_info(self):
         """Return education information"""
-        response = f"{Fore.GREEN}🎓 Education Background:{Style.RESET_ALL}\n\n"
-        response += f"🏛️  University: {self.data.get('school', 'Not specified')}\n"
-        response += f"📚 Degree: {self.data.get('degree', 'Not specified')}\n"
-        response += f"📅 Graduation: {self.data.get('graduation_year', 'Not specified')}\n"
+        parts = [
+            f"{Fore.GREEN}🎓 Education Background:{Style.RESET_ALL}\n\n",
+            f"🏛️  University: {self.data.get('school', 'Not specified')}\n",
+            f"📚 Degree: {self.data.get('degree', 'Not specified')}\n",
+            f"📅 Graduation: {self.data.get('graduation_year', 'Not specified')}\n",
+        ]
         
         if 'certifications' in self.data:
-            response += f"\n🏆 Key Certifications:\n"
-            for cert in self.data['certifications'][:3]:  # Show top 3
-                response += f"   • {cert}\n"
+            parts.append("\n🏆 Key Certifications:\n")
+            parts.extend(f"   • {cert}\n" for cert in self.data['certifications'][:3])  # Show top 3
                 
-        return response
+        return "".join(parts)
         
-    def get_projects_info(self):
-        """Return projects information"""
-        response = f"{Fore.MAGENTA}🚀 Recent Projects:{Style.RESET_ALL}\n\n"
-        
-        if 'projects' in self.data:
-            for i, project in enumerate(self.data['projects'][:5], 1):  # Show top 5
-                if isinstance(project, dict):
-                    response += f"{i}. {Fore.CYAN}{project.get('name', 'Unnamed Project')}{Style.RESET_ALL}\n"
-                    response += f"   {project.get('description', 'No description available')}\n\n"
-                else:
-                    response += f"{i}. {Fore.CYAN}{project}{Style.RESET_ALL}\n\n"
+    @cached_section('projects')
+    def get_projects_info(self, page=1, term=None):
+        """Return projects information, optionally one page or one technology"""
+        if term:
+            projects = self.portfolio.projects_matching(term)
+            parts = [f"{Fore.MAGENTA}🚀 Projects using {term.title()}:{Style.RESET_ALL}\n\n"]
+            if not projects:
+                parts.append(f"No projects using '{term}' yet. Type 'projects' to see them all!")
+                return "".join(parts)
         else:
-            response += "No projects listed yet. Update data.json to showcase your work!"
+            projects = self.portfolio.projects
+            parts = [f"{Fore.MAGENTA}🚀 Recent Projects:{Style.RESET_ALL}\n\n"]
+            if 'projects' not in self.data:
+                parts.append("No projects listed yet. Update data.json to showcase your work!")
+                return "".join(parts)
             
-        return response
+        listing = paginate(projects, page, PAGE_SIZES['projects'])
+        for i, project in enumerate(listing.items, listing.start + 1):
+            if project.description is None:
+                parts.append(f"{i}. {Fore.CYAN}{project.name}{Style.RESET_ALL}\n\n")
+            else:
+                parts.append(f"{i}. {Fore.CYAN}{project.name}{Style.RESET_ALL}\n")
+                parts.append(f"   {project.description}\n\n")
+        parts.append(self.page_footer(listing, 'projects', term))
+        return "".join(parts)
         
-    def get_skills_info(self):
+    @cached_section('skills')
+    def get_skills_info(self, page=1, term=None):
         """Return skills information"""
-        response = f"{Fore.YELLOW}💻 Technical/ Non-technical Skills:{Style.RESET_ALL}\n\n"
+        parts = [f"{Fore.YELLOW}💻 Technical/ Non-technical Skills:{Style.RESET_ALL}\n\n"]
         
         if 'skills' in self.data:
-            # Group skills nicely
-            skills = self.data['skills']
-            for i, skill in enumerate(skills):
-                response += f"🔸 {skill}"
-                if i < len(skills) - 1:
-                    response += "  "
-                if (i + 1) % 3 == 0:  # New line every 3 skills
-                    response += "\n"
-            response += "\n"
+            listing = paginate(self.portfolio.skills, page, PAGE_SIZES['skills'])
+            # Group skills nicely, three per line
+            skills = [f"🔸 {skill}" for skill in listing.items]
+            rows = ["  ".join(skills[i:i + 3]) for i in range(0, len(skills), 3)]
+            parts.append("  \n".join(rows))
+            if len(skills) % 3 == 0 and skills:
+                parts.append("\n")
+            parts.append("\n")
+            parts.append(self.page_footer(listing, 'skills'))
         else:
-            response += "Skills list not available. Update data.json!"
+            parts.append("Skills list not available. Update data.json!")
             
-        return response
+        return "".join(parts)
         
+    @cached_section('contact')
     def get_contact_info(self):
         """Return contact information"""
-        response = f"{Fore.CYAN}📧 Contact Information:{Style.RESET_ALL}\n\n"
+        parts = [f"{Fore.CYAN}📧 Contact Information:{Style.RESET_ALL}\n\n"]
         
         contact = self.data.get('contact', {})
         if contact.get('email'):
-            response += f"📧 Email: {contact['email']}\n"
+            parts.append(f"📧 Email: {contact['email']}\n")
         if contact.get('github'):
-            response += f"🐙 GitHub: {contact['github']}\n"
+            parts.append(f"🐙 GitHub: {contact['github']}\n")
         if contact.get('linkedin'):
-            response += f"💼 LinkedIn: {contact['linkedin']}\n"
+            parts.append(f"💼 LinkedIn: {contact['linkedin']}\n")
         if contact.get('portfolio'):
-            response += f"🌐 Portfolio: {contact['portfolio']}\n"
+            parts.append(f"🌐 Portfolio: {contact['portfolio']}\n")
             
         if not any(contact.values()):
-            response += "Contact info not available. Update data.json!"
+            parts.append("Contact info not available. Update data.json!")
             
-        return response
+        return "".join(parts)
         
-    def get_certifications_info(self):
+    @cached_section('certifications', 'certifications_url')
+    def get_certifications_info(self, page=1, term=None):
         """Return certifications information"""
-        response = f"{Fore.GREEN}🏆 Certifications & Achievements:{Style.RESET_ALL}\n\n"
+        parts = [f"{Fore.GREEN}🏆 Certifications & Achievements:{Style.RESET_ALL}\n\n"]
         
         if 'certifications' in self.data:
-            for i, cert in enumerate(self.data['certifications'], 1):
-                response += f"{i}. 🏅 {cert}\n"
+            listing = paginate(self.portfolio.certifications, page, PAGE_SIZES['certifications'])
+            parts.extend(f"{i}. 🏅 {cert}\n" for i, cert in enumerate(listing.items, listing.start + 1))
+            parts.append(self.page_footer(listing, 'certifications'))
         else:
-            response += "No certifications listed. Update data.json to showcase achievements!"
+            parts.append("No certifications listed. Update data.json to showcase achievements!")
     
-        # Add your LinkedIn certificates link
-        linkedin_cert_link = "https://www.linkedin.com/in/shivshakti-vashist-11042k23/details/certifications/"
-        response += f"\n🔗 View all certificates on LinkedIn: {linkedin_cert_link}"
-        return response
+        # e.g. the certifications page of your LinkedIn profile
+        if self.data.get('certifications_url'):
+            parts.append(f"\n🔗 View all certificates on LinkedIn: {self.data['certifications_url']}")
+        return "".join(parts)
         
-    def get_experience_info(self):
+    @cached_section('experience')
+    def get_experience_info(self, page=1, term=None):
         """Return work experience information"""
-        response = f"{Fore.BLUE}💼 Work Experience:{Style.RESET_ALL}\n\n"
+        parts = [f"{Fore.BLUE}💼 Work Experience:{Style.RESET_ALL}\n\n"]
         
         if 'experience' in self.data:
-            for exp in self.data['experience']:
-                if isinstance(exp, dict):
-                    response += f"🏢 {exp.get('role', 'Role')} at {exp.get('company', 'Company')}\n"
-                    response += f"📅 Duration: {exp.get('duration', 'Not specified')}\n\n"
+            listing = paginate(self.portfolio.experience, page, PAGE_SIZES['experience'])
+            for exp in listing.items:
+                if exp.company is None:
+                    parts.append(f"🏢 {exp.role}\n\n")
                 else:
-                    response += f"🏢 {exp}\n\n"
+                    parts.append(f"🏢 {exp.role} at {exp.company}\n")
+                    parts.append(f"📅 Duration: {exp.duration}\n\n")
+            parts.append(self.page_footer(listing, 'experience'))
         else:
-            response += "Work experience not listed. Update data.json!"
+            parts.append("Work experience not listed. Update data.json!")
             
-        return response
+        return "".join(parts)
         
     def get_joke(self):
         """Return a programming joke"""
         if JOKES_AVAILABLE:
+            import pyjokes
             joke = pyjokes.get_joke(language='en', category='neutral')
             return f"{Fore.YELLOW}😄 Here's a joke for you:\n\n{joke}{Style.RESET_ALL}"
         else:
@@ -285,6 +676,7 @@ Type 'help' for available commands or 'exit' to quit.{Style.RESET_ALL}
             ]
             return f"{Fore.YELLOW}😄 {random.choice(jokes)}{Style.RESET_ALL}"
             
+    @cached_section()
     def get_help(self):
         """Return help information"""
         return f"""{Fore.GREEN}📋 Available Commands:{Style.RESET_ALL}
@@ -305,10 +697,12 @@ Type 'help' for available commands or 'exit' to quit.{Style.RESET_ALL}
 {Fore.MAGENTA}🤖 Advanced:{Style.RESET_ALL}
 • ai: [question]      - AI-powered responses (if available)
 • help, commands      - Show this help menu
+• stats, metrics      - Request timings and cache statistics
 • exit, quit, bye     - Exit the assistant
 
 {Fore.GREEN}💡 Pro tip: Just type naturally! I understand variations of these commands.{Style.RESET_ALL}"""
 
+    @cached_section('name')
     def get_about_info(self):
         """Return information about the assistant"""
         return f"""{Fore.CYAN}🤖 About This Assistant:{Style.RESET_ALL}
@@ -328,23 +722,151 @@ This is an AI-powered CLI portfolio assistant built with Python with some vibe c
 {Fore.MAGENTA}Created by:{Style.RESET_ALL} {self.data.get('name', 'Developer')}
 {Fore.BLUE}GitHub:{Style.RESET_ALL} Star this project if you found it helpful! ⭐"""
 
-    def ai_response(self, query):
-        """Generate AI-powered response"""
-        if not self.ai_chatbot:
+    def ai_response(self, query, stream=None, session=None):
+        """Generate AI-powered response.
+
+        If `stream` is given it is called with each piece of the answer as
+        the model produces it; the full response is still returned. Each
+        answer is remembered in the session, so follow-up questions see
+        the conversation so far. Questions near a precomputed one are
+        answered from the answer table without loading the model. When no
+        answer can be produced the reason is left in session['ai_error'].
+        """
+        if session is None:
+            session = self.session
+        session.pop('ai_error', None)
+        memory = self.conversation(session)
+        history = memory.render()
+        # Only a question that stands on its own has one right answer to cache
+        standalone = not history or not is_follow_up(query)
+        if standalone and self.answers is not None:
+            response = self.answers.lookup(query)
+            if metrics.enabled:
+                metrics.inc("answer_table_total", result="hit" if response is not None else "miss")
+            if response is not None:
+                memory.add(query, response)
+                if stream:
+                    stream(response)
+                return f"{Fore.MAGENTA}🧠 AI Response: {response}{Style.RESET_ALL}"
+
+        if not self.load_ai():
+            session['ai_error'] = "AI mode not available"
             return f"{Fore.RED}🤖 AI mode not available. Install transformers: pip install transformers{Style.RESET_ALL}"
             
-        try:
-            prompt = f"As a portfolio assistant, answer this question professionally: {query}"
-            output = self.ai_chatbot(prompt, max_length=150, truncation=True)
-            response = output[0]['generated_text']
-        except Exception as e:
-            response = f"🤖 AI error: {e}"
+        namespace = self.cache_namespace()
+        response = self.ai_cache.get(query, namespace) if standalone else None
+        if metrics.enabled:
+            metrics.inc("ai_cache_total", result="hit" if response is not None else "miss")
+        if response is not None:
+            memory.add(query, response)
+            if stream:
+                stream(response)
+        else:
+            # Set when generation runs in worker processes
+            pool = self.ai_engine.pool
+            options = dict(max_new_tokens=150, truncation=True)
+            if pool is not None:
+                # Only the pool can be busy; in-process mode never loads workers
+                from workers import PoolBusy
+                busy = PoolBusy
+            else:
+                busy = ()
+                timeout = get_setting("ai_timeout")
+                if timeout:
+                    # Workers stop an overlong answer themselves; here generate() cuts it short
+                    options["max_time"] = timeout
+
+            try:
+                prompt = f"{history}As a portfolio assistant, answer this question professionally: {query}"
+                started = time.perf_counter()
+                prefix_cache = self.ai_engine.prefix_cache
+                if history and prefix_cache is not None:
+                    # Only the last turn is prefilled; the rest is reused
+                    prefix_cache.prepare(history, key=memory.key)
+                if stream:
+                    # The streamer skips the prompt; only leading whitespace is left to trim
+                    cleaner = StreamCleaner(max_sentences=None, artifacts=())
+
+                    def forward(chunk):
+                        text = cleaner.feed(chunk)
+                        if text:
+                            stream(text)
+
+                    if pool is not None:
+                        pool.generate(prompt, stream=forward, **options)
+                    else:
+                        for chunk in stream_pipeline(self.ai_chatbot, prompt, prefix_cache=prefix_cache,
+                                                     **options):
+                            forward(chunk)
+                    cleaner.finish()
+                    response = cleaner.text.strip()
+                elif pool is not None:
+                    response = pool.generate(prompt, **options).strip()
+                else:
+                    output = self.ai_batcher(prompt, **options)
+                    # Clean up the response
+                    response = output[0]['generated_text'].replace(prompt, "").strip()
+                elapsed = time.perf_counter() - started
+                if metrics.enabled:
+                    self.record_generation(prompt, response, elapsed, stream)
+                # An answer cut short by max_time is not worth keeping
+                if standalone and elapsed < options.get("max_time", float("inf")):
+                    self.ai_cache.put(query, response, namespace)
+                memory.add(query, response)
+            except busy:
+                session['ai_error'] = "AI busy"
+                response = "⏳ The AI is busy answering other questions. Please try again in a moment!"
+                if stream:
+                    stream(response)
+            except Exception as e:
+                session['ai_error'] = f"AI error: {e}"
+                response = f"🤖 AI error: {e}"
+                if stream:
+                    stream(response)
 
-        print("🧠 AI Response:", response)
-        # Clean up the response
-        response = response.replace(prompt, "").strip()
         return f"{Fore.MAGENTA}🧠 AI Response: {response}{Style.RESET_ALL}"
             
+    def cache_namespace(self):
+        """Everything besides the question that determines an AI answer"""
+        backend = getattr(self.ai_chatbot, 'backend', 'fp32')
+        # The data file keeps tenants apart in their engine's shared cache
+        return f"{self.ai_model_name}:{backend}:150:{self.store.path}:{self.store.snapshot.fingerprint}"
+
+    def conversation(self, session=None):
+        """Return the session's AI conversation memory, starting one if needed"""
+        if session is None:
+            session = self.session
+        memory = session.get('memory')
+        if memory is None:
+            def count(text):
+                return count_tokens(self.ai_chatbot, text) or estimate_tokens(text)
+            memory = session['memory'] = ConversationMemory(count=count)
+        return memory
+
+    def end_session(self, session):
+        """Forget a finished session's conversation and its cached history prefix"""
+        memory = session.pop('memory', None)
+        prefix_cache = self.ai_engine.prefix_cache
+        if memory is not None and prefix_cache is not None:
+            prefix_cache.forget(memory.key)
+
+    def record_generation(self, prompt, response, seconds, stream=None):
+        """Feed one AI generation's timing and token counts into the metrics"""
+        mode = "stream" if stream else "batch"
+        metrics.observe("ai_generate_seconds", seconds, model=self.ai_model_name, mode=mode)
+        metrics.inc("ai_prompt_tokens_total", count_tokens(self.ai_chatbot, prompt), model=self.ai_model_name)
+        metrics.inc("ai_generated_tokens_total", count_tokens(self.ai_chatbot, response), model=self.ai_model_name)
+
+    def get_stats(self):
+        """Return request metrics collected so far"""
+        if not metrics.enabled:
+            return (f"{Fore.YELLOW}📊 Metrics are off. Start with --metrics "
+                    f"(or BOTFOLIO_METRICS_ENABLED=1) to collect them.{Style.RESET_ALL}")
+        lines = metrics.summary()
+        if not lines:
+            return f"{Fore.CYAN}📊 No requests recorded yet.{Style.RESET_ALL}"
+        return "".join([f"{Fore.CYAN}📊 Request Metrics:{Style.RESET_ALL}\n\n", "\n".join(lines)])
+
     def get_default_response(self, query):
         """Handle unrecognized input with helpful suggestions"""
         suggestions = [
@@ -355,6 +877,16 @@ This is an AI-powered CLI portfolio assistant built with Python with some vibe c
         ]
         return f"{Fore.YELLOW}{random.choice(suggestions)}{Style.RESET_ALL}"
         
+    def interrupted_message(self, user_input, interrupt):
+        """What Ctrl-C actually stopped: only worker processes can abandon a generation"""
+        from workers import GenerationInterrupted
+
+        if isinstance(interrupt, GenerationInterrupted):
+            return "🛑 Stopped that answer."
+        if self.is_ai_query(user_input):
+            return "🛑 Stopped waiting for that answer; the model may finish it in the background."
+        return "🛑 Interrupted."
+
     def run(self):
         """Main conversation loop"""
         try:
@@ -371,23 +903,89 @@ This is an AI-powered CLI portfolio assistant built with Python with some vibe c
                 if not user_input:
                     continue
                     
-                # Generate and display response
-                response = self.get_response(user_input)
-                print(f"\n{response}")
+                # Generate and display response; AI answers appear as they're generated
+                streamed = []
+
+                def show(text):
+                    if not streamed:
+                        print(f"\n{Fore.MAGENTA}🧠 AI Response: ", end="")
+                    streamed.append(text)
+                    print(text, end="", flush=True)
+
+                try:
+                    response = self.get_response(user_input, stream=show)
+                except KeyboardInterrupt as interrupt:
+                    # Ctrl-C during an answer stops the answer, not the session
+                    print(f"{Style.RESET_ALL}\n{Fore.YELLOW}{self.interrupted_message(user_input, interrupt)}"
+                          f"{Style.RESET_ALL}")
+                    continue
+                if streamed:
+                    print(Style.RESET_ALL)
+                else:
+                    print(f"\n{response}")
                 
         except KeyboardInterrupt:
             print(f"\n\n{Fore.GREEN}👋 Goodbye! Thanks for using the Botfolio Assistant!{Style.RESET_ALL}")
         except Exception as e:
             print(f"\n{Fore.RED}❌ An error occurred: {e}{Style.RESET_ALL}")
 
-def main():
+def run_batch(source, output=None, colors=False, warm_ai=False):
+    """Non-interactive mode: JSONL answers for every query in `source` ('-' is stdin)"""
+    import contextlib
+
+    from batch import BatchRunner
+
+    out = open(output, 'w', encoding='utf-8') if output else sys.stdout
+    lines = sys.stdin if source == '-' else open(source, encoding='utf-8')
+    try:
+        # Only JSONL goes to the output; warnings and progress go to stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            assistant = PortfolioAssistant(warm_ai=warm_ai, banner=False)
+            counts = BatchRunner(assistant, colors=colors).run(lines, out)
+            print(f"✅ Answered {counts['queries']} queries "
+                  f"({counts['keyword']} keyword, {counts['ai']} AI, {counts['errors']} errors)")
+    finally:
+        if lines is not sys.stdin:
+            lines.close()
+        if out is not sys.stdout:
+            out.close()
+    return 1 if counts['errors'] else 0
+
+def main(argv=None):
     """Main entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="botfolio", description="Botfolio - AI CLI Portfolio")
+    parser.add_argument("--warm-ai", action="store_true",
+                        help="load the AI model in the background right after the banner")
+    parser.add_argument("--check-deps", action="store_true",
+                        help="report which optional packages are installed and exit")
+    parser.add_argument("--batch", nargs="?", const="-", metavar="FILE",
+                        help="answer queries from FILE (or stdin) as plain lines or JSONL, writing JSONL")
+    parser.add_argument("--output", metavar="FILE", help="write batch results to FILE instead of stdout")
+    parser.add_argument("--colors", action="store_true", help="keep terminal colour codes in batch responses")
+    add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+    configure_metrics(args)
+
+    if args.batch:
+        return run_batch(args.batch, args.output, args.colors, args.warm_ai)
+
+    if args.check_deps:
+        for package, installed in check_dependencies().items():
+            status = f"{Fore.GREEN}✅ installed    " if installed else f"{Fore.YELLOW}➖ not installed"
+            print(f"{status}{Style.RESET_ALL}  {package:<13} {OPTIONAL_PACKAGES[package]}")
+        return
+
     try:
-        assistant = PortfolioAssistant()
+        assistant = PortfolioAssistant(warm_ai=args.warm_ai)
+        # Pick up edits to data.json without restarting
+        assistant.store.watch()
         assistant.run()
     except Exception as e:
         print(f"{Fore.RED}❌ Failed to start assistant: {e}{Style.RESET_ALL}")
         print(f"{Fore.YELLOW}💡 Make sure you have the required dependencies installed: pip install -r requirements.txt{Style.RESET_ALL}")
+        return 1
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
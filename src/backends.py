@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Inference Backends
+CPU-friendly ways of loading the text-generation model, chosen through config
+
+Author: SSV
+Date: October 2026
+"""
+
+from config import get_setting
+from deps import is_available
+
+# Backend name -> what it does to the full-precision model
+BACKENDS = {
+    "fp32": "Full-precision PyTorch weights (the original behaviour)",
+    "int8": "Dynamic int8 quantization of Linear layers (smaller, faster matmuls)",
+    "compiled": "torch.compile'd forward pass (slow first call, faster after)",
+    "bettertransformer": "Fused attention kernels via optimum's BetterTransformer",
+}
+
+
+def resolve_backend(backend=None):
+    """Return a valid backend name, defaulting to the ai_backend setting"""
+    backend = (backend or get_setting("ai_backend")).strip().lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown AI backend {backend!r}; choose one of {', '.join(BACKENDS)}")
+    return backend
+
+
+def set_num_threads(num_threads=None):
+    """Pin torch's intra-op thread count (0 leaves torch's default alone)"""
+    if num_threads is None:
+        num_threads = get_setting("ai_num_threads")
+    if num_threads <= 0:
+        return None
+    import torch
+
+    torch.set_num_threads(num_threads)
+    return num_threads
+
+
+def apply_backend(model, backend):
+    """Return the model converted for the given backend.
+
+    Conversions that cannot be applied in this environment fall back to the
+    unmodified model with a warning rather than failing the whole load.
+    """
+    if backend == "fp32":
+        return model
+
+    import torch
+
+    if backend == "int8":
+        # Only nn.Linear is quantized; GPT-2's Conv1D projections stay fp32
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    if backend == "compiled":
+        if not hasattr(torch, "compile"):
+            print("⚠️  torch.compile needs PyTorch 2.0+, using fp32 weights")
+            return model
+        model.forward = torch.compile(model.forward)
+        return model
+    if backend == "bettertransformer":
+        if not is_available("optimum"):
+            print("⚠️  BetterTransformer needs optimum (pip install optimum), using fp32 weights")
+            return model
+        return model.to_bettertransformer()
+    raise ValueError(f"Unknown AI backend {backend!r}")
+
+
+def load_model(model_name, backend=None, num_threads=None):
+    """Load (model, tokenizer, backend) for CPU inference with the configured backend"""
+    from transformers import AutoModelForCausalLM, AutoTokenizer
+
+    backend = resolve_backend(backend)
+    set_num_threads(num_threads)
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    # safetensors checkpoints are memory-mapped while loading instead of
+    # being read into a second full-size buffer first
+    model = AutoModelForCausalLM.from_pretrained(model_name, low_cpu_mem_usage=True)
+    model.eval()
+    return apply_backend(model, backend), tokenizer, backend
+
+
+def build_pipeline(model, tokenizer, backend, **pipeline_kwargs):
+    """Wrap an already loaded model in a text-generation pipeline"""
+    from transformers import pipeline
+
+    pipe = pipeline("text-generation", model=model, tokenizer=tokenizer, **pipeline_kwargs)
+    pipe.backend = backend
+    return pipe
+
+
+def load_pipeline(model_name, backend=None, num_threads=None, **pipeline_kwargs):
+    """Build a private CPU text-generation pipeline using the configured backend"""
+    return build_pipeline(*load_model(model_name, backend, num_threads), **pipeline_kwargs)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Batch Query Mode
+Answers queries from stdin or a JSONL file and writes JSONL responses
+
+Input lines are either plain text queries or JSON objects such as
+{"id": "q1", "query": "skills"}; each output line is a JSON object with the
+id, query, route ("keyword" or "ai") and response, in input order; a
+query that fails (AI errors included) gets an "error" instead.
+
+Author: SSV
+Date: October 2026
+"""
+
+import json
+import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from config import get_setting
+
+_ANSI = re.compile(r"\x1b\[[0-9;]*m")
+
+
+def strip_ansi(text):
+    """Remove terminal colour codes from a response"""
+    return _ANSI.sub("", text)
+
+
+def iter_queries(lines):
+    """Yield (id, query) pairs from plain-text or JSONL input lines.
+
+    Records without an id are numbered by their line; blank lines are skipped.
+    """
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        record_id, query = number, line
+        if line[0] in '{"':
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = line
+            if isinstance(record, dict):
+                query = str(record.get("query", ""))
+                record_id = record.get("id", number)
+            elif isinstance(record, str):
+                query = record
+        yield record_id, query
+
+
+class BatchRunner:
+    """Answers a stream of queries with the AI questions kept in flight together.
+
+    Keyword queries are answered inline. AI queries are handed to a thread
+    pool so that up to `max_pending_ai` of them wait on the model at once,
+    which is what lets the micro-batcher group them into shared forward
+    passes. Output is written in input order, `chunk_size` records at a time.
+    """
+
+    def __init__(self, assistant, chunk_size=None, max_pending_ai=None, colors=False):
+        self.assistant = assistant
+        self.chunk_size = max(1, chunk_size or get_setting("batch_chunk_size"))
+        self.max_pending_ai = max(1, max_pending_ai or get_setting("batch_max_pending_ai"))
+        self.colors = colors
+        self.counts = {"queries": 0, "keyword": 0, "ai": 0, "errors": 0}
+
+    def _answer(self, query, route, session):
+        try:
+            response = self.assistant.get_response(query, session=session, route=route)
+        except Exception as e:
+            return None, str(e)
+        finally:
+            self.assistant.end_session(session)
+        # A failed AI answer still comes back as text; it is an error record
+        error = session.get('ai_error')
+        return (None, error) if error else (response, None)
+
+    def _record(self, record_id, query, route, result):
+        if isinstance(result, Future):
+            result = result.result()
+        response, error = result
+        record = {"id": record_id, "query": query, "route": route}
+        if error is None:
+            record["response"] = response if self.colors else strip_ansi(response)
+        else:
+            record["error"] = error
+            self.counts["errors"] += 1
+        return json.dumps(record, ensure_ascii=False) + "\n"
+
+    def run(self, lines, out):
+        """Answer every query in `lines`, writing JSONL to `out`; returns counts"""
+        pending = deque()
+        buffer = []
+        ai_in_flight = 0
+        with ThreadPoolExecutor(max_workers=self.max_pending_ai, thread_name_prefix="botfolio-batch") as executor:
+            for record_id, query in iter_queries(lines):
+                self.counts["queries"] += 1
+                # Records are independent questions: none sees another's conversation
+                session = {}
+                decided = self.assistant.route(query, session)
+                if decided.handler == "ai":
+                    route = "ai"
+                    result = executor.submit(self._answer, query, decided, session)
+                    ai_in_flight += 1
+                else:
+                    route = "keyword"
+                    result = self._answer(query, decided, session)
+                self.counts[route] += 1
+                pending.append((record_id, query, route, result))
+
+                # Emit everything ready at the head; block on the oldest AI
+                # answer only once the window of outstanding ones is full
+                while pending:
+                    head = pending[0][3]
+                    if isinstance(head, Future):
+                        if not head.done() and ai_in_flight < self.max_pending_ai:
+                            break
+                        ai_in_flight -= 1
+                    buffer.append(self._record(*pending.popleft()))
+                    if len(buffer) >= self.chunk_size:
+                        self._flush(buffer, out)
+
+            while pending:
+                buffer.append(self._record(*pending.popleft()))
+                if len(buffer) >= self.chunk_size:
+                    self._flush(buffer, out)
+        self._flush(buffer, out)
+        return dict(self.counts)
+
+    @staticmethod
+    def _flush(buffer, out):
+        if buffer:
+            out.write("".join(buffer))
+            out.flush()
+            buffer.clear()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Micro-batching
+Groups concurrent AI prompts into a single batched generate call
+
+Author: SSV
+Date: October 2026
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from config import get_setting
+from stopping import apply_sentence_budget
+
+
+class MicroBatcher:
+    """Queue in front of a batched generate function.
+
+    Prompts submitted within `max_wait_ms` of each other (up to
+    `max_batch_size` of them) run as one forward pass; each caller gets a
+    future resolving to exactly what an unbatched call would have returned.
+    Prompts with different generation options are never mixed in a batch.
+    """
+
+    def __init__(self, generate, max_batch_size=None, max_wait_ms=None):
+        self.generate = generate
+        self.max_batch_size = max(1, max_batch_size or get_setting("ai_batch_size"))
+        if max_wait_ms is None:
+            max_wait_ms = get_setting("ai_batch_wait_ms")
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue = queue.Queue()
+        self._worker = None
+        # Guards _closed, the worker and the queue's order: nothing is ever
+        # queued behind the stop sentinel, so every accepted prompt is answered
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self.requests = 0
+        self.batches = 0
+        self.busy_seconds = 0.0
+
+    def submit(self, prompt, **kwargs):
+        """Queue a prompt and return a Future for its generation output"""
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("batcher is closed")
+            self._queue.put((prompt, kwargs, future))
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="botfolio-ai-batcher", daemon=True)
+                self._worker.start()
+        return future
+
+    def __call__(self, prompt, **kwargs):
+        """Blocking convenience wrapper around submit()"""
+        return self.submit(prompt, **kwargs).result()
+
+    def _collect(self):
+        """Block for one request, then gather more until the window closes"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            stop = any(item is None for item in batch)
+            batch = [item for item in batch if item is not None]
+            try:
+                self._dispatch(batch)
+            except Exception as e:
+                # Whatever went wrong, no caller is left waiting and the worker keeps going
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            if stop:
+                return
+
+    def _dispatch(self, batch):
+        groups = {}
+        for prompt, kwargs, future in batch:
+            if not future.set_running_or_notify_cancel():
+                continue
+            key = tuple(sorted(kwargs.items()))
+            try:
+                hash(key)
+            except TypeError as e:
+                # Options must be hashable to be grouped; only this prompt fails
+                future.set_exception(e)
+                continue
+            groups.setdefault(key, []).append((prompt, future))
+
+        for key, items in groups.items():
+            prompts = [prompt for prompt, _ in items]
+            started = time.perf_counter()
+            try:
+                outputs = self.generate(prompts, **dict(key))
+                if len(outputs) != len(items):
+                    raise RuntimeError(f"generate returned {len(outputs)} outputs for {len(items)} prompts")
+            except Exception as e:
+                for _, future in items:
+                    future.set_exception(e)
+                continue
+            finally:
+                self.busy_seconds += time.perf_counter() - started
+                self.batches += 1
+                self.requests += len(items)
+            for (_, future), output in zip(items, outputs):
+                future.set_result(output)
+
+    def stats(self):
+        """Return request/batch counters and throughput"""
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "avg_batch_size": round(self.requests / self.batches, 2) if self.batches else 0.0,
+            "requests_per_second": round(self.requests / self.busy_seconds, 2) if self.busy_seconds else 0.0,
+        }
+
+    def close(self):
+        """Finish queued work and stop the worker thread"""
+        with self._lock:
+            stopping = not self._closed
+            self._closed = True
+            worker = self._worker
+            if worker is not None and stopping:
+                self._queue.put(None)
+        if worker is not None:
+            worker.join()
+
+
+def pipeline_generate(pipe):
+    """Adapt a transformers text-generation pipeline for MicroBatcher"""
+    tokenizer = getattr(pipe, "tokenizer", None)
+    if tokenizer is not None and tokenizer.pad_token is None:
+        # Decoder-only models need a pad token and left padding to batch
+        tokenizer.pad_token = tokenizer.eos_token
+        tokenizer.padding_side = "left"
+
+    def generate(prompts, **kwargs):
+        # Stopping criteria are built per batch; requests only carry the
+        # hashable max_sentences option so they can still share a batch
+        kwargs = apply_sentence_budget(pipe, kwargs)
+        return pipe(prompts, batch_size=len(prompts), **kwargs)
+    return generate
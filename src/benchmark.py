@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite
+Machine-readable timings for startup, routing, rendering and AI latency
+
+Results are written as one JSON document (see --output) so runs from two
+commits can be compared with --compare; every result carries `seconds`,
+the time of one operation, which is what comparisons look at. Each AI
+backend is measured in a fresh Python process so load times and RSS are
+not skewed by whatever an earlier backend left behind.
+
+Author: SSV
+Date: October 2026
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import string
+import subprocess
+import sys
+import time
+import timeit
+
+from deps import is_available
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+SUITES = ("startup", "routing", "render", "answers", "ai", "prefix", "backends")
+DEFAULT_SIZES = (10, 100, 1000, 5000)
+
+PROMPT = "You are a software developer. Answer the following question about your background:\n\nQuestion: What projects have you built?\n\nAnswer:"
+QUESTIONS = (
+    "What programming languages do you know?",
+    "Where are you studying?",
+    "Tell me about your projects.",
+    "What experience do you have?",
+    "Where are you located?",
+)
+
+# Runs in a fresh interpreter; optionally hides the AI packages first
+_STARTUP_SCRIPT = """
+import importlib.abc, json, sys, time
+if {hide!r}:
+    class Hide(importlib.abc.MetaPathFinder):
+        def find_spec(self, name, path=None, target=None):
+            if name.split('.')[0] in ('transformers', 'torch'):
+                raise ImportError(name)
+    sys.meta_path.insert(0, Hide())
+sys.path.insert(0, {src!r})
+started = time.perf_counter()
+import assistant
+imported = time.perf_counter()
+assistant.PortfolioAssistant(banner=False)
+built = time.perf_counter()
+print(json.dumps({{"import": imported - started, "construct": built - imported,
+                  "transformers_loaded": 'transformers' in sys.modules}}))
+"""
+
+_BACKEND_SCRIPT = """
+import json, sys
+sys.path.insert(0, {src!r})
+import benchmark
+print(json.dumps(benchmark.measure_backend({model!r}, {backend!r}, {tokens!r}, {runs!r}, {threads!r})))
+"""
+
+
+def result(suite, name, seconds, **params):
+    """One benchmark measurement; `seconds` is the time of a single operation"""
+    record = {"suite": suite, "name": name, "params": params, "seconds": seconds}
+    if seconds:
+        record["ops_per_second"] = round(1 / seconds, 1)
+    return record
+
+
+def time_call(func, repeat=5, min_time=0.02):
+    """Best per-call time of `func` over `repeat` runs of at least `min_time` seconds"""
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def percentiles(samples):
+    ordered = sorted(samples)
+
+    def pick(fraction):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+    return {"p50": pick(0.5), "p90": pick(0.9), "p99": pick(0.99), "mean": statistics.mean(ordered)}
+
+
+def bench_startup(runs=5):
+    """Import and construction time of PortfolioAssistant in a fresh process"""
+    results = []
+    variants = [("without_transformers", True)]
+    if is_available("transformers"):
+        variants.append(("with_transformers", False))
+    for label, hide in variants:
+        script = _STARTUP_SCRIPT.format(hide=hide, src=SRC_DIR)
+        samples = []
+        for _ in range(runs):
+            output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+            samples.append(json.loads(output.stdout.strip().splitlines()[-1]))
+        for stage in ("import", "construct"):
+            record = result("startup", stage, min(sample[stage] for sample in samples), variant=label)
+            record["transformers_loaded"] = samples[0]["transformers_loaded"]
+            results.append(record)
+    if not is_available("transformers"):
+        results.append({"suite": "startup", "name": "import", "params": {"variant": "with_transformers"},
+                        "skipped": "transformers is not installed"})
+    return results
+
+
+def make_data(size):
+    """Synthetic portfolio with `size` projects, skills, jobs and certifications"""
+    return {
+        "name": "Bench User",
+        "title": "Benchmark Developer",
+        "email": "bench@example.com",
+        "github": "https://github.com/bench",
+        "linkedin": "https://linkedin.com/in/bench",
+        "school": "Bench University",
+        "degree": "Computer Science",
+        "graduation_year": "2026",
+        "location": "Benchville",
+        "skills": [f"Skill {i}" for i in range(size)],
+        "projects": [{"name": f"Project {i}", "description": f"Does thing number {i}",
+                      "tech": ["Python", f"Lib{i % 7}"], "github": f"https://github.com/bench/p{i}"}
+                     for i in range(size)],
+        "experience": [{"role": f"Role {i}", "company": f"Company {i}", "duration": "2024",
+                        "description": f"Shipped feature {i}"} for i in range(size)],
+        "certifications": [f"Certificate {i} (2024)" for i in range(size)],
+    }
+
+
+def _assistant(data):
+    from assistant import PortfolioAssistant
+
+    assistant = PortfolioAssistant(banner=False)
+    assistant.data = data
+    return assistant
+
+
+def bench_routing(size=100):
+    """get_response throughput per command (sections cached) and for unmatched input"""
+    from assistant import COMMAND_ALIASES
+
+    assistant = _assistant(make_data(size))
+    results = []
+    seen = set()
+    for alias, handler in COMMAND_ALIASES:
+        if handler in seen or handler == "get_joke":
+            continue
+        seen.add(handler)
+        query = f"show me your {alias}"
+        results.append(result("routing", "get_response", time_call(lambda: assistant.get_response(query)),
+                              command=alias))
+    typo = "show me your projcts"
+    results.append(result("routing", "get_response", time_call(lambda: assistant.get_response(typo)),
+                          command="<typo>"))
+    unmatched = "what is the airspeed velocity of an unladen swallow"
+    results.append(result("routing", "get_response", time_call(lambda: assistant.get_response(unmatched)),
+                          command="<unmatched>"))
+    # The keyword match alone, which every query pays for first
+    for label, query in (("<first alias>", "resume"), ("<last alias>", "show me your metrics"),
+                         ("<unmatched>", unmatched), ("<long>", unmatched * 4)):
+        results.append(result("routing", "router_match", time_call(lambda: assistant.router.match(query)),
+                              query=label))
+    # Match cost as aliases are added: the automaton's should stay flat
+    from router import KeywordRouter
+
+    rng = random.Random(0)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10))) for _ in range(1000)]
+    for extra in (0, 200, 1000):
+        routes = list(COMMAND_ALIASES) + [(word, "get_help") for word in words[:extra]]
+        router = KeywordRouter(routes).build()
+        results.append(result("routing", "router_match", time_call(lambda: router.match(unmatched)),
+                              query="<unmatched>", aliases=len(routes)))
+    return results
+
+
+def bench_render(sizes=DEFAULT_SIZES):
+    """Uncached render cost of each section as the portfolio grows"""
+    from assistant import SECTION_FIELDS, PortfolioAssistant
+
+    results = []
+    for size in sizes:
+        assistant = _assistant(make_data(size))
+        for name in sorted(SECTION_FIELDS):
+            render = getattr(PortfolioAssistant, name).__wrapped__
+            results.append(result("render", name, time_call(lambda: render(assistant), repeat=3), size=size))
+    return results
+
+
+def bench_answers(size=100):
+    """Precomputed answer table lookups: a templated hit, a tech question and a miss"""
+    from answers import build_table
+
+    data = make_data(size)
+    data["bio"] = "I like building tools."
+    table = build_table(data)[0]
+    results = [result("answers", "build_table", time_call(lambda: build_table(data), repeat=3), size=size)]
+    for label, query in (("<hit>", "where are you based?"), ("<tech>", "which projects use Lib3"),
+                         ("<miss>", "what is your favourite food")):
+        results.append(result("answers", "lookup", time_call(lambda: table.lookup(query)),
+                              query=label, size=size))
+    return results
+
+
+def bench_ai(model_name="gpt2", questions=20, max_new_tokens=40):
+    """AIChat prompt-building cost, and generate_response latency with a real model"""
+    from ai_chat import AI_AVAILABLE, AIChat
+
+    results = []
+    # Without transformers there is no model, but prompts can still be built
+    chat = AIChat(model_name, deterministic=True)
+    query = "What projects have you built with Python?"
+    results.append(result("ai", "context_prompt", time_call(lambda: chat.generate_context_prompt(query))))
+
+    if not chat.is_available():
+        results.append({"suite": "ai", "name": "generate_response", "params": {"model": model_name},
+                        "skipped": "transformers is not installed" if not AI_AVAILABLE else "model failed to load"})
+        return results
+
+    samples = []
+    for i in range(questions):
+        chat.cache.clear()
+        # Each sample is a fresh one-question conversation
+        chat.memory.clear()
+        started = time.perf_counter()
+        chat.generate_response(f"{query} ({i})", max_new_tokens=max_new_tokens)
+        samples.append(time.perf_counter() - started)
+    stats = percentiles(samples)
+    record = result("ai", "generate_response", stats["p50"], model=model_name, max_new_tokens=max_new_tokens)
+    record.update({key: round(value, 4) for key, value in stats.items()})
+    results.append(record)
+    return results
+
+
+def time_answers(chat, questions, max_new_tokens):
+    """Latency of each question asked as a fresh, uncached one-question conversation"""
+    latencies = []
+    for question in questions:
+        chat.cache.clear()
+        chat.memory.clear()
+        started = time.perf_counter()
+        chat.generate_response(question, max_new_tokens=max_new_tokens)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def bench_prefix(model_name="gpt2", rounds=3, max_new_tokens=40):
+    """AIChat answer latency with and without reusing the persona's key/value cache"""
+    from ai_chat import AI_AVAILABLE, AIChat
+
+    chat = AIChat(model_name, deterministic=True) if AI_AVAILABLE else None
+    if chat is None or not chat.is_available():
+        reason = "transformers is not installed" if not AI_AVAILABLE else "model failed to load"
+        return [{"suite": "prefix", "name": "generate_response", "params": {"model": model_name}, "skipped": reason}]
+
+    from batching import MicroBatcher, pipeline_generate
+    from prefix_cache import PrefixCache, prefix_generate
+
+    modes = (
+        ("without_prefix_cache", None, pipeline_generate(chat.chatbot)),
+        ("with_prefix_cache", PrefixCache(chat.chatbot), None),
+    )
+    # Warm up allocator and kernels so the first mode isn't penalised
+    time_answers(chat, QUESTIONS[:1], max_new_tokens)
+    results = []
+    for mode, prefix_cache, generate in modes:
+        chat.batcher.close()
+        chat.prefix_cache = prefix_cache
+        chat.batcher = MicroBatcher(generate or prefix_generate(chat.chatbot, prefix_cache), max_batch_size=1)
+        samples = []
+        for _ in range(rounds):
+            samples += time_answers(chat, QUESTIONS, max_new_tokens)
+        stats = percentiles(samples)
+        record = result("prefix", "generate_response", stats["p50"], mode=mode, model=model_name,
+                        max_new_tokens=max_new_tokens)
+        record.update({key: round(value, 4) for key, value in stats.items()})
+        if prefix_cache is not None:
+            record.update(prefix_cache.stats())
+        results.append(record)
+    chat.batcher.close()
+    return results
+
+
+def rss_mb():
+    """Resident set size of this process in MB (peak RSS where /proc is missing)"""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return round(pages * os.sysconf("SC_PAGE_SIZE") / 2**20, 1)
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+        return round(peak / (2**20 if sys.platform == "darwin" else 2**10), 1)
+
+
+def measure_backend(model_name, backend, new_tokens=64, runs=3, num_threads=None):
+    """Load one backend and time greedy generation of `new_tokens` tokens"""
+    from backends import load_pipeline
+
+    baseline = rss_mb()
+    started = time.perf_counter()
+    pipe = load_pipeline(model_name, backend=backend, num_threads=num_threads)
+    load_seconds = time.perf_counter() - started
+    loaded_rss = rss_mb()
+
+    options = dict(max_new_tokens=new_tokens, min_new_tokens=new_tokens, do_sample=False,
+                   pad_token_id=pipe.tokenizer.eos_token_id)
+    # The first call pays one-off costs (torch.compile traces here)
+    started = time.perf_counter()
+    pipe(PROMPT, **options)
+    first_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(runs):
+        pipe(PROMPT, **options)
+    elapsed = time.perf_counter() - started
+
+    import torch
+
+    return {"threads": torch.get_num_threads(), "load": load_seconds, "first_call": first_seconds,
+            "token": elapsed / (runs * new_tokens), "rss_mb": loaded_rss,
+            "model_rss_mb": round(loaded_rss - baseline, 1)}
+
+
+def bench_backends(model_name="gpt2", backends=None, new_tokens=64, runs=3, num_threads=None):
+    """Load time, memory and per-token generation time of each AI backend, each in its own process"""
+    if not is_available("transformers"):
+        return [{"suite": "backends", "name": "load", "params": {"model": model_name},
+                 "skipped": "transformers is not installed"}]
+    if backends is None:
+        from backends import BACKENDS
+
+        backends = list(BACKENDS)
+
+    results = []
+    for backend in backends:
+        script = _BACKEND_SCRIPT.format(src=SRC_DIR, model=model_name, backend=backend, tokens=new_tokens,
+                                        runs=runs, threads=num_threads)
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+        lines = output.stdout.strip().splitlines()
+        if output.returncode != 0 or not lines:
+            error = (output.stderr.strip().splitlines() or ["no output"])[-1]
+            results.append({"suite": "backends", "name": "load", "params": {"backend": backend, "model": model_name},
+                            "skipped": error})
+            continue
+        sample = json.loads(lines[-1])
+        params = dict(backend=backend, model=model_name, threads=sample["threads"])
+        for stage in ("load", "first_call"):
+            results.append(result("backends", stage, sample[stage], **params))
+        record = result("backends", "token", sample["token"], new_tokens=new_tokens, **params)
+        record.update(rss_mb=sample["rss_mb"], model_rss_mb=sample["model_rss_mb"])
+        results.append(record)
+    return results
+
+
+def git_commit():
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=SRC_DIR,
+                                capture_output=True, text=True, timeout=5)
+        return output.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def result_key(record):
+    return (record["suite"], record["name"], json.dumps(record["params"], sort_keys=True))
+
+
+def compare(baseline, current, threshold=0.25):
+    """Return (record, change) for results slower than the baseline by more than `threshold`"""
+    before = {result_key(record): record for record in baseline["results"] if "seconds" in record}
+    regressions = []
+    for record in current["results"]:
+        old = before.get(result_key(record))
+        if old is None or "seconds" not in record or not old["seconds"]:
+            continue
+        change = record["seconds"] / old["seconds"] - 1
+        if change > threshold:
+            regressions.append((record, change))
+    return regressions
+
+
+def run_suites(suites=SUITES, sizes=DEFAULT_SIZES, model_name="gpt2", startup_runs=5, backends=None):
+    """Run the chosen suites and return the JSON-ready report"""
+    results = []
+    if "startup" in suites:
+        results += bench_startup(startup_runs)
+    if "routing" in suites:
+        results += bench_routing()
+    if "render" in suites:
+        results += bench_render(sizes)
+    if "answers" in suites:
+        results += bench_answers()
+    if "ai" in suites:
+        results += bench_ai(model_name)
+    if "prefix" in suites:
+        results += bench_prefix(model_name)
+    if "backends" in suites:
+        results += bench_backends(model_name, backends)
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "transformers": is_available("transformers"),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="benchmark", description="Benchmark Botfolio")
+    parser.add_argument("--only", default=",".join(SUITES), help=f"comma-separated suites ({', '.join(SUITES)})")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="portfolio sizes for the render suite")
+    parser.add_argument("--model", default="gpt2", help="model for the AI suites")
+    parser.add_argument("--backends", help="comma-separated AI backends to compare (default: all)")
+    parser.add_argument("--output", metavar="FILE", help="write the JSON report to FILE (default: stdout)")
+    parser.add_argument("--compare", metavar="FILE", help="report results slower than a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="slowdown that counts as a regression")
+    args = parser.parse_args(argv)
+
+    suites = [suite.strip() for suite in args.only.split(",") if suite.strip()]
+    unknown = set(suites) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(sorted(unknown))}")
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    backends = [name.strip() for name in args.backends.split(",") if name.strip()] if args.backends else None
+
+    import contextlib
+
+    # Keep stray output from the code under test out of the JSON report
+    with contextlib.redirect_stdout(sys.stderr):
+        report = run_suites(suites, sizes, args.model, backends=backends)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare(baseline, report, args.threshold)
+        for record, change in regressions:
+            print(f"⚠️  {record['suite']}/{record['name']} {record['params']}: {change:+.0%}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"✅ No regressions over {args.threshold:.0%} against {args.compare}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Runtime Settings
+Tunable knobs with defaults, overridable through BOTFOLIO_* environment variables
+
+Author: SSV
+Date: October 2026
+"""
+
+import os
+
+DEFAULTS = {
+    # Micro-batching in front of the text-generation pipeline
+    "ai_batch_size": 8,
+    "ai_batch_wait_ms": 10.0,
+    # Session server: threads waiting on AI answers (they feed the batcher)
+    # and how many AI questions may be outstanding before replying "busy"
+    "server_ai_workers": 8,
+    "server_max_pending_ai": 16,
+    # AI answer cache; answers are only cached with deterministic decoding.
+    # Set ai_cache_path to a file to keep answers across restarts (sqlite)
+    "ai_deterministic": True,
+    "ai_cache_size": 1024,
+    "ai_cache_ttl": 24 * 60 * 60.0,
+    "ai_cache_path": None,
+    # Portfolio facts retrieved into each AI prompt
+    "ai_retrieval_top_k": 4,
+    # Model backend (fp32, int8, compiled, bettertransformer) and torch's
+    # CPU thread count; 0 keeps torch's own default
+    "ai_backend": "fp32",
+    "ai_num_threads": 0,
+    # Reuse the key/value cache of the persona preamble and of each
+    # conversation's history across AI questions, keeping at most this many
+    # tokens' worth of caches (roughly 0.6 MB per token for phi-2 in fp32)
+    "ai_prefix_cache": True,
+    "ai_prefix_cache_tokens": 4096,
+    # Earlier AI turns kept in each session's prompt, in tokens (0 forgets
+    # every turn); older turns are summarized as their questions
+    "ai_memory_tokens": 256,
+    # Batch mode: JSONL records written per flush, and AI questions kept in
+    # flight at once (enough to fill several micro-batches)
+    "batch_chunk_size": 256,
+    "batch_max_pending_ai": 32,
+    # Request metrics (off by default); a *.json dump path gets JSON, any
+    # other path Prometheus text, rewritten every metrics_dump_interval seconds
+    "metrics_enabled": False,
+    "metrics_dump_path": None,
+    "metrics_dump_interval": 15.0,
+    # Keep a compiled (parsed and validated) copy of data.json keyed by its
+    # content hash, so restarts with an unchanged file skip the parse; the
+    # cache lives in data_cache_dir, or ~/.cache/botfolio when unset. Files
+    # under data_snapshot_min_bytes parse in about a millisecond and are
+    # never cached
+    "data_snapshot": True,
+    "data_snapshot_min_bytes": 64 * 1024,
+    "data_cache_dir": None,
+    # Multi-tenant hosting: portfolios kept loaded before the least recently
+    # used one is evicted, and how often (seconds) a tenant's file is re-checked
+    "tenant_capacity": 128,
+    "tenant_check_interval": 2.0,
+    # Free-text questions matching no command are mapped to a section when
+    # the intent classifier is at least this confident; below it they go to
+    # the AI model (if installed and intent_ai_fallback is on)
+    "intent_threshold": 0.5,
+    "intent_ai_fallback": True,
+    # Serve AI questions close enough to a precomputed one (see answers.py)
+    # from its table instead of the model
+    "answer_table": True,
+    "answer_threshold": 0.6,
+    # Run generation in this many worker processes (0 keeps it in-process);
+    # at most ai_worker_max_pending questions wait for a worker. An answer
+    # taking longer than ai_timeout seconds (0 for no limit) is stopped by
+    # a worker, or cut short where it stands when generating in-process
+    "ai_worker_processes": 0,
+    "ai_timeout": 60.0,
+    "ai_worker_max_pending": 16,
+}
+
+
+def get_setting(name):
+    """Return a setting, e.g. BOTFOLIO_AI_BATCH_SIZE=16 overrides ai_batch_size"""
+    default = DEFAULTS[name]
+    raw = os.environ.get(f"BOTFOLIO_{name.upper()}")
+    if raw is None or default is None:
+        return default if raw is None else raw
+    if isinstance(default, bool):
+        return raw.strip().lower() in ("1", "true", "yes", "on")
+    try:
+        return type(default)(raw)
+    except ValueError:
+        print(f"⚠️  Ignoring invalid BOTFOLIO_{name.upper()}={raw!r}, using {default!r}")
+        return default
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Portfolio Data Store
+A shared, hot-reloading view of data.json
+
+Author: SSV
+Date: October 2026
+"""
+
+import hashlib
+import json
+import threading
+import weakref
+from pathlib import Path
+
+from metrics import get_metrics
+from portfolio import Portfolio
+
+DEFAULT_DATA_PATH = Path(__file__).parent / "data.json"
+
+
+class Snapshot:
+    """Immutable view of one parsed version of the data file"""
+
+    __slots__ = ("data", "version", "signature", "_fingerprint", "_portfolio")
+
+    def __init__(self, data, version, signature=None, portfolio=None):
+        self.data = data
+        self.version = version
+        self.signature = signature
+        self._fingerprint = None
+        self._portfolio = portfolio
+
+    @property
+    def portfolio(self):
+        """Typed, indexed records for this version (built on first use)"""
+        if self._portfolio is None:
+            self._portfolio = Portfolio.from_data(self.data)
+        return self._portfolio
+
+    @property
+    def fingerprint(self):
+        """Content hash of the data, stable across restarts"""
+        if self._fingerprint is None:
+            encoded = json.dumps(self.data, sort_keys=True, ensure_ascii=False).encode('utf-8')
+            self._fingerprint = hashlib.sha1(encoded).hexdigest()
+        return self._fingerprint
+
+
+def changed_keys(old, new):
+    """Return the top-level keys whose values differ between two data dicts"""
+    return frozenset(
+        key for key in old.keys() | new.keys()
+        if old.get(key) != new.get(key)
+    )
+
+
+class DataStore:
+    """Watched data file that swaps in new snapshots atomically.
+
+    Readers only ever dereference the current snapshot, so they never
+    block; reloads parse the file off to the side and replace the snapshot
+    in a single assignment. Listeners are told which top-level keys
+    changed so they can invalidate just the derived state that uses them.
+    """
+
+    def __init__(self, path=DEFAULT_DATA_PATH, poll_interval=1.0):
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        self._snapshot = Snapshot({}, 0)
+        self._listeners = []
+        self._listeners_lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher = None
+
+    @property
+    def snapshot(self):
+        return self._snapshot
+
+    @property
+    def data(self):
+        return self._snapshot.data
+
+    @property
+    def version(self):
+        return self._snapshot.version
+
+    def subscribe(self, callback):
+        """Call callback(changed_keys, snapshot) after every change.
+
+        Bound methods are held weakly so subscribing never keeps an
+        assistant alive.
+        """
+        if hasattr(callback, "__self__"):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback
+        with self._listeners_lock:
+            self._listeners.append(ref)
+
+    def _signature(self):
+        stat = self.path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def load(self):
+        """Read and parse the file, replacing the snapshot.
+
+        Errors (missing file, malformed JSON) propagate to the caller and
+        leave the current snapshot in place.
+        """
+        with self._reload_lock, get_metrics().timer("data_load_seconds"):
+            # Imported on first load; the JSON parser and snapshot cache aren't free
+            from loader import load_file
+
+            signature = self._signature()
+            data, portfolio = load_file(self.path)
+            return self.replace(data, signature, portfolio)
+
+    def ensure_loaded(self):
+        """Load the file unless a snapshot has already been read or set"""
+        if not self._snapshot.version:
+            self.load()
+        return self._snapshot
+
+    def check(self):
+        """Reload if the file changed on disk; return True if it did"""
+        try:
+            signature = self._signature()
+        except OSError:
+            return False
+        if signature == self._snapshot.signature:
+            return False
+        # Another thread is already reloading; keep serving the old snapshot
+        if self._reload_lock.locked():
+            return False
+        try:
+            self.load()
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Could not reload {self.path.name}, keeping previous data: {e}")
+            # Don't retry the same broken file on every poll
+            self._snapshot = Snapshot(self._snapshot.data, self._snapshot.version, signature)
+            return False
+        return True
+
+    def replace(self, data, signature=None, portfolio=None):
+        """Swap in new data and notify listeners of the changed keys"""
+        old = self._snapshot
+        if signature is None:
+            signature = old.signature
+        snapshot = Snapshot(data, old.version + 1, signature, portfolio)
+        self._snapshot = snapshot
+
+        changed = changed_keys(old.data, data)
+        if changed:
+            with self._listeners_lock:
+                self._listeners = [ref for ref in self._listeners if ref() is not None]
+                listeners = list(self._listeners)
+            for ref in listeners:
+                callback = ref()
+                if callback is not None:
+                    callback(changed, snapshot)
+        return snapshot
+
+    def watch(self, interval=None):
+        """Poll the file's mtime in a background thread"""
+        if self._watcher and self._watcher.is_alive():
+            return self._watcher
+        interval = interval or self.poll_interval
+        self._stop.clear()
+
+        def poll():
+            while not self._stop.wait(interval):
+                self.check()
+
+        self._watcher = threading.Thread(target=poll, name="botfolio-data-watch", daemon=True)
+        self._watcher.start()
+        return self._watcher
+
+    def stop(self):
+        """Stop the background watcher"""
+        self._stop.set()
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(path=DEFAULT_DATA_PATH):
+    """Return the process-wide store for a data file.
+
+    The store is shared by everything reading the same file; call
+    ensure_loaded() on it before first use.
+    """
+    key = Path(path).resolve()
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = DataStore(key)
+        return store
+
+
+def drop_store(path):
+    """Forget the shared store for a data file (e.g. an evicted tenant's)"""
+    key = Path(path).resolve()
+    with _stores_lock:
+        store = _stores.pop(key, None)
+    if store is not None:
+        store.stop()
+    return store
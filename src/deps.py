@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Optional Dependencies
+Offline availability checks and pure-Python fallbacks for optional packages
+
+Author: SSV
+Date: October 2026
+"""
+
+import importlib.util
+from functools import lru_cache
+
+# Package name -> what it adds when installed
+OPTIONAL_PACKAGES = {
+    "colorama": "Colored output on Windows consoles",
+    "pyjokes": "A larger collection of programming jokes",
+    "transformers": "AI-powered responses ('ai: your question')",
+    "torch": "Model backend for AI responses",
+    "orjson": "Faster loading of large data.json files",
+    "ujson": "Faster loading of large data.json files (if orjson is missing)",
+    "numpy": "Vectorized intent matching for questions without a command word",
+}
+
+
+@lru_cache(maxsize=None)
+def is_available(package):
+    """Check whether a package is importable without importing it"""
+    try:
+        return importlib.util.find_spec(package) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def check_dependencies():
+    """Return {package: installed?} for every optional package"""
+    return {package: is_available(package) for package in OPTIONAL_PACKAGES}
+
+
+try:
+    from colorama import Fore, Style
+except ImportError:
+    # Plain ANSI escapes; every terminal colorama targets understands these
+    class Fore:
+        BLACK = '\x1b[30m'
+        RED = '\x1b[31m'
+        GREEN = '\x1b[32m'
+        YELLOW = '\x1b[33m'
+        BLUE = '\x1b[34m'
+        MAGENTA = '\x1b[35m'
+        CYAN = '\x1b[36m'
+        WHITE = '\x1b[37m'
+        RESET = '\x1b[39m'
+
+    class Style:
+        BRIGHT = '\x1b[1m'
+        DIM = '\x1b[2m'
+        NORMAL = '\x1b[22m'
+        RESET_ALL = '\x1b[0m'
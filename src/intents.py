@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Intent Classifier
+Maps free-text questions with no command alias onto the portfolio handlers
+
+Each handler has a few example phrasings. They are turned into character
+n-gram TF-IDF vectors once; a query is vectorized the same way and scored
+against every example by cosine similarity, so "where did you study"
+reaches the education section without a word in common with 'school'.
+
+Author: SSV
+Date: October 2026
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+
+from config import get_setting
+from deps import is_available
+
+# Handler -> example questions; extend freely, the matrix is rebuilt on use
+INTENT_EXAMPLES = {
+    'get_education_info': (
+        "where did you study", "which university did you go to", "what college did you attend",
+        "what is your degree", "when do you graduate", "what did you major in",
+        "tell me about your studies", "your academic background",
+    ),
+    'get_projects_info': (
+        "what have you built", "what are you working on", "show me something you made",
+        "what apps have you developed", "portfolio pieces", "what have you created",
+        "side projects you have done",
+    ),
+    'get_skills_info': (
+        "what languages do you know", "what programming languages do you use",
+        "what are you good at", "which frameworks can you use", "what technologies do you know",
+        "your strengths", "what tools do you use",
+    ),
+    'get_experience_info': (
+        "where have you worked", "what jobs have you had", "any internships",
+        "your employment history", "what roles have you held", "previous employers",
+    ),
+    'get_contact_info': (
+        "how can i reach you", "how do i get in touch", "can i message you",
+        "what is your github", "your linkedin profile", "how to contact you",
+    ),
+    'get_certifications_info': (
+        "do you have any certificates", "what courses have you completed",
+        "any awards or achievements", "are you certified",
+    ),
+    'get_resume_info': (
+        "can i see your cv", "download your resume", "send me your resume",
+        "summary of your background",
+    ),
+    'get_about_info': (
+        "who made this bot", "what is this assistant", "how does this bot work",
+        "who built this",
+    ),
+    'get_joke': (
+        "make me laugh", "tell me something funny", "say something funny",
+    ),
+    'get_help': (
+        "what can you do", "what can i ask", "how do i use this", "what should i type",
+    ),
+}
+
+NGRAM_SIZES = (3, 4)
+_NON_WORD = re.compile(r"[^a-z0-9+#]+")
+
+# Words every question shares, question words included; left in, they make
+# "what is your favourite food" look like "what is your degree"
+FILLER = frozenset("""
+a an and any are be can could did do does for have has i im in is it me
+more my of on please some tell that the this to was what when where which
+who how why with would you your about give show like know let s
+""".split())
+
+
+def char_ngrams(text, sizes=NGRAM_SIZES):
+    """Character n-gram counts of each word, padded so word edges count"""
+    grams = Counter()
+    for word in _NON_WORD.split(text.lower()):
+        if not word or word in FILLER:
+            continue
+        padded = f" {word} "
+        for size in sizes:
+            for i in range(len(padded) - size + 1):
+                grams[padded[i:i + size]] += 1
+    return grams
+
+
+class IntentClassifier:
+    """Nearest-example intent matcher over char n-gram TF-IDF vectors.
+
+    The example matrix is compiled on first use. With NumPy installed it
+    is a dense array and a query is one vectorized product over the
+    columns it touches; without NumPy an inverted index gives the same
+    scores in pure Python.
+    """
+
+    def __init__(self, examples=INTENT_EXAMPLES, threshold=None, use_numpy=None):
+        self.examples = examples
+        self.threshold = get_setting("intent_threshold") if threshold is None else threshold
+        self.use_numpy = is_available("numpy") if use_numpy is None else use_numpy
+        self._built = False
+
+    def build(self):
+        """Compile the vocabulary, IDF weights and normalized example vectors"""
+        labels = []
+        counts = []
+        for handler, phrases in self.examples.items():
+            for phrase in phrases:
+                labels.append(handler)
+                counts.append(char_ngrams(phrase))
+
+        df = Counter()
+        for grams in counts:
+            df.update(grams.keys())
+        total = len(counts)
+        vocab = {gram: i for i, gram in enumerate(sorted(df))}
+        idf = {gram: math.log((1 + total) / (1 + n)) + 1 for gram, n in df.items()}
+
+        rows = [self._weigh(grams, idf) for grams in counts]
+        self._labels = labels
+        self._handlers = list(dict.fromkeys(labels))
+        self._vocab = vocab
+        self._idf = idf
+
+        if self.use_numpy:
+            import numpy as np
+
+            matrix = np.zeros((len(rows), len(vocab)), dtype=np.float32)
+            for r, row in enumerate(rows):
+                for gram, weight in row.items():
+                    matrix[r, vocab[gram]] = weight
+            self._matrix = matrix
+            self._label_ids = np.array([self._handlers.index(label) for label in labels])
+        else:
+            postings = defaultdict(list)
+            for r, row in enumerate(rows):
+                for gram, weight in row.items():
+                    postings[gram].append((r, weight))
+            self._postings = dict(postings)
+        self._built = True
+        return self
+
+    @staticmethod
+    def _weigh(grams, idf):
+        """Sublinear TF-IDF weights, L2-normalized; unknown n-grams are dropped"""
+        weights = {gram: (1 + math.log(count)) * idf[gram] for gram, count in grams.items() if gram in idf}
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        if not norm:
+            return {}
+        return {gram: w / norm for gram, w in weights.items()}
+
+    def scores(self, text):
+        """Return {handler: best cosine similarity} for the text"""
+        if not self._built:
+            self.build()
+        query = self._weigh(char_ngrams(text), self._idf)
+        if not query:
+            return {}
+
+        if self.use_numpy:
+            import numpy as np
+
+            columns = [self._vocab[gram] for gram in query]
+            weights = np.fromiter(query.values(), dtype=np.float32, count=len(query))
+            similarity = self._matrix[:, columns] @ weights
+            best = np.zeros(len(self._handlers), dtype=np.float32)
+            np.maximum.at(best, self._label_ids, similarity)
+            return {handler: float(score) for handler, score in zip(self._handlers, best) if score > 0}
+
+        similarity = defaultdict(float)
+        for gram, weight in query.items():
+            for row, example_weight in self._postings.get(gram, ()):
+                similarity[row] += weight * example_weight
+        best = {}
+        for row, score in similarity.items():
+            handler = self._labels[row]
+            if score > best.get(handler, 0.0):
+                best[handler] = score
+        return best
+
+    def classify(self, text):
+        """Return (handler, confidence) if the best intent clears the threshold, else None"""
+        scores = self.scores(text)
+        if not scores:
+            return None
+        handler = max(scores, key=scores.get)
+        confidence = scores[handler]
+        if confidence < self.threshold:
+            return None
+        return handler, confidence
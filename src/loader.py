@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Data Loader
+Parses and validates data.json once, then reuses a compiled snapshot on restart
+
+The fastest installed JSON parser (orjson, then ujson, then the standard
+library) reads the file; the validated data and its typed Portfolio model
+are pickled under a key derived from the file's content hash, so later
+starts with an unchanged file skip both parsing and validation.
+
+Author: SSV
+Date: October 2026
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+
+from config import get_setting
+from deps import is_available
+from portfolio import Portfolio
+
+# Bump whenever validation or the Portfolio model changes shape, so stale
+# snapshots from an older version are never loaded
+SNAPSHOT_FORMAT = 3
+
+# Snapshots kept in the cache directory (one per data file version); the
+# least recently used are deleted beyond this
+SNAPSHOT_KEEP = 16
+
+# Field -> accepted type(s); other keys are allowed and passed through as-is
+TEXT_FIELDS = ("name", "title", "school", "degree", "graduation_year", "location", "bio",
+               "resume_url", "certifications_url")
+LIST_FIELDS = ("skills", "projects", "experience", "certifications",
+               "interests", "achievements", "languages", "fun_facts")
+MAPPING_FIELDS = ("contact", "social_links")
+# List fields whose entries may be objects rather than plain strings
+RECORD_FIELDS = ("projects", "experience")
+
+
+class DataError(ValueError):
+    """data.json is unreadable JSON or doesn't match the expected shape"""
+
+
+def _pick_parser():
+    """Return (name, loads) for the fastest available JSON parser"""
+    if is_available("orjson"):
+        import orjson
+        return "orjson", orjson.loads
+    if is_available("ujson"):
+        import ujson
+        return "ujson", ujson.loads
+    return "json", json.loads
+
+
+PARSER, _loads = _pick_parser()
+
+
+def parse(raw, name="data.json"):
+    """Parse JSON bytes, raising DataError with the position on bad input"""
+    try:
+        return _loads(raw)
+    except json.JSONDecodeError as e:
+        raise DataError(f"{name} is not valid JSON (line {e.lineno}, column {e.colno}): {e.msg}") from None
+    except ValueError as e:
+        # orjson and ujson report positions in their own message formats
+        raise DataError(f"{name} is not valid JSON: {e}") from None
+
+
+def validate(data, name="data.json"):
+    """Check the top-level shape of the data, listing every problem found"""
+    if not isinstance(data, dict):
+        raise DataError(f"{name} must hold a JSON object, not {type(data).__name__}")
+    problems = []
+    for field in TEXT_FIELDS:
+        if field in data and not isinstance(data[field], (str, int, float)):
+            problems.append(f"'{field}' should be text")
+    for field in MAPPING_FIELDS:
+        if field in data and not isinstance(data[field], dict):
+            problems.append(f"'{field}' should be an object")
+    for field in LIST_FIELDS:
+        if field not in data:
+            continue
+        entries = data[field]
+        if not isinstance(entries, list):
+            problems.append(f"'{field}' should be a list")
+            continue
+        allowed = (str, dict) if field in RECORD_FIELDS else (str,)
+        for i, entry in enumerate(entries):
+            if not isinstance(entry, allowed):
+                problems.append(f"'{field}[{i}]' should be {'text or an object' if dict in allowed else 'text'}")
+    if problems:
+        raise DataError(f"{name} has {len(problems)} problem(s): " + "; ".join(problems))
+    return data
+
+
+def default_cache_dir():
+    """Where compiled snapshots live: data_cache_dir, else the user cache"""
+    configured = get_setting("data_cache_dir")
+    if configured:
+        return Path(configured)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "botfolio"
+
+
+def snapshot_path(cache_dir, digest):
+    return Path(cache_dir) / f"data-{digest}.pickle"
+
+
+def _digest(raw):
+    # The format and interpreter are part of the key: pickles of the model
+    # are only trusted by the code that wrote them
+    key = hashlib.sha256(raw)
+    key.update(f"{SNAPSHOT_FORMAT}:{sys.version_info[:2]}".encode())
+    return key.hexdigest()[:32]
+
+
+def _trusted(stat):
+    """Only unpickle files this user wrote and nobody else can change"""
+    if stat.st_mode & 0o022:
+        return False
+    return not hasattr(os, "getuid") or stat.st_uid == os.getuid()
+
+
+def _read_snapshot(path):
+    try:
+        with open(path, "rb") as file:
+            if not _trusted(os.fstat(file.fileno())):
+                return None
+            compiled = pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Truncated or from an incompatible version; rebuild it
+        return None
+    try:
+        # Marks it recently used, so pruning keeps it
+        os.utime(path)
+    except OSError:
+        pass
+    return compiled
+
+
+def _prune(cache_dir, keep=None):
+    """Delete all but the `keep` most recently used snapshots"""
+    keep = SNAPSHOT_KEEP if keep is None else keep
+    aged = []
+    for snapshot in Path(cache_dir).glob("data-*.pickle"):
+        try:
+            aged.append((snapshot.stat().st_mtime, snapshot))
+        except OSError:
+            continue
+    aged.sort(reverse=True)
+    for _, stale in aged[keep:]:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+
+
+def _write_snapshot(path, compiled):
+    temp = None
+    try:
+        # Private: snapshots are unpickled, so nobody else may write here
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(compiled, file, protocol=pickle.HIGHEST_PROTOCOL)
+        # Concurrent starts never read a half-written snapshot
+        os.replace(temp, path)
+        temp = None
+        _prune(path.parent)
+    except OSError:
+        # A read-only cache only costs the next start a parse
+        pass
+    finally:
+        if temp is not None:
+            try:
+                os.unlink(temp)
+            except OSError:
+                pass
+
+
+def load_file(path, cache_dir=None, use_snapshot=None):
+    """Return (data, portfolio) for a data file.
+
+    Raises FileNotFoundError if the file is missing and DataError if it is
+    malformed; a valid file's compiled form is cached for the next load
+    when the file is large enough for that to pay off (or `use_snapshot`).
+    """
+    path = Path(path)
+    raw = path.read_bytes()
+    if use_snapshot is None:
+        use_snapshot = get_setting("data_snapshot") and len(raw) >= get_setting("data_snapshot_min_bytes")
+
+    if use_snapshot:
+        target = snapshot_path(cache_dir or default_cache_dir(), _digest(raw))
+        compiled = _read_snapshot(target)
+        if compiled is not None:
+            return compiled
+
+    data = validate(parse(raw, path.name), path.name)
+    compiled = (data, Portfolio.from_data(data))
+    if use_snapshot:
+        _write_snapshot(target, compiled)
+    return compiled
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Conversation Memory
+Keeps the recent turns of an AI conversation within a token budget
+
+Follow-up questions ("tell me more about that project") only make sense
+with the earlier turns in the prompt. The window is compacted in one go
+once it outgrows its budget, dropping the oldest turns down to half the
+budget and keeping just their questions as a short summary. Between
+compactions the history only grows at the end, so the prompt up to the
+new question is the previous prompt's prefix and its cached keys/values
+can be reused.
+
+Author: SSV
+Date: October 2026
+"""
+
+import itertools
+import re
+from collections import deque
+
+from config import get_setting
+
+# Words of an evicted question kept in the summary
+SUMMARY_WORDS = 8
+
+# Words that point back at an earlier turn ("tell me more about that project")
+FOLLOW_UP_WORDS = frozenset("""
+it its that this those these them they their more else also again another other
+one ones there he she why elaborate continue
+""".split())
+_WORD = re.compile(r"[a-z']+")
+
+_keys = itertools.count(1)
+
+
+def is_follow_up(question):
+    """True if the question refers back to the conversation"""
+    return any(word in FOLLOW_UP_WORDS for word in _WORD.findall(question.lower()))
+
+
+def estimate_tokens(text):
+    """Rough GPT-2 token count for when no tokenizer is at hand"""
+    return len(text.split()) * 4 // 3 + 1 if text else 0
+
+
+class ConversationMemory:
+    """Rolling window of (question, answer) turns for one session.
+
+    `count` measures text in tokens, ideally with the model's own
+    tokenizer; each turn is measured once, when it is added.
+    """
+
+    def __init__(self, budget=None, count=None):
+        self.budget = get_setting("ai_memory_tokens") if budget is None else budget
+        self.count = count or estimate_tokens
+        # Identifies this conversation's entry in a PrefixCache
+        self.key = next(_keys)
+        self.turns = deque()
+        self.topics = deque()
+        self.tokens = 0
+        self.summary_tokens = 0
+        self.compactions = 0
+        self._text = None
+
+    def __len__(self):
+        return len(self.turns)
+
+    @property
+    def last_question(self):
+        return self.turns[-1][0] if self.turns else None
+
+    def add(self, question, answer):
+        """Remember a turn, compacting the window if it is over budget"""
+        if self.budget <= 0 or not answer:
+            return
+        tokens = self.count(self._format(question, answer))
+        self.turns.append((question, answer, tokens))
+        self.tokens += tokens
+        if self._text is not None:
+            self._text += self._format(question, answer)
+        if self.tokens + self.summary_tokens > self.budget:
+            self.compact()
+
+    def compact(self):
+        """Drop the oldest turns down to half the budget, keeping their questions"""
+        target = self.budget // 2
+        while self.turns and self.tokens > target:
+            question, _, tokens = self.turns.popleft()
+            self.tokens -= tokens
+            self.topics.append(" ".join(question.split()[:SUMMARY_WORDS]))
+        # The summary gets a quarter of the budget; the oldest topics go first
+        while self.topics and self.count(self._summary()) > self.budget // 4:
+            self.topics.popleft()
+        self.summary_tokens = self.count(self._summary())
+        self.compactions += 1
+        self._text = None
+
+    def clear(self):
+        """Forget the whole conversation"""
+        self.turns.clear()
+        self.topics.clear()
+        self.tokens = 0
+        self.summary_tokens = 0
+        self._text = None
+
+    def render(self):
+        """History text to put in front of the next question ('' if none)"""
+        if self._text is None:
+            self._text = self._summary() + "".join(self._format(q, a) for q, a, _ in self.turns)
+        return self._text
+
+    def _summary(self):
+        if not self.topics:
+            return ""
+        return f"Earlier questions: {'; '.join(self.topics)}\n\n"
+
+    @staticmethod
+    def _format(question, answer):
+        return f"Question: {question}\nAnswer: {answer}\n\n"
+
+    def stats(self):
+        return {"turns": len(self.turns), "tokens": self.tokens, "budget": self.budget,
+                "summarized": len(self.topics), "compactions": self.compactions}
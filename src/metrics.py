@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Request Metrics
+Latency histograms and counters per route and stage, with text/JSON export
+
+Instrumented code checks `metrics.enabled` before doing any work, so with
+metrics off (the default) each call site costs one attribute lookup.
+
+Author: SSV
+Date: October 2026
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+
+from config import get_setting
+
+# Upper bounds (seconds) of the latency histogram buckets, Prometheus style
+BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05,
+           0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, float("inf"))
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram"""
+
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(BUCKETS):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def quantile(self, fraction):
+        """Upper bound of the bucket holding the given quantile"""
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return BUCKETS[-1]
+
+
+def _label_text(labels):
+    return ",".join(f'{name}="{value}"' for name, value in labels)
+
+
+class _Timer:
+    __slots__ = ("metrics", "name", "labels", "started")
+
+    def __init__(self, metrics, name, labels):
+        self.metrics = metrics
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.metrics.observe(self.name, time.perf_counter() - self.started, **self.labels)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    """Process-wide histograms (stage timings) and counters (routes, cache
+    results, tokens), keyed by metric name plus sorted labels.
+    """
+
+    def __init__(self, enabled=None):
+        if enabled is None:
+            enabled = get_setting("metrics_enabled")
+        self.enabled = enabled
+        self.histograms = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+        self._dumper = None
+
+    def observe(self, name, seconds, **labels):
+        """Record one duration"""
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    def inc(self, name, amount=1, **labels):
+        """Add to a counter"""
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def timer(self, name, **labels):
+        """Context manager timing a block into the named histogram"""
+        if not self.enabled:
+            return NULL_TIMER
+        return _Timer(self, name, labels)
+
+    def configure(self, enabled=True, dump_path=None, interval=None):
+        """Turn collection on (or off) and optionally keep a dump file current"""
+        self.enabled = enabled
+        if dump_path:
+            self.start_dumping(dump_path, interval)
+            atexit.register(self.dump, dump_path)
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+    def snapshot(self):
+        """Return all metrics as plain, JSON-ready data"""
+        with self._lock:
+            histograms = [
+                {"name": name, "labels": dict(labels), "count": h.count, "sum": round(h.sum, 6),
+                 "p50": h.quantile(0.5), "p90": h.quantile(0.9), "p99": h.quantile(0.99),
+                 "buckets": {("+Inf" if bound == float("inf") else str(bound)): count
+                             for bound, count in zip(BUCKETS, h.counts)}}
+                for (name, labels), h in sorted(self.histograms.items())
+            ]
+            counters = [{"name": name, "labels": dict(labels), "value": value}
+                        for (name, labels), value in sorted(self.counters.items())]
+        return {"enabled": self.enabled, "histograms": histograms, "counters": counters}
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self):
+        """Render in the Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            for name in sorted({name for name, _ in self.counters}):
+                lines.append(f"# TYPE botfolio_{name} counter")
+                for (metric, labels), value in sorted(self.counters.items()):
+                    if metric == name:
+                        lines.append(f"botfolio_{name}{{{_label_text(labels)}}} {value}")
+            for name in sorted({name for name, _ in self.histograms}):
+                lines.append(f"# TYPE botfolio_{name} histogram")
+                for (metric, labels), h in sorted(self.histograms.items()):
+                    if metric != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(BUCKETS, h.counts):
+                        cumulative += count
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        bucket_labels = _label_text(labels + (("le", le),))
+                        lines.append(f"botfolio_{name}_bucket{{{bucket_labels}}} {cumulative}")
+                    lines.append(f"botfolio_{name}_sum{{{_label_text(labels)}}} {h.sum:.6f}")
+                    lines.append(f"botfolio_{name}_count{{{_label_text(labels)}}} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path):
+        """Write metrics to a file: JSON for *.json paths, Prometheus text otherwise"""
+        text = self.to_json() if str(path).endswith(".json") else self.to_prometheus()
+        temp = f"{path}.tmp"
+        with open(temp, "w", encoding="utf-8") as file:
+            file.write(text)
+        # Scrapers never see a half-written file
+        os.replace(temp, path)
+
+    def start_dumping(self, path, interval=None):
+        """Rewrite the dump file every `interval` seconds from a daemon thread"""
+        if interval is None:
+            interval = get_setting("metrics_dump_interval")
+        stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                try:
+                    self.dump(path)
+                except OSError as e:
+                    print(f"⚠️  Could not write metrics to {path}: {e}")
+        thread = threading.Thread(target=run, name="botfolio-metrics", daemon=True)
+        thread.start()
+        self._dumper = stop
+        return thread
+
+    def stop_dumping(self):
+        if self._dumper is not None:
+            self._dumper.set()
+            self._dumper = None
+
+    def summary(self):
+        """Human-readable table for the 'stats' command"""
+        snapshot = self.snapshot()
+        lines = []
+        for h in snapshot["histograms"]:
+            labels = " ".join(f"{k}={v}" for k, v in h["labels"].items())
+            lines.append(f"{h['name']:<20} {labels:<40} n={h['count']:<6} "
+                         f"avg={h['sum'] / h['count'] * 1000:.2f}ms p50≤{h['p50'] * 1000:g}ms "
+                         f"p99≤{h['p99'] * 1000:g}ms")
+        for c in snapshot["counters"]:
+            labels = " ".join(f"{k}={v}" for k, v in c["labels"].items())
+            lines.append(f"{c['name']:<20} {labels:<40} {c['value']}")
+        return lines
+
+
+_metrics = Metrics()
+
+
+def get_metrics():
+    """Return the process-wide metrics registry"""
+    return _metrics
+
+
+def add_metrics_arguments(parser):
+    """Add the --metrics/--metrics-dump options to a command-line parser"""
+    parser.add_argument("--metrics", action="store_true",
+                        help="collect request timings (see the 'stats' command)")
+    parser.add_argument("--metrics-dump", metavar="FILE",
+                        help="keep FILE updated with metrics (JSON for *.json, else Prometheus text)")
+
+
+def configure_metrics(args):
+    """Enable metrics if asked for on the command line or through settings"""
+    dump_path = args.metrics_dump or get_setting("metrics_dump_path")
+    if args.metrics or dump_path or get_setting("metrics_enabled"):
+        _metrics.configure(True, dump_path)
+    return _metrics
+
+
+def count_tokens(pipe, text):
+    """Number of tokens the pipeline's tokenizer makes of `text` (0 if unknown)"""
+    tokenizer = getattr(pipe, "tokenizer", None)
+    if tokenizer is None or not text:
+        return 0
+    try:
+        return len(tokenizer(text)["input_ids"])
+    except Exception:
+        return 0
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Model Registry
+One shared copy of each AI model per process, handed out with reference counts
+
+Author: SSV
+Date: October 2026
+"""
+
+import gc
+import threading
+
+from backends import build_pipeline, load_model, resolve_backend
+from metrics import get_metrics
+
+
+class _Entry:
+    __slots__ = ("model", "tokenizer", "backend", "refs")
+
+    def __init__(self, model, tokenizer, backend):
+        self.model = model
+        self.tokenizer = tokenizer
+        self.backend = backend
+        self.refs = 0
+
+
+class ModelRegistry:
+    """Process-wide cache of loaded models keyed by (model name, backend).
+
+    acquire() returns a fresh, cheap pipeline object over the shared weights,
+    so callers can keep their own generation defaults while the model is
+    only loaded once. Each acquire() must be paired with a release(); the
+    weights are dropped when the last user releases them, or straight away
+    with unload().
+    """
+
+    def __init__(self, loader=load_model, builder=build_pipeline):
+        self.loader = loader
+        self.builder = builder
+        self._entries = {}
+        self._loading = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model_name, backend=None):
+        return (model_name, resolve_backend(backend))
+
+    def _entry(self, key):
+        """Return the loaded entry for a key, loading it at most once"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry
+            # One lock per model: loading phi-2 never blocks a gpt2 caller
+            loading = self._loading.setdefault(key, threading.Lock())
+
+        with loading:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is None:
+                with get_metrics().timer("model_load_seconds", model=key[0], backend=key[1]):
+                    model, tokenizer, backend = self.loader(key[0], key[1])
+                entry = _Entry(model, tokenizer, backend)
+                with self._lock:
+                    self._entries[key] = entry
+                    self._loading.pop(key, None)
+        return entry
+
+    def acquire(self, model_name, backend=None, **pipeline_kwargs):
+        """Return a pipeline over the shared model, loading it if needed"""
+        key = self.make_key(model_name, backend)
+        while True:
+            entry = self._entry(key)
+            with self._lock:
+                # An unload() may have raced us between loading and counting
+                if self._entries.get(key) is entry:
+                    entry.refs += 1
+                    break
+        try:
+            pipe = self.builder(entry.model, entry.tokenizer, entry.backend, **pipeline_kwargs)
+        except Exception:
+            self._release_key(key, entry)
+            raise
+        pipe.registry_key = key
+        # Released against this entry, even if the key is reloaded meanwhile
+        pipe.registry_entry = entry
+        return pipe
+
+    def preload(self, model_name, backend=None):
+        """Load a model and pin it until unload(), e.g. before forking workers"""
+        key = self.make_key(model_name, backend)
+        entry = self._entry(key)
+        with self._lock:
+            entry.refs += 1
+        return key
+
+    def release(self, pipe):
+        """Give back a pipeline from acquire(); frees the model after its last user"""
+        key = getattr(pipe, "registry_key", None)
+        if key is None:
+            return False
+        entry = pipe.registry_entry
+        pipe.registry_key = pipe.registry_entry = None
+        return self._release_key(key, entry)
+
+    def _release_key(self, key, entry):
+        if entry is None:
+            return False
+        with self._lock:
+            entry.refs -= 1
+            if entry.refs > 0 or self._entries.get(key) is not entry:
+                return False
+            del self._entries[key]
+        gc.collect()
+        return True
+
+    def unload(self, model_name, backend=None):
+        """Drop a model now, whatever its reference count.
+
+        Pipelines already handed out keep working (they hold the weights
+        themselves); the next acquire() loads a fresh copy.
+        """
+        key = self.make_key(model_name, backend)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        gc.collect()
+        return True
+
+    def prepare_fork(self):
+        """Make loaded weights safe to share with forked child processes.
+
+        Tensor storage is only ever read during inference, so children
+        created with fork() share it copy-on-write. Freezing the garbage
+        collector keeps collections in the children from writing to (and so
+        copying) the pages holding the parent's Python objects.
+        """
+        gc.collect()
+        if hasattr(gc, "freeze"):
+            gc.freeze()
+        return list(self._entries)
+
+    def stats(self):
+        """Return one {model, backend, refs} dict per loaded model"""
+        with self._lock:
+            return [{"model": key[0], "backend": key[1], "refs": entry.refs}
+                    for key, entry in self._entries.items()]
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    """Return the process-wide model registry"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry()
+        return _registry
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Portfolio Model
+Typed, indexed records built once per data version from data.json
+
+Author: SSV
+Date: October 2026
+"""
+
+import re
+from collections import defaultdict
+
+from router import words
+
+# Items shown per page of each listing command
+PAGE_SIZES = {
+    'projects': 5,
+    'skills': 30,
+    'certifications': 10,
+    'experience': 10,
+}
+
+_PAGE = re.compile(r"\bpage\s+(\d+)\b")
+# "projects using python", "projects with react", "projects tagged ml"
+_FILTER = re.compile(r"\b(?:using|with|tagged)\s+(.+?)\s*$")
+
+
+class Project:
+    """One project; `description` is None for plain-string entries"""
+
+    __slots__ = ("name", "description", "tech", "tags", "github")
+
+    def __init__(self, name, description=None, tech=(), tags=(), github=None):
+        self.name = name
+        self.description = description
+        self.tech = tech
+        self.tags = tags
+        self.github = github
+
+    @classmethod
+    def from_entry(cls, entry):
+        if not isinstance(entry, dict):
+            return cls(str(entry))
+        return cls(
+            entry.get('name', 'Unnamed Project'),
+            entry.get('description', 'No description available'),
+            tuple(entry.get('tech') or ()),
+            tuple(entry.get('tags') or ()),
+            entry.get('github'),
+        )
+
+
+class Experience:
+    """One role; `company` is None for plain-string entries"""
+
+    __slots__ = ("role", "company", "duration", "description")
+
+    def __init__(self, role, company=None, duration=None, description=None):
+        self.role = role
+        self.company = company
+        self.duration = duration
+        self.description = description
+
+    @classmethod
+    def from_entry(cls, entry):
+        if not isinstance(entry, dict):
+            return cls(str(entry))
+        return cls(
+            entry.get('role', 'Role'),
+            entry.get('company', 'Company'),
+            entry.get('duration', 'Not specified'),
+            entry.get('description'),
+        )
+
+
+class Page:
+    """A slice of a listing plus where it sits in the whole"""
+
+    __slots__ = ("items", "number", "pages", "total", "start")
+
+    def __init__(self, items, number, pages, total, start):
+        self.items = items
+        self.number = number
+        self.pages = pages
+        self.total = total
+        self.start = start
+
+
+def paginate(items, number=1, size=10):
+    """Return page `number` (1-based, clamped to the last page) of `items`"""
+    total = len(items)
+    pages = max(1, -(-total // size))
+    number = min(max(1, number), pages)
+    start = (number - 1) * size
+    return Page(items[start:start + size], number, pages, total, start)
+
+
+def parse_listing_query(query):
+    """Split a listing command into (page number, filter term or None)"""
+    page = 1
+    match = _PAGE.search(query)
+    if match:
+        page = int(match.group(1))
+        query = (query[:match.start()] + query[match.end():]).strip()
+    match = _FILTER.search(query)
+    # "projects using python?" -> "python"; "c++" and "node.js" keep their symbols
+    term = match.group(1).strip(" \t?!.,;:'\"") if match else None
+    return page, term or None
+
+
+class Portfolio:
+    """Normalised portfolio records with per-tech and per-tag project indexes.
+
+    Built once per data snapshot, so renders never re-check entry types and
+    filters are dictionary lookups rather than scans. `vocabulary` holds
+    every word the portfolio uses, which typo correction leaves alone.
+    """
+
+    __slots__ = ("projects", "experience", "skills", "certifications", "by_tech", "by_tag", "vocabulary")
+
+    def __init__(self, projects=(), experience=(), skills=(), certifications=()):
+        self.projects = tuple(projects)
+        self.experience = tuple(experience)
+        self.skills = tuple(skills)
+        self.certifications = tuple(certifications)
+
+        by_tech = defaultdict(list)
+        by_tag = defaultdict(list)
+        for i, project in enumerate(self.projects):
+            for tech in project.tech:
+                by_tech[tech.lower()].append(i)
+            for tag in project.tags:
+                by_tag[tag.lower()].append(i)
+        self.by_tech = {key: tuple(ids) for key, ids in by_tech.items()}
+        self.by_tag = {key: tuple(ids) for key, ids in by_tag.items()}
+
+        texts = [*self.skills, *self.certifications]
+        for project in self.projects:
+            texts += [project.name, project.description or "", *project.tech, *project.tags]
+        for job in self.experience:
+            texts += [job.role, job.company or "", job.description or ""]
+        self.vocabulary = frozenset(word for text in texts for word in words(str(text)))
+
+    @classmethod
+    def from_data(cls, data):
+        return cls(
+            (Project.from_entry(entry) for entry in data.get('projects') or ()),
+            (Experience.from_entry(entry) for entry in data.get('experience') or ()),
+            (str(skill) for skill in data.get('skills') or ()),
+            (str(cert) for cert in data.get('certifications') or ()),
+        )
+
+    def filters_by(self, term):
+        """True if `term` is a tech or tag some project has"""
+        key = term.lower()
+        return key in self.by_tech or key in self.by_tag
+
+    def projects_matching(self, term):
+        """Projects whose tech or tags include `term` (case-insensitive), in data order"""
+        key = term.lower()
+        ids = set(self.by_tech.get(key, ())) | set(self.by_tag.get(key, ()))
+        return tuple(self.projects[i] for i in sorted(ids))
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Prompt Prefix Caching
+Reuses the attention key/value cache of the persona preamble and history
+
+Author: SSV
+Date: October 2026
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+
+from batching import pipeline_generate
+from config import get_setting
+from stopping import apply_sentence_budget
+
+
+class PrefixCache:
+    """past_key_values for constant prompt prefixes.
+
+    prepare() runs a prefix through the model once (again only when the
+    prefix text changes, i.e. on a new persona); generate() then prefills
+    just the tokens after the longest cached prefix of its prompt. The
+    last prefix token is left out of the cache so that BPE merges across
+    the prefix/question boundary can never make the cached tokens disagree
+    with the full prompt's tokens.
+
+    The persona is cached under the key None; a conversation caches its
+    persona-plus-history prefix under its own key. When a prefix extends
+    an entry (the same conversation one turn later, or its first turn
+    after the persona) only the new tokens are run through the model, so
+    a growing history costs one turn's prefill, not the whole history's.
+    An entry's memory grows with its token count, so once the entries
+    hold more than `max_tokens` tokens the least recently used ones are
+    dropped; conversations should also forget() theirs when they end.
+    """
+
+    def __init__(self, pipe, max_tokens=None):
+        self.pipe = pipe
+        self.max_tokens = get_setting("ai_prefix_cache_tokens") if max_tokens is None else max_tokens
+        # key -> (text, ids, past), least recently used first
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.tokens = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.reused_tokens = 0
+        self.extensions = 0
+
+    def prepare(self, prefix, key=None):
+        """Compute the cache for a prefix under `key` unless it is already current"""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == prefix:
+            return False
+        import torch
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == prefix:
+                return False
+            ids = self.pipe.tokenizer(prefix, return_tensors="pt").input_ids[:, :-1]
+            start, past = 0, None
+            for base in (entry, self._entries.get(None)):
+                if base is None or not prefix.startswith(base[0]):
+                    continue
+                cached = base[1].shape[1]
+                if ids.shape[1] >= cached and torch.equal(ids[0, :cached], base[1][0]):
+                    # The model appends to the cache it is given; the base stays as it was
+                    start, past = cached, copy.deepcopy(base[2])
+                    break
+            if ids.shape[1] > start:
+                with torch.no_grad():
+                    past = self.pipe.model(ids[:, start:], past_key_values=past, use_cache=True).past_key_values
+            if start:
+                self.extensions += 1
+            if entry is not None:
+                self.tokens -= entry[1].shape[1]
+            self._entries[key] = (prefix, ids, past)
+            self._entries.move_to_end(key)
+            self.tokens += ids.shape[1]
+            # The entry just added is kept even if it alone is over the limit
+            while self.tokens > self.max_tokens and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self.tokens -= evicted[1].shape[1]
+        return True
+
+    def forget(self, key):
+        """Drop a conversation's entry (e.g. when its session ends)"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.tokens -= entry[1].shape[1]
+
+    def _longest_prefix(self, prompt):
+        with self._lock:
+            best_key, best = None, None
+            for key, entry in self._entries.items():
+                if prompt.startswith(entry[0]) and (best is None or len(entry[0]) > len(best[0])):
+                    best_key, best = key, entry
+            if best is not None:
+                self._entries.move_to_end(best_key)
+        return best
+
+    def generate(self, prompt, **generate_kwargs):
+        """Generate for a prompt starting with a cached prefix.
+
+        Returns output shaped like the pipeline's, or None when the prompt
+        does not start with any cached prefix's tokens.
+        """
+        import torch
+
+        entry = self._longest_prefix(prompt)
+        if entry is None:
+            self.misses += 1
+            return None
+        _, ids, past = entry
+
+        tokenizer = self.pipe.tokenizer
+        input_ids = tokenizer(prompt, return_tensors="pt").input_ids
+        cached = ids.shape[1]
+        if input_ids.shape[1] <= cached or not torch.equal(input_ids[0, :cached], ids[0]):
+            self.misses += 1
+            return None
+
+        generate_kwargs = apply_sentence_budget(self.pipe, dict(generate_kwargs))
+        # A pipeline option; the prompt is already within the model's context
+        generate_kwargs.pop("truncation", None)
+        with torch.no_grad():
+            # generate() appends to the cache it is given, so each call gets a copy
+            output = self.pipe.model.generate(
+                input_ids,
+                attention_mask=torch.ones_like(input_ids),
+                past_key_values=copy.deepcopy(past),
+                **generate_kwargs
+            )
+        self.hits += 1
+        self.reused_tokens += cached
+        answer = tokenizer.decode(output[0, input_ids.shape[1]:], skip_special_tokens=True)
+        return [{"generated_text": prompt + answer}]
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "reused_tokens": self.reused_tokens,
+                "extensions": self.extensions, "entries": len(self._entries), "tokens": self.tokens}
+
+
+def prefix_generate(pipe, prefix_cache):
+    """Adapt a pipeline for MicroBatcher, serving lone prompts from the prefix cache.
+
+    Batches of several prompts still go through the batched pipeline: with
+    left padding their prefixes sit at different positions, so one cached
+    prefix cannot be shared across the batch.
+    """
+    batched = pipeline_generate(pipe)
+
+    def generate(prompts, **kwargs):
+        if len(prompts) == 1 and kwargs.get("num_return_sequences", 1) == 1:
+            output = prefix_cache.generate(prompts[0], **kwargs)
+            if output is not None:
+                return [output]
+        return batched(prompts, **kwargs)
+    return generate
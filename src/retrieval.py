@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Retrieval Index
+BM25 search over every field of data.json, used to ground AI prompts
+
+Author: SSV
+Date: October 2026
+"""
+
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+
+# Question words that would otherwise match almost nothing useful
+STOPWORDS = frozenset("""
+a an and are as at be by can did do does for from have how i in is it me my
+of on or tell the to was what when where which who why with you your about
+""".split())
+
+# Keys rendered elsewhere in the prompt or not useful as evidence
+SKIPPED_KEYS = frozenset({"name", "title"})
+
+
+# Crude suffix stripping so 'projects'/'project' and 'graduate'/'graduating' meet
+_SUFFIXES = ("ings", "ing", "ions", "ion", "ed", "es", "s", "e")
+
+
+def stem(token):
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            return token[:-len(suffix)]
+    return token
+
+
+def tokenize(text):
+    """Lowercase, stemmed word tokens minus stopwords"""
+    return [stem(token) for token in _TOKEN.findall(text.lower()) if token not in STOPWORDS]
+
+
+class Snippet:
+    """One retrievable fact taken from the portfolio data"""
+
+    __slots__ = ("kind", "text", "item")
+
+    def __init__(self, kind, text, item=None):
+        self.kind = kind
+        self.text = text
+        self.item = item
+
+    def __repr__(self):
+        return f"Snippet({self.kind!r}, {self.text!r})"
+
+
+def _label(key):
+    return key.replace('_', ' ').capitalize()
+
+
+def iter_snippets(data):
+    """Turn portfolio data into one snippet per fact"""
+    for key, value in data.items():
+        if key in SKIPPED_KEYS or not value:
+            continue
+        if key == 'projects':
+            for project in value:
+                if isinstance(project, dict):
+                    text = f"Project {project.get('name', 'Unnamed Project')}: {project.get('description', '')}"
+                    if project.get('tech'):
+                        text += f" Tech: {', '.join(project['tech'])}."
+                    if project.get('github'):
+                        text += f" GitHub: {project['github']}"
+                    yield Snippet('project', text, project)
+                else:
+                    yield Snippet('project', f"Project {project}", project)
+        elif key == 'experience':
+            for exp in value:
+                if isinstance(exp, dict):
+                    text = (f"Worked as {exp.get('role', 'Role')} at {exp.get('company', 'Company')} "
+                            f"({exp.get('duration', 'Not specified')}). {exp.get('description', '')}")
+                    yield Snippet('experience', text.strip(), exp)
+                else:
+                    yield Snippet('experience', f"Worked as {exp}", exp)
+        elif key == 'skills':
+            for skill in value:
+                yield Snippet('skill', f"Skill: {skill}", skill)
+        elif key in ('school', 'degree', 'graduation_year'):
+            continue
+        elif isinstance(value, list):
+            kind = key.rstrip('s')
+            for item in value:
+                yield Snippet(kind, f"{_label(key)}: {item}", item)
+        elif isinstance(value, dict):
+            details = ', '.join(f"{name}: {link}" for name, link in value.items() if link)
+            yield Snippet(key, f"{_label(key)}: {details}", value)
+        else:
+            yield Snippet(key, f"{_label(key)}: {value}", value)
+
+    if any(data.get(key) for key in ('school', 'degree', 'graduation_year')):
+        text = (f"Education: {data.get('degree', 'a degree')} at {data.get('school', 'university')}, "
+                f"graduating {data.get('graduation_year', 'soon')}")
+        yield Snippet('education', text)
+
+
+class RetrievalIndex:
+    """Okapi BM25 over the portfolio's snippets, built once per data version"""
+
+    def __init__(self, snippets, k1=1.5, b=0.75):
+        self.snippets = list(snippets)
+        self.k1 = k1
+        self.b = b
+        self._postings = defaultdict(list)
+        lengths = []
+        for doc_id, snippet in enumerate(self.snippets):
+            terms = Counter(tokenize(snippet.text))
+            lengths.append(sum(terms.values()))
+            for term, freq in terms.items():
+                self._postings[term].append((doc_id, freq))
+        self._lengths = lengths
+        average = sum(lengths) / len(lengths) if lengths else 0.0
+        # Per-document length normalisation is constant, so precompute it
+        self._norms = [k1 * (1 - b + b * length / average) if average else k1 for length in lengths]
+        count = len(self.snippets)
+        self._idf = {
+            term: math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._postings.items()
+        }
+
+    @classmethod
+    def from_data(cls, data):
+        return cls(iter_snippets(data))
+
+    def __len__(self):
+        return len(self.snippets)
+
+    def search(self, query, k=4, kinds=None):
+        """Return up to k snippets most relevant to the query, best first"""
+        scores = defaultdict(float)
+        for term in set(tokenize(query)):
+            idf = self._idf.get(term)
+            if idf is None:
+                continue
+            for doc_id, freq in self._postings[term]:
+                scores[doc_id] += idf * freq * (self.k1 + 1) / (freq + self._norms[doc_id])
+
+        if kinds is not None:
+            scores = {doc_id: score for doc_id, score in scores.items()
+                      if self.snippets[doc_id].kind in kinds}
+        best = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [self.snippets[doc_id] for doc_id, _ in best]
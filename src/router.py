@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Keyword Router
+Matches every command alias against a query in a single pass, with a
+typo-tolerant fallback index
+
+Author: SSV
+Date: October 2026
+"""
+
+import re
+from collections import deque
+
+# Letters only, accented ones included ('resumé'); no digits or underscores
+_WORD = re.compile(r"[^\W\d_]+")
+
+
+def words(text):
+    """Lowercased words of text"""
+    return _WORD.findall(text.lower())
+
+
+class KeywordRouter:
+    """Aho-Corasick automaton over all command aliases.
+
+    Aliases keep the priority they were registered with: when several of
+    them occur in a query the earliest-registered one wins, no matter where
+    it appears in the text. Matching is plain substring matching, so 'work'
+    still fires inside 'network' and 'cv' inside longer words.
+
+    build() compiles the trie into a deterministic automaton (failure links
+    folded into each state's transitions) that records, per state, the
+    best priority of every alias ending there. match() is then one dict
+    lookup per character of the query, however many aliases there are,
+    and stops early once the top-priority alias is seen.
+    """
+
+    def __init__(self, routes=()):
+        self._priority = {}
+        self._targets = []
+        self._aliases = []
+        self._steps = None
+        self._best = None
+        for alias, target in routes:
+            self.add(alias, target)
+
+    def add(self, alias, target):
+        """Register an alias; re-adding one keeps its priority but swaps the target"""
+        alias = alias.lower()
+        if not alias:
+            raise ValueError("alias must be a non-empty string")
+        if alias in self._priority:
+            self._targets[self._priority[alias]] = target
+        else:
+            self._priority[alias] = len(self._aliases)
+            self._aliases.append(alias)
+            self._targets.append(target)
+        self._steps = None
+
+    def aliases(self):
+        """Return registered aliases in priority order"""
+        return list(self._aliases)
+
+    def __len__(self):
+        return len(self._aliases)
+
+    def __contains__(self, alias):
+        return alias.lower() in self._priority
+
+    def build(self):
+        """Compile the automaton and each state's best (lowest) alias priority"""
+        none = len(self._aliases)
+        goto = [{}]
+        best = [none]
+        for priority, alias in enumerate(self._aliases):
+            state = 0
+            for char in alias:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][char] = nxt
+                    goto.append({})
+                    best.append(none)
+                state = nxt
+            best[state] = min(best[state], priority)
+
+        # Breadth first, so a state's failure state is complete before it is
+        # copied: every state gets its failure state's transitions (then its
+        # own on top) and reports the aliases its failure state reports
+        delta = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for char, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(char, 0)
+                best[nxt] = min(best[nxt], best[fail[nxt]])
+                queue.append(nxt)
+
+        self._steps = [transitions.get for transitions in delta]
+        self._best = best
+        return self
+
+    def match(self, text):
+        """Return (alias, target) for the highest-priority alias in text, or None"""
+        if self._steps is None:
+            self.build()
+        steps, best = self._steps, self._best
+
+        state = 0
+        found = none = len(self._aliases)
+        for char in text:
+            state = steps[state](char, 0)
+            if best[state] < found:
+                found = best[state]
+                if not found:
+                    break
+
+        if found == none:
+            return None
+        return self._aliases[found], self._targets[found]
+
+
+def edit_distance(a, b, limit):
+    """Optimal string alignment distance (adjacent swaps cost 1), or limit + 1 if over"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def _deletes(word, depth):
+    """Every string made by removing up to `depth` characters from word"""
+    found = {word}
+    frontier = {word}
+    for _ in range(depth):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        found |= frontier
+    return found
+
+
+class FuzzyIndex:
+    """Symmetric-delete (SymSpell style) spelling index over command aliases.
+
+    Every alias is stored under all the strings its deletions produce, so
+    a misspelt word is looked up through its own deletions: a few dozen
+    dict probes, however many aliases there are, instead of an edit
+    distance against each. Short aliases tolerate fewer mistakes so
+    ordinary words aren't "corrected" to them: none for 'cv' or 'job',
+    only swapped letters for four-letter ones ('hlep', but not 'into'), no
+    swapped-in letter for five-letter ones ('skils', but not 'stars' or
+    'funky'), and two mistakes only from nine letters on.
+
+    Only command-shaped queries are corrected: known words (`ignore`, plus
+    any vocabulary passed to match()) are never corrected, and a query with
+    more than MAX_UNKNOWN_WORDS other words is a sentence, not a misspelt
+    command ('sign the contract' is left alone).
+    """
+
+    # Words seen recently, corrected or not; visitors repeat themselves a lot
+    MEMO_SIZE = 4096
+    MAX_UNKNOWN_WORDS = 2
+
+    def __init__(self, routes=(), ignore=()):
+        self._aliases = []
+        self._targets = []
+        self._ignore = frozenset(word.lower() for word in ignore)
+        self._deletes = None
+        self._memo = {}
+        for alias, target in routes:
+            self.add(alias, target)
+
+    @staticmethod
+    def max_distance(length):
+        """Typos tolerated in a word of this length"""
+        if length <= 3:
+            return 0
+        return 1 if length <= 8 else 2
+
+    def add(self, alias, target):
+        alias = alias.lower()
+        if alias not in self._aliases:
+            self._aliases.append(alias)
+            self._targets.append(target)
+            self._deletes = None
+            self._memo = {}
+
+    def build(self):
+        deletes = {}
+        for priority, alias in enumerate(self._aliases):
+            for variant in _deletes(alias, self.max_distance(len(alias))):
+                deletes.setdefault(variant, []).append(priority)
+        self._deletes = deletes
+        return self
+
+    def correct(self, word):
+        """Return (alias, target, distance) for the closest alias to word, or None"""
+        word = word.lower()
+        memo = self._memo
+        if word in memo:
+            return memo[word]
+        if len(memo) >= self.MEMO_SIZE:
+            memo.clear()
+        found = memo[word] = self._lookup(word)
+        return found
+
+    def _lookup(self, word):
+        if self._deletes is None:
+            self.build()
+        limit = self.max_distance(len(word))
+        if not limit or word in self._ignore:
+            return None
+        candidates = set()
+        for variant in _deletes(word, limit):
+            candidates.update(self._deletes.get(variant, ()))
+        best = None
+        for priority in candidates:
+            alias = self._aliases[priority]
+            allowed = min(limit, self.max_distance(len(alias)))
+            distance = edit_distance(word, alias, allowed)
+            if distance > allowed:
+                continue
+            # Four letters or fewer: swaps only; five: no letter swapped for another
+            shortest = min(len(word), len(alias))
+            if distance and sorted(word) != sorted(alias) and (
+                    shortest <= 4 or shortest == 5 and len(word) == len(alias)):
+                continue
+            if best is None or (distance, priority) < best:
+                best = (distance, priority)
+        if best is None:
+            return None
+        return self._aliases[best[1]], self._targets[best[1]], best[0]
+
+    def match(self, text, known=()):
+        """Correct the unknown words of a command-shaped text.
+
+        Returns (typed, alias, target) for the best fix, or None. `known`
+        holds more real words to leave alone, e.g. the portfolio's own.
+        """
+        unknown = [word for word in words(text) if word not in self._ignore and word not in known]
+        if len(unknown) > self.MAX_UNKNOWN_WORDS:
+            return None
+        best = None
+        for word in unknown:
+            found = self.correct(word)
+            if found is None:
+                continue
+            alias, target, distance = found
+            key = (distance, self._aliases.index(alias))
+            if best is None or key < best[0]:
+                best = (key, (word, alias, target))
+        return best[1] if best else None
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Botfolio Session Server
+Serves many chat sessions from one assistant over TCP or a Unix socket
+
+Protocol: one query per line. Each response is sent as text lines and
+terminated by a line holding a single '.'; response lines starting with
+'.' get an extra '.' prepended (as in SMTP). AI answers are streamed, so
+their text may arrive in pieces before the terminating line.
+
+Author: SSV
+Date: October 2026
+"""
+
+import argparse
+import asyncio
+import codecs
+import functools
+import os
+import signal
+import socket
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config import get_setting
+from metrics import add_metrics_arguments, configure_metrics
+from models import get_registry
+
+EXIT_COMMANDS = ('exit', 'quit', 'bye', 'goodbye')
+
+
+class ResponseFramer:
+    """Incrementally frames (possibly streamed) response text for the wire"""
+
+    def __init__(self):
+        self.at_line_start = True
+        self.started = False
+
+    def chunk(self, text):
+        """Encode the next piece of a response"""
+        self.started = True
+        out = []
+        for i, line in enumerate(text.split('\n')):
+            if i:
+                out.append('\n')
+                self.at_line_start = True
+            if line:
+                if self.at_line_start and line.startswith('.'):
+                    out.append('.')
+                out.append(line)
+                self.at_line_start = False
+        return ''.join(out).encode('utf-8')
+
+    def end(self):
+        """Encode the end-of-response marker"""
+        return b'\n.\n'
+
+
+def encode_response(text):
+    """Frame a complete response for the wire"""
+    framer = ResponseFramer()
+    return framer.chunk(text) + framer.end()
+
+
+async def read_response(reader):
+    """Read one framed response; returns None if the connection closed"""
+    lines = []
+    while True:
+        raw = await reader.readline()
+        if not raw:
+            return None
+        line = raw.decode('utf-8').rstrip('\n')
+        if line == '.':
+            return '\n'.join(lines)
+        lines.append(line[1:] if line.startswith('..') else line)
+
+
+async def iter_response(reader):
+    """Yield one response's text as it arrives (for showing streamed answers)"""
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    # A virtual newline lets the first line be handled like every other one
+    buffer = '\n'
+    first = True
+    while True:
+        data = await reader.read(4096)
+        if not data:
+            return
+        buffer += decoder.decode(data)
+        end = buffer.find('\n.\n')
+        done = end >= 0
+        if done:
+            ready, buffer = buffer[:end], ''
+        else:
+            # Keep a trailing newline (and dot) until we know what follows it
+            cut = len(buffer)
+            if buffer.endswith('\n'):
+                cut -= 1
+            elif buffer.endswith('\n.'):
+                cut -= 2
+            ready, buffer = buffer[:cut], buffer[cut:]
+        ready = ready.replace('\n..', '\n.')
+        if first and ready:
+            ready = ready[1:]
+            first = False
+        if ready:
+            yield ready
+        if done:
+            return
+
+
+class PortfolioServer:
+    """asyncio front end multiplexing sessions over one shared assistant.
+
+    Keyword commands are answered inline on the event loop (they are dict
+    lookups once rendered); AI questions run on a small thread pool so a
+    slow generation never holds up anyone's 'skills' or 'contact'.
+
+    Given a TenantRegistry instead of an assistant, each session starts
+    by naming the portfolio it wants and is then served by that tenant.
+    """
+
+    def __init__(self, assistant=None, ai_workers=None, max_pending_ai=None, tenants=None):
+        self.assistant = assistant
+        self.tenants = tenants
+        self.ai_workers = ai_workers or get_setting("server_ai_workers")
+        self.max_pending_ai = max_pending_ai or get_setting("server_max_pending_ai")
+        self.executor = ThreadPoolExecutor(max_workers=self.ai_workers, thread_name_prefix="botfolio-ai")
+        self.pending_ai = 0
+        self.sessions = 0
+        self.server = None
+
+    async def respond(self, text, stream=None, session=None, assistant=None):
+        """Answer one query without blocking the event loop on the model.
+
+        For AI questions `stream` is called (from a worker thread) with
+        each piece of the answer as it is generated. `session` holds the
+        visitor's conversation state (e.g. which listing 'next' continues).
+        """
+        assistant = assistant or self.assistant
+        if session is None:
+            session = {}
+        # Routed once; get_response() answers by this decision
+        route = assistant.route(text, session)
+        if route.handler != 'ai':
+            return assistant.get_response(text, session=session, route=route)
+
+        if self.pending_ai >= self.max_pending_ai:
+            return "⏳ The AI is busy answering other visitors. Please try again in a moment!"
+        self.pending_ai += 1
+        try:
+            loop = asyncio.get_running_loop()
+            answer = functools.partial(assistant.get_response, text, stream=stream, session=session, route=route)
+            return await loop.run_in_executor(self.executor, answer)
+        finally:
+            self.pending_ai -= 1
+
+    async def choose_tenant(self, reader, writer):
+        """Ask until the client names a hosted portfolio; None if it leaves"""
+        loop = asyncio.get_running_loop()
+        writer.write(encode_response("🤖 Welcome to Botfolio! Whose portfolio would you like to see?"))
+        await writer.drain()
+        while True:
+            raw = await reader.readline()
+            if not raw:
+                return None
+            name = raw.decode('utf-8', errors='replace').strip()
+            if not name:
+                continue
+            if name.lower() in EXIT_COMMANDS:
+                return None
+            try:
+                # Loading reads the tenant's file, so keep it off the loop
+                return await loop.run_in_executor(None, self.tenants.get, name)
+            except KeyError:
+                known = ", ".join(self.tenants.names()[:10]) or "none yet"
+                message = f"❓ There's no portfolio called '{name}'. Try one of: {known}"
+            except ValueError as e:
+                message = f"❌ That portfolio can't be shown right now: {e}"
+            writer.write(encode_response(message))
+            await writer.drain()
+
+    async def handle_session(self, reader, writer):
+        """Serve one connected client until it leaves"""
+        self.sessions += 1
+        session = {}
+        loop = asyncio.get_running_loop()
+        assistant = self.assistant
+        try:
+            if self.tenants is not None:
+                assistant = await self.choose_tenant(reader, writer)
+                if assistant is None:
+                    return
+            name = assistant.data.get('name', 'My')
+            writer.write(encode_response(f"🤖 Welcome to {name} Botfolio Assistant! Type 'help' to begin."))
+            await writer.drain()
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                text = raw.decode('utf-8', errors='replace').strip()
+                if not text:
+                    continue
+                if text.lower() in EXIT_COMMANDS:
+                    writer.write(encode_response("👋 Thanks for chatting! Don't forget to star this repo! ⭐"))
+                    await writer.drain()
+                    break
+
+                framer = ResponseFramer()
+
+                def stream(chunk):
+                    # Runs on an AI worker thread; writes are hopped onto the loop in order
+                    loop.call_soon_threadsafe(writer.write, framer.chunk(chunk))
+
+                try:
+                    response = await self.respond(text, stream=stream, session=session, assistant=assistant)
+                except Exception as e:
+                    response = f"❌ An error occurred: {e}"
+                if framer.started:
+                    writer.write(framer.end())
+                else:
+                    writer.write(encode_response(response))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.sessions -= 1
+            if assistant is not None:
+                assistant.end_session(session)
+            writer.close()
+
+    async def start(self, host='127.0.0.1', port=8765, unix_path=None, sock=None):
+        """Start listening (or accept on an inherited socket); returns the asyncio server"""
+        if sock is not None:
+            self.server = await asyncio.start_server(self.handle_session, sock=sock)
+        elif unix_path:
+            self.server = await asyncio.start_unix_server(self.handle_session, path=unix_path)
+        else:
+            self.server = await asyncio.start_server(self.handle_session, host, port)
+        return self.server
+
+    async def close(self):
+        """Stop accepting sessions and shut the AI pool down"""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        self.executor.shutdown(wait=False)
+
+    async def serve_forever(self, host='127.0.0.1', port=8765, unix_path=None, sock=None):
+        server = await self.start(host, port, unix_path, sock)
+        if sock is None:
+            where = unix_path or ', '.join(str(listener.getsockname()) for listener in server.sockets)
+            print(f"🌐 Botfolio server listening on {where}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.close()
+
+
+def listen_socket(host='127.0.0.1', port=8765, unix_path=None):
+    """Create the listening socket that forked workers accept on"""
+    if unix_path:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if os.path.exists(unix_path):
+            os.unlink(unix_path)
+        sock.bind(unix_path)
+    else:
+        family = socket.AF_INET6 if ':' in host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host, port))
+    sock.listen(128)
+    sock.setblocking(False)
+    return sock
+
+
+def serve_preforked(assistant, processes, host='127.0.0.1', port=8765, unix_path=None, tenants=None):
+    """Serve from several forked processes sharing one copy of the model.
+
+    The model is loaded in the parent before forking, so every worker maps
+    the same weight pages copy-on-write instead of loading its own copy.
+    """
+    if tenants is not None:
+        tenants.ai_engine.load()
+    else:
+        assistant.load_ai()
+    get_registry().prepare_fork()
+    sock = listen_socket(host, port, unix_path)
+    print(f"🌐 Botfolio server listening on {unix_path or sock.getsockname()} with {processes} processes")
+
+    children = []
+    for _ in range(processes):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                # Threads do not survive fork(), so each worker watches data.json itself
+                if assistant is not None:
+                    assistant.store.watch()
+                asyncio.run(PortfolioServer(assistant, tenants=tenants).serve_forever(sock=sock))
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os._exit(0)
+        children.append(pid)
+
+    sock.close()
+    try:
+        for pid in children:
+            os.waitpid(pid, 0)
+    except KeyboardInterrupt:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        raise
+
+
+async def run_client(host='127.0.0.1', port=8765, unix_path=None):
+    """Minimal interactive client for trying the server locally"""
+    if unix_path:
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    loop = asyncio.get_running_loop()
+    try:
+        greeting = await read_response(reader)
+        print(greeting)
+        while True:
+            try:
+                line = await loop.run_in_executor(None, input, "\nAsk me something: ")
+            except EOFError:
+                break
+            writer.write((line + '\n').encode('utf-8'))
+            await writer.drain()
+            print()
+            async for text in iter_response(reader):
+                print(text, end="", flush=True)
+            print()
+            if reader.at_eof():
+                break
+            if line.strip().lower() in EXIT_COMMANDS:
+                break
+    finally:
+        writer.close()
+
+
+def main(argv=None):
+    """Run the session server (or a local client with --client)"""
+    parser = argparse.ArgumentParser(prog="botfolio-server", description="Serve Botfolio to many sessions at once")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", metavar="PATH", help="listen on (or connect to) a Unix socket instead of TCP")
+    parser.add_argument("--client", action="store_true", help="connect to a running server interactively")
+    parser.add_argument("--warm-ai", action="store_true", help="load the AI model in the background at startup")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="serve from N forked processes sharing one loaded model (Unix only)")
+    parser.add_argument("--tenants", metavar="DIR",
+                        help="host every portfolio in DIR (NAME.json); sessions pick one by NAME")
+    add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+    configure_metrics(args)
+
+    try:
+        if args.client:
+            asyncio.run(run_client(args.host, args.port, args.unix))
+            return
+
+        from assistant import PortfolioAssistant
+
+        tenants = None
+        if args.tenants:
+            from tenants import TenantRegistry
+
+            if not os.path.isdir(args.tenants):
+                parser.error(f"--tenants: {args.tenants} is not a directory")
+            tenants = TenantRegistry(args.tenants)
+
+        if args.processes > 1:
+            if not hasattr(os, "fork"):
+                parser.error("--processes needs a platform with fork()")
+            if get_setting("ai_worker_processes") > 0:
+                # The pool's dispatcher thread would not survive the fork
+                parser.error("--processes can't be combined with BOTFOLIO_AI_WORKER_PROCESSES")
+            assistant = None if tenants else PortfolioAssistant()
+            serve_preforked(assistant, args.processes, args.host, args.port, args.unix, tenants)
+            return
+
+        if tenants is not None:
+            if args.warm_ai:
+                threading.Thread(target=tenants.ai_engine.load, name="botfolio-ai-warmup", daemon=True).start()
+            asyncio.run(PortfolioServer(tenants=tenants).serve_forever(args.host, args.port, args.unix))
+            return
+
+        assistant = PortfolioAssistant(warm_ai=args.warm_ai)
+        assistant.store.watch()
+        asyncio.run(PortfolioServer(assistant).serve_forever(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        print("\n👋 Server stopped.")
+    except OSError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
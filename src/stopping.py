@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Generation Stopping
+Ends AI generation once the answer has used up its sentence budget
+
+Author: SSV
+Date: October 2026
+"""
+
+import re
+
+
+def _version(text):
+    """'4.38.2' -> (4, 38); pre-release suffixes are ignored"""
+    parts = []
+    for part in text.split(".")[:2]:
+        digits = re.match(r"\d*", part).group()
+        parts.append(int(digits or 0))
+    return tuple(parts)
+
+
+def sentence_stopping(tokenizer, max_sentences):
+    """Build a fresh StoppingCriteriaList that stops each sequence after
+    `max_sentences` full stops.
+
+    A new list is needed per generate call because it keeps per-sequence
+    counts. Full stops are counted exactly as clean_response splits them,
+    so the model stops where the old post-hoc trimming would have cut.
+    """
+    import torch
+    import transformers
+    from transformers import StoppingCriteria, StoppingCriteriaList
+
+    # Before 4.39 a criterion answers for the whole batch with one bool
+    per_row = _version(transformers.__version__) >= (4, 39)
+
+    class SentenceBudget(StoppingCriteria):
+        def __init__(self):
+            self.counts = None
+
+        def __call__(self, input_ids, scores, **kwargs):
+            if self.counts is None:
+                self.counts = [0] * input_ids.shape[0]
+            # Only the newest token is decoded at each step
+            for row, text in enumerate(tokenizer.batch_decode(input_ids[:, -1:])):
+                self.counts[row] += text.count('.')
+            done = [count >= max_sentences for count in self.counts]
+            if not per_row:
+                # Finished rows run on until the last one is done; the
+                # answer cleanup trims their extra sentences
+                return all(done)
+            return torch.tensor(done, dtype=torch.bool, device=input_ids.device)
+
+    return StoppingCriteriaList([SentenceBudget()])
+
+
+def apply_sentence_budget(pipe, generate_kwargs):
+    """Turn a `max_sentences` option into stopping criteria for one call"""
+    max_sentences = generate_kwargs.pop("max_sentences", None)
+    if max_sentences:
+        generate_kwargs["stopping_criteria"] = sentence_stopping(pipe.tokenizer, max_sentences)
+    return generate_kwargs
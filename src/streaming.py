@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Streaming Output
+Token-by-token AI responses with incremental cleanup
+
+Author: SSV
+Date: October 2026
+"""
+
+import threading
+
+from stopping import apply_sentence_budget
+
+# Prompt-format words the model tends to echo back
+ARTIFACTS = ("Answer:", "Question:")
+
+
+class StreamCleaner:
+    """Incremental version of AIChat.clean_response.
+
+    Strips leading whitespace and prompt-format artifacts from streamed
+    text, and stops once `max_sentences` full stops have been emitted. A
+    few characters are held back whenever the text so far could be the
+    start of an artifact, so nothing has to be taken back later.
+    """
+
+    def __init__(self, max_sentences=3, artifacts=ARTIFACTS):
+        self.max_sentences = max_sentences
+        self.artifacts = artifacts
+        self.sentences = 0
+        self.started = False
+        self.done = False
+        self.pending = ""
+        self.text = ""
+
+    def _held_back(self, buffer):
+        """Length of the buffer's tail that could still grow into an artifact"""
+        hold = 0
+        for artifact in self.artifacts:
+            for size in range(min(len(artifact) - 1, len(buffer)), hold, -1):
+                if buffer.endswith(artifact[:size]):
+                    hold = size
+                    break
+        return hold
+
+    def feed(self, chunk):
+        """Take newly generated text; return the part that is safe to show"""
+        if self.done:
+            return ""
+        buffer = self.pending + chunk
+        for artifact in self.artifacts:
+            buffer = buffer.replace(artifact, "")
+        hold = self._held_back(buffer)
+        emit, self.pending = buffer[:len(buffer) - hold], buffer[len(buffer) - hold:]
+        return self._emit(emit)
+
+    def finish(self):
+        """Flush whatever was held back once generation ends"""
+        if self.done:
+            return ""
+        tail, self.pending = self.pending, ""
+        emitted = self._emit(tail)
+        self.done = True
+        return emitted
+
+    def _emit(self, text):
+        if not self.started:
+            text = text.lstrip()
+            if not text:
+                return ""
+            self.started = True
+
+        if self.max_sentences:
+            start = 0
+            while True:
+                stop = text.find('.', start)
+                if stop < 0:
+                    break
+                self.sentences += 1
+                if self.sentences >= self.max_sentences:
+                    text = text[:stop + 1]
+                    self.done = True
+                    self.pending = ""
+                    break
+                start = stop + 1
+
+        self.text += text
+        return text
+
+    def result(self):
+        """Final cleaned answer, minus any incomplete trailing sentence"""
+        response = self.text.strip()
+        if response and not response.endswith(('.', '!', '?')):
+            last_period = response.rfind('.')
+            if last_period > 0:
+                response = response[:last_period + 1]
+        return response
+
+
+def stream_pipeline(pipe, prompt, prefix_cache=None, **generate_kwargs):
+    """Yield decoded text from a text-generation pipeline as tokens arrive.
+
+    Generation runs in a background thread feeding a TextIteratorStreamer;
+    the prompt itself is never echoed. With a PrefixCache, a prompt that
+    starts with a cached prefix prefills only the tokens after it.
+    """
+    from transformers import TextIteratorStreamer
+
+    generate_kwargs = apply_sentence_budget(pipe, dict(generate_kwargs))
+
+    streamer = TextIteratorStreamer(pipe.tokenizer, skip_prompt=True, skip_special_tokens=True)
+    failure = []
+
+    def generate():
+        try:
+            if prefix_cache is None or prefix_cache.generate(prompt, streamer=streamer, **generate_kwargs) is None:
+                pipe(prompt, streamer=streamer, **generate_kwargs)
+        except Exception as e:
+            failure.append(e)
+            streamer.end()
+
+    thread = threading.Thread(target=generate, name="botfolio-ai-stream", daemon=True)
+    thread.start()
+    for text in streamer:
+        yield text
+    if failure:
+        raise failure[0]
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Tenant Registry
+Hosts many portfolios in one process, sharing a single AI model between them
+
+Each tenant is a JSON file in the tenants directory (`alice.json` is the
+tenant 'alice'), loaded the first time someone asks for it. Tenants keep
+their own data snapshot and rendered sections, and each visitor's AI
+conversation lives in their own server session; the model, its
+micro-batcher and the AI answer cache (keyed by each tenant's data file)
+belong to the registry, so a tenant costs its data plus a few small
+dicts and the least recently used ones are evicted once `capacity` are
+loaded.
+
+Author: SSV
+Date: October 2026
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from assistant import AIEngine, PortfolioAssistant
+from config import get_setting
+from datastore import drop_store, get_store
+
+# Letters, digits, '.', '_' and '-', never starting with '.', so a tenant
+# name can't reach outside the tenants directory
+TENANT_NAME = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]{0,63}")
+
+
+class UnknownTenant(KeyError):
+    """No portfolio file exists for the requested tenant"""
+
+
+class TenantRegistry:
+    """LRU cache of per-tenant assistants over one shared AI engine"""
+
+    def __init__(self, root, capacity=None, model_name=None):
+        self.root = Path(root)
+        self.capacity = max(1, capacity or get_setting("tenant_capacity"))
+        self.check_interval = get_setting("tenant_check_interval")
+        self.ai_engine = AIEngine(model_name or PortfolioAssistant.ai_model_name)
+        self._tenants = OrderedDict()
+        self._checked = {}
+        self._lock = threading.Lock()
+
+        self.loads = 0
+        self.evictions = 0
+
+    def path_for(self, tenant):
+        """Data file for a tenant name; raises UnknownTenant for bad names"""
+        if not TENANT_NAME.fullmatch(tenant or ""):
+            raise UnknownTenant(tenant)
+        return self.root / f"{tenant}.json"
+
+    def names(self):
+        """Every tenant with a data file, loaded or not"""
+        return sorted(path.stem for path in self.root.glob("*.json") if TENANT_NAME.fullmatch(path.stem))
+
+    def get(self, tenant):
+        """Return the tenant's assistant, loading it (and evicting the coldest) if needed.
+
+        Raises UnknownTenant if there is no file for it, and DataError (a
+        ValueError) if the file is malformed.
+        """
+        with self._lock:
+            assistant = self._tenants.get(tenant)
+            if assistant is not None:
+                self._tenants.move_to_end(tenant)
+        if assistant is not None:
+            self._refresh(tenant, assistant)
+            return assistant
+
+        path = self.path_for(tenant)
+        store = get_store(path)
+        try:
+            store.ensure_loaded()
+        except FileNotFoundError:
+            drop_store(path)
+            raise UnknownTenant(tenant) from None
+        except ValueError:
+            drop_store(path)
+            raise
+        loaded = PortfolioAssistant(banner=False, data_path=path, ai_engine=self.ai_engine)
+
+        evicted = []
+        with self._lock:
+            assistant = self._tenants.get(tenant)
+            if assistant is None:
+                # Nobody loaded it while we were reading the file
+                assistant = self._tenants[tenant] = loaded
+                self._checked[tenant] = time.monotonic()
+                self.loads += 1
+                while len(self._tenants) > self.capacity:
+                    evicted.append(self._tenants.popitem(last=False))
+                    self.evictions += 1
+            else:
+                # Same path, same store: only the spare assistant goes
+                loaded.close()
+        for name, old in evicted:
+            self._close(name, old)
+        return assistant
+
+    def _refresh(self, tenant, assistant):
+        """Pick up edits to a tenant's file, at most every check_interval seconds"""
+        now = time.monotonic()
+        if now - self._checked.get(tenant, 0.0) >= self.check_interval:
+            self._checked[tenant] = now
+            assistant.store.check()
+
+    def _close(self, tenant, assistant):
+        self._checked.pop(tenant, None)
+        assistant.close()
+        drop_store(assistant.data_path)
+
+    def evict(self, tenant):
+        """Unload one tenant now; returns False if it wasn't loaded"""
+        with self._lock:
+            assistant = self._tenants.pop(tenant, None)
+        if assistant is None:
+            return False
+        self._close(tenant, assistant)
+        return True
+
+    def close(self):
+        """Unload every tenant and release the shared model"""
+        with self._lock:
+            tenants = list(self._tenants.items())
+            self._tenants.clear()
+        for name, assistant in tenants:
+            self._close(name, assistant)
+        self.ai_engine.close()
+
+    def stats(self):
+        with self._lock:
+            loaded = list(self._tenants)
+        return {"loaded": loaded, "capacity": self.capacity,
+                "loads": self.loads, "evictions": self.evictions}
+
+    def __contains__(self, tenant):
+        return tenant in self._tenants
+
+    def __len__(self):
+        return len(self._tenants)
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+AI Worker Pool
+Runs model generation in separate processes with timeouts and cancellation
+
+Each worker process loads the model once and answers one prompt at a time.
+The parent only queues prompts and waits on futures, so a long generation
+never holds its GIL: the chat loop and keyword commands stay responsive,
+Ctrl-C or a timeout stops just that generation (by restarting its worker),
+and a worker that crashes is replaced without taking the session down.
+
+Author: SSV
+Date: October 2026
+"""
+
+import itertools
+import multiprocessing
+import signal
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from multiprocessing.connection import wait
+
+from config import get_setting
+
+
+class PoolBusy(RuntimeError):
+    """The request queue is full; try again once some answers are done"""
+
+
+class GenerationTimeout(TimeoutError):
+    """A generation ran past its deadline and its worker was restarted"""
+
+
+class GenerationCancelled(RuntimeError):
+    """A running generation was cancelled and its worker was restarted"""
+
+
+class WorkerCrashed(RuntimeError):
+    """The worker process died while generating"""
+
+
+class GenerationInterrupted(KeyboardInterrupt):
+    """Ctrl-C while waiting on the pool; the generation it was waiting for was cancelled"""
+
+
+def pipeline_worker(model_name, max_new_tokens=150):
+    """Worker factory: load the model and return generate(prompt, stream=None, **kwargs)"""
+    from batching import pipeline_generate
+    from models import get_registry
+    from streaming import stream_pipeline
+
+    pipe = get_registry().acquire(model_name, max_new_tokens=max_new_tokens, truncation=True)
+    batch_generate = pipeline_generate(pipe)
+
+    def generate(prompt, stream=None, **kwargs):
+        if stream is None:
+            output = batch_generate([prompt], **kwargs)[0]
+            return output[0]['generated_text'].replace(prompt, "")
+        pieces = []
+        for chunk in stream_pipeline(pipe, prompt, **kwargs):
+            pieces.append(chunk)
+            stream(chunk)
+        return "".join(pieces)
+    return generate
+
+
+def _worker_main(conn, factory, args):
+    """Worker process: build the generator once, then answer prompts until told to stop"""
+    # Ctrl-C reaches the whole terminal process group; the parent decides
+    # which generation (if any) to stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        generate = factory(*args)
+    except Exception as e:
+        conn.send(("failed", None, f"{type(e).__name__}: {e}"))
+        return
+    conn.send(("ready", None, None))
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message is None:
+            return
+        request_id, prompt, kwargs, streamed = message
+
+        def stream(text, request_id=request_id):
+            conn.send(("chunk", request_id, text))
+
+        try:
+            text = generate(prompt, stream=stream if streamed else None, **kwargs)
+            conn.send(("done", request_id, text))
+        except Exception as e:
+            conn.send(("error", request_id, f"{type(e).__name__}: {e}"))
+
+
+class _Request:
+    __slots__ = ("id", "prompt", "kwargs", "future", "stream", "timeout", "deadline", "cancelled")
+
+    def __init__(self, request_id, prompt, kwargs, stream, timeout):
+        self.id = request_id
+        self.prompt = prompt
+        self.kwargs = kwargs
+        self.future = Future()
+        self.stream = stream
+        self.timeout = timeout
+        self.deadline = None
+        self.cancelled = False
+
+
+class _Worker:
+    __slots__ = ("process", "conn", "ready", "request")
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.ready = False
+        self.request = None
+
+
+class WorkerPool:
+    """Fixed set of worker processes fed from a bounded queue.
+
+    `factory(*args)` runs once in every worker and returns the function
+    that answers prompts; it must be importable by name (the default
+    'spawn' start method re-imports it in the child). All process
+    bookkeeping happens on one dispatcher thread, which hands queued
+    requests to idle workers and enforces deadlines and cancellations.
+    """
+
+    def __init__(self, factory=pipeline_worker, args=(), processes=None, timeout=None,
+                 max_pending=None, start_method="spawn"):
+        self.factory = factory
+        self.args = tuple(args)
+        self.processes = max(1, processes or get_setting("ai_worker_processes") or 1)
+        self.timeout = get_setting("ai_timeout") if timeout is None else timeout
+        self.max_pending = max_pending or get_setting("ai_worker_max_pending")
+        self._context = multiprocessing.get_context(start_method)
+        self._pending = deque()
+        self._lock = threading.Lock()
+        self._wake_reader, self._wake_writer = self._context.Pipe(duplex=False)
+        self._ids = itertools.count()
+        self._workers = []
+        self._dispatcher = None
+        self._closed = False
+        self.failure = None
+
+        self.completed = 0
+        self.timeouts = 0
+        self.cancellations = 0
+        self.restarts = 0
+
+    # -- public API, safe from any thread --
+
+    def submit(self, prompt, stream=None, timeout=None, **kwargs):
+        """Queue a prompt; returns a Future for the generated text.
+
+        `stream`, if given, is called with each piece of text as the worker
+        produces it (from the dispatcher thread). Raises PoolBusy when
+        `max_pending` prompts are already waiting for a worker.
+        """
+        if self.failure:
+            raise RuntimeError(self.failure)
+        if timeout is None:
+            timeout = self.timeout
+        request = _Request(next(self._ids), prompt, kwargs, stream, timeout)
+        request.future.request = request
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("worker pool is closed")
+            if len(self._pending) >= self.max_pending:
+                raise PoolBusy(f"{len(self._pending)} AI requests are already waiting")
+            self._pending.append(request)
+        self.start()
+        self._wake()
+        return request.future
+
+    def generate(self, prompt, stream=None, timeout=None, **kwargs):
+        """Blocking submit(); Ctrl-C while waiting cancels just this generation"""
+        future = self.submit(prompt, stream=stream, timeout=timeout, **kwargs)
+        try:
+            return future.result()
+        except KeyboardInterrupt:
+            if self.cancel(future):
+                raise GenerationInterrupted("AI answer cancelled") from None
+            raise
+
+    def cancel(self, future):
+        """Stop a queued or running request; returns False if it already finished"""
+        request = getattr(future, "request", None)
+        if request is None or future.done():
+            return False
+        with self._lock:
+            if request in self._pending:
+                self._pending.remove(request)
+                self.cancellations += 1
+                return future.cancel()
+            request.cancelled = True
+        self._wake()
+        return True
+
+    def stats(self):
+        with self._lock:
+            pending = len(self._pending)
+        busy = sum(1 for worker in self._workers if worker.request is not None)
+        return {"processes": self.processes, "busy": busy, "pending": pending,
+                "completed": self.completed, "timeouts": self.timeouts,
+                "cancellations": self.cancellations, "restarts": self.restarts}
+
+    def close(self):
+        """Stop the workers; queued requests fail with RuntimeError"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wake()
+        if self._dispatcher is not None:
+            self._dispatcher.join()
+        else:
+            self._fail_pending(RuntimeError("worker pool is closed"))
+
+    def start(self):
+        """Launch the workers (they begin loading the model straight away)"""
+        with self._lock:
+            if self._dispatcher is not None or self._closed:
+                return
+            self._workers = [self._spawn() for _ in range(self.processes)]
+            self._dispatcher = threading.Thread(target=self._run, name="botfolio-ai-pool", daemon=True)
+            self._dispatcher.start()
+
+    # -- dispatcher thread --
+
+    def _spawn(self):
+        parent, child = self._context.Pipe()
+        process = self._context.Process(target=_worker_main, args=(child, self.factory, self.args),
+                                        name="botfolio-ai-worker", daemon=True)
+        process.start()
+        child.close()
+        return _Worker(process, parent)
+
+    def _wake(self):
+        try:
+            self._wake_writer.send_bytes(b"")
+        except OSError:
+            pass
+
+    def _run(self):
+        try:
+            while not self._closed:
+                self._assign()
+                by_conn = {worker.conn: worker for worker in self._workers}
+                by_sentinel = {worker.process.sentinel: worker for worker in self._workers}
+                ready = wait([self._wake_reader, *by_conn, *by_sentinel], self._time_left())
+                for obj in ready:
+                    if obj is self._wake_reader:
+                        while self._wake_reader.poll():
+                            self._wake_reader.recv_bytes()
+                    elif obj in by_conn:
+                        self._receive(by_conn[obj])
+                for obj in ready:
+                    if obj in by_sentinel and not by_sentinel[obj].process.is_alive():
+                        self._crashed(by_sentinel[obj])
+                self._expire()
+        finally:
+            self._shutdown()
+
+    def _assign(self):
+        for worker in self._workers:
+            if not worker.ready or worker.request is not None:
+                continue
+            with self._lock:
+                if not self._pending:
+                    return
+                request = self._pending.popleft()
+            if not request.future.set_running_or_notify_cancel():
+                continue
+            if request.timeout:
+                request.deadline = time.monotonic() + request.timeout
+            worker.request = request
+            try:
+                worker.conn.send((request.id, request.prompt, request.kwargs, request.stream is not None))
+            except OSError:
+                self._crashed(worker)
+
+    def _time_left(self):
+        deadlines = [worker.request.deadline for worker in self._workers
+                     if worker.request is not None and worker.request.deadline is not None]
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines) - time.monotonic())
+
+    def _receive(self, worker):
+        try:
+            kind, request_id, payload = worker.conn.recv()
+        except (EOFError, OSError):
+            # The process is exiting; wait for it so its exit code is known
+            worker.process.join(1)
+            self._crashed(worker)
+            return
+        if kind == "ready":
+            worker.ready = True
+            return
+        if kind == "failed":
+            self.failure = f"AI worker failed to load the model: {payload}"
+            self._fail_pending(RuntimeError(self.failure))
+            return
+        request = worker.request
+        if request is None or request.id != request_id:
+            return
+        if kind == "chunk":
+            if request.stream is not None:
+                try:
+                    request.stream(payload)
+                except Exception:
+                    pass
+            return
+        worker.request = None
+        if kind == "done":
+            self.completed += 1
+            request.future.set_result(payload)
+        else:
+            request.future.set_exception(RuntimeError(payload))
+
+    def _expire(self):
+        now = time.monotonic()
+        for worker in list(self._workers):
+            request = worker.request
+            if request is None:
+                continue
+            if request.cancelled:
+                self.cancellations += 1
+                self._restart(worker, GenerationCancelled("AI answer cancelled"))
+            elif request.deadline is not None and now >= request.deadline:
+                self.timeouts += 1
+                self._restart(worker, GenerationTimeout(f"AI answer took longer than {request.timeout:g}s"))
+
+    def _crashed(self, worker):
+        if worker not in self._workers:
+            return
+        code = worker.process.exitcode
+        if not worker.ready and worker.request is None:
+            # Died while loading: restarting would only die the same way
+            if self.failure is None:
+                self.failure = f"AI worker exited while loading the model (code {code})"
+            self._workers.remove(worker)
+            self._reap(worker)
+            self._fail_pending(RuntimeError(self.failure))
+            return
+        self._restart(worker, WorkerCrashed(f"AI worker exited unexpectedly (code {code})"))
+
+    def _restart(self, worker, error):
+        """Replace a worker, failing the request it was running with `error`"""
+        request = worker.request
+        worker.request = None
+        if request is not None and not request.future.done():
+            request.future.set_exception(error)
+        self._reap(worker)
+        self._workers[self._workers.index(worker)] = self._spawn()
+        self.restarts += 1
+
+    @staticmethod
+    def _reap(worker):
+        if worker.process.is_alive():
+            worker.process.terminate()
+            worker.process.join(1)
+            if worker.process.is_alive():
+                worker.process.kill()
+        worker.process.join()
+        worker.conn.close()
+
+    def _fail_pending(self, error):
+        with self._lock:
+            pending = list(self._pending)
+            self._pending.clear()
+        for request in pending:
+            if request.future.set_running_or_notify_cancel():
+                request.future.set_exception(error)
+
+    def _shutdown(self):
+        error = RuntimeError("worker pool is closed")
+        self._fail_pending(error)
+        for worker in self._workers:
+            if worker.request is not None and not worker.request.future.done():
+                worker.request.future.set_exception(error)
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        for worker in self._workers:
+            worker.process.join(1)
+            self._reap(worker)
+        self._workers = []
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Shared Test Helpers
+Setup used by several test modules
+
+Author: SSV
+Date: October 2026
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+
+def isolate_data_cache():
+    """Send compiled data snapshots to a scratch directory, not the user's cache.
+
+    Use as a module's setUpModule; everything is undone after its tests.
+    """
+    cache = tempfile.TemporaryDirectory()
+    unittest.addModuleCleanup(cache.cleanup)
+    patch = mock.patch.dict(os.environ, {"BOTFOLIO_DATA_CACHE_DIR": cache.name})
+    patch.start()
+    unittest.addModuleCleanup(patch.stop)
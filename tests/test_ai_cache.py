@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the AI response cache
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+from unittest import mock
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import ai_cache
+from ai_cache import ResponseCache, normalize_query
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for the LRU + TTL answer cache"""
+
+    def test_normalized_lookup(self):
+        """Case, punctuation and spacing differences share an entry"""
+        cache = ResponseCache(max_entries=4, ttl=60, path="")
+        cache.put("What languages do you know?", "C and Java.")
+        self.assertEqual(cache.get("  what LANGUAGES do you know "), "C and Java.")
+        self.assertEqual(normalize_query("Hi,  there!"), "hi there")
+
+    def test_namespaces_are_separate(self):
+        """The same question under another namespace misses"""
+        cache = ResponseCache(max_entries=4, ttl=60, path="")
+        cache.put("skills?", "Python.", namespace="v1")
+        self.assertIsNone(cache.get("skills?", namespace="v2"))
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first"""
+        cache = ResponseCache(max_entries=2, ttl=60, path="")
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "1")
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_ttl_expiry(self):
+        """Entries older than the TTL are not served"""
+        cache = ResponseCache(max_entries=2, ttl=10, path="")
+        with mock.patch.object(ai_cache.time, "time", return_value=1000.0):
+            cache.put("a", "1")
+        with mock.patch.object(ai_cache.time, "time", return_value=1005.0):
+            self.assertEqual(cache.get("a"), "1")
+        with mock.patch.object(ai_cache.time, "time", return_value=1011.0):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_sqlite_persistence(self):
+        """Answers survive a restart when a path is configured"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "answers.sqlite")
+            cache = ResponseCache(max_entries=4, ttl=60, path=path)
+            cache.put("skills?", "Python.")
+            cache.close()
+
+            reopened = ResponseCache(max_entries=4, ttl=60, path=path)
+            self.assertEqual(reopened.get("skills?"), "Python.")
+            reopened.clear()
+            reopened.close()
+            self.assertIsNone(ResponseCache(max_entries=4, ttl=60, path=path).get("skills?"))
+
+
+if __name__ == "__main__":
+    unittest.main()
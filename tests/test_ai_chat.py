@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the AI chat module (with a stand-in model)
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import unittest.mock
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import ai_chat
+from ai_chat import AIChat
+from datastore import DataStore
+from deps import is_available
+from streaming import StreamCleaner
+from support import isolate_data_cache
+
+
+setUpModule = isolate_data_cache
+
+
+class FakeGenerator:
+    """Stands in for the batched text-generation pipeline"""
+
+    def __init__(self, answer="I know Python and C. I build CLI tools. I like AI. Extra"):
+        self.answer = answer
+        self.calls = []
+
+    def __call__(self, prompt, **kwargs):
+        self.calls.append((prompt, kwargs))
+        return [{"generated_text": prompt + " " + self.answer}]
+
+
+def make_chat(deterministic=True, generator=None):
+    """Build an AIChat wired to a fake model"""
+    chat = AIChat(deterministic=deterministic)
+    chat.chatbot = object()
+    chat.batcher = generator or FakeGenerator()
+    return chat
+
+
+class TestAIChatCaching(unittest.TestCase):
+    """Test cases for cached, deterministic AI answers"""
+
+    def test_repeated_question_served_from_cache(self):
+        """A deterministic answer is generated once per question"""
+        chat = make_chat()
+        first = chat.generate_response("What languages do you know?")
+        second = chat.generate_response("what languages do you know")
+        self.assertEqual(first, second)
+        self.assertEqual(len(chat.batcher.calls), 1)
+        self.assertFalse(chat.batcher.calls[0][1]["do_sample"])
+        self.assertEqual(chat.cache.stats()["hits"], 1)
+
+    def test_sampling_mode_is_not_cached(self):
+        """Sampled answers vary, so they are never cached"""
+        chat = make_chat(deterministic=False)
+        chat.generate_response("hi")
+        chat.generate_response("hi")
+        self.assertEqual(len(chat.batcher.calls), 2)
+        self.assertTrue(chat.batcher.calls[0][1]["do_sample"])
+
+    def test_data_change_invalidates_cache(self):
+        """Answers from before an edit aren't served, and other data's answers aren't wiped"""
+        with tempfile.TemporaryDirectory() as root:
+            chat = make_chat()
+            chat.store = DataStore(Path(root) / "data.json")
+            chat.store.subscribe(chat.on_data_change)
+            chat.store.replace({"name": "Test User", "bio": "Old bio."})
+            chat.generate_response("hi")
+            chat.store.replace({"name": "Test User", "bio": "New bio."})
+            chat.generate_response("hi")
+            self.assertEqual(len(chat.batcher.calls), 2)
+            # Undoing the edit finds the first answer still cached
+            chat.store.replace({"name": "Test User", "bio": "Old bio."})
+            chat.generate_response("hi")
+            self.assertEqual(len(chat.batcher.calls), 2)
+
+
+class TestGenerationBudgets(unittest.TestCase):
+    """Test cases for token budgets and early stopping"""
+
+    def test_budgets_count_generated_tokens(self):
+        """Per-query-type budgets are passed as max_new_tokens"""
+        chat = make_chat()
+        chat.generate_project_response("what have you built?")
+        chat.generate_skill_response("which languages?")
+        budgets = [kwargs["max_new_tokens"] for _, kwargs in chat.batcher.calls]
+        self.assertEqual(budgets, [120, 100])
+        for _, kwargs in chat.batcher.calls:
+            self.assertNotIn("max_length", kwargs)
+            self.assertEqual(kwargs["max_sentences"], ai_chat.MAX_SENTENCES)
+
+    @unittest.skipUnless(is_available("torch") and is_available("transformers"), "requires torch")
+    def test_sentence_budget_stops_each_sequence(self):
+        """Each sequence stops once it has produced enough full stops"""
+        import torch
+        from stopping import sentence_stopping
+
+        class Tokenizer:
+            def batch_decode(self, ids):
+                return ["." if int(row[0]) == 1 else "x" for row in ids]
+
+        criteria = sentence_stopping(Tokenizer(), max_sentences=2)[0]
+        steps = [[1, 0], [0, 1], [1, 0]]
+        ids = torch.zeros((2, 3), dtype=torch.long)
+        results = []
+        for step in steps:
+            ids = torch.cat([ids, torch.tensor(step).unsqueeze(1)], dim=1)
+            results.append(criteria(ids, None).tolist())
+        self.assertEqual(results, [[False, False], [False, False], [True, False]])
+
+    @unittest.skipUnless(is_available("torch") and is_available("transformers"), "requires torch")
+    def test_sentence_budget_on_older_transformers(self):
+        """Before 4.39 the criterion answers for the whole batch"""
+        import torch
+        import transformers
+        from stopping import sentence_stopping
+
+        class Tokenizer:
+            def batch_decode(self, ids):
+                return ["." for _ in ids]
+
+        with unittest.mock.patch.object(transformers, "__version__", "4.38.2"):
+            criteria = sentence_stopping(Tokenizer(), max_sentences=1)[0]
+        self.assertIs(criteria(torch.zeros((2, 1), dtype=torch.long), None), True)
+
+    def test_version_parsing(self):
+        from stopping import _version
+
+        self.assertEqual(_version("4.38.2"), (4, 38))
+        self.assertEqual(_version("4.40.0.dev0"), (4, 40))
+        self.assertEqual(_version("5.0rc1"), (5, 0))
+
+
+class TestGroundedPrompts(unittest.TestCase):
+    """Test cases for retrieval-grounded prompts"""
+
+    def setUp(self):
+        self.chat = make_chat()
+        self.chat.store.replace({
+            "name": "Test User",
+            "title": "Test Developer",
+            "skills": ["C", "Java", "HTML", "CSS", "JavaScript", "Rust", "Go"],
+            "projects": [
+                {"name": "Alpha", "description": "Todo app", "tech": ["JavaScript"]},
+                {"name": "Beta", "description": "Chess engine", "tech": ["C"]},
+                {"name": "Gamma", "description": "Compiler", "tech": ["Rust"]},
+                {"name": "Delta", "description": "Web scraper", "tech": ["Go"]},
+            ],
+            "experience": [
+                {"role": "Content Lead", "company": "Red Cross"},
+                {"role": "Rust Intern", "company": "Oxide"},
+            ],
+        })
+
+    def test_context_prompt_only_has_relevant_facts(self):
+        """The prompt carries the matching facts, not a fixed slice"""
+        prompt = self.chat.generate_context_prompt("tell me about the compiler")
+        self.assertIn("Gamma", prompt)
+        self.assertNotIn("Alpha", prompt)
+        self.assertTrue(prompt.rstrip().endswith("Answer:"))
+
+    def test_query_specific_project_and_experience(self):
+        """Project and experience prompts follow the question"""
+        self.chat.generate_project_response("which project used go?")
+        self.chat.generate_experience_response("what did you do with rust?")
+        project_prompt = self.chat.batcher.calls[0][0]
+        experience_prompt = self.chat.batcher.calls[1][0]
+        self.assertIn("projects like Delta", project_prompt)
+        self.assertIn("Rust Intern at Oxide", experience_prompt)
+
+    def test_index_rebuilt_on_data_change(self):
+        """A new data version gets a fresh index"""
+        index = self.chat.retrieval_index()
+        self.assertIs(self.chat.retrieval_index(), index)
+        self.chat.store.replace(dict(self.chat.store.data, location="Berlin"))
+        self.assertIsNot(self.chat.retrieval_index(), index)
+        self.assertIn("Berlin", self.chat.generate_context_prompt("where are you located"))
+
+
+class TestPrefixCaching(unittest.TestCase):
+    """Test cases for keeping the persona prefix cache current"""
+
+    def test_prefix_prepared_per_persona(self):
+        """The cache is handed the current persona before each generation"""
+        chat = make_chat()
+        prepared = []
+        chat.prefix_cache = unittest.mock.Mock(prepare=lambda prefix, key=None: prepared.append((key, prefix)))
+        chat.generate_response("skills?")
+        chat.store.replace(dict(chat.store.data, title="Staff Engineer"))
+        chat.generate_response("skills?")
+        personas = [prefix for key, prefix in prepared if key is None]
+        self.assertEqual(len(personas), 2)
+        self.assertIn("Staff Engineer", personas[1])
+        self.assertTrue(chat.batcher.calls[1][0].startswith(personas[1]))
+
+    def test_history_prefix_prepared_per_conversation(self):
+        """A conversation's history is cached under its own key, growing turn by turn"""
+        chat = make_chat()
+        prepared = []
+        chat.prefix_cache = unittest.mock.Mock(prepare=lambda prefix, key=None: prepared.append((key, prefix)))
+        chat.generate_response("what have you built?")
+        chat.generate_response("tell me more about that project")
+        chat.generate_response("why did you choose it?")
+        history = [prefix for key, prefix in prepared if key == chat.memory.key]
+        self.assertEqual(len(history), 2)
+        self.assertTrue(history[1].startswith(history[0]))
+        for (prompt, _), prefix in zip(chat.batcher.calls[1:], history):
+            self.assertTrue(prompt.startswith(prefix))
+
+    def test_streamed_follow_up_reuses_history_prefix(self):
+        """Streaming prepares the history too and hands the cache to the streamer"""
+        chat = make_chat()
+        prepared = []
+        chat.prefix_cache = unittest.mock.Mock(prepare=lambda prefix, key=None: prepared.append((key, prefix)))
+        chat.generate_response("what have you built?")
+        history = chat.history_prefix(chat.memory)
+        with unittest.mock.patch.object(ai_chat, "stream_pipeline", return_value=iter([" It", " works."])) as stream:
+            "".join(chat.stream_response("tell me more about that project"))
+        self.assertEqual(prepared[-1], (chat.memory.key, history))
+        self.assertIs(stream.call_args.kwargs["prefix_cache"], chat.prefix_cache)
+
+
+class TestConversationMemory(unittest.TestCase):
+    """Test cases for follow-up questions within one conversation"""
+
+    def test_follow_up_sees_earlier_turns(self):
+        """Earlier questions and answers are part of the next prompt"""
+        chat = make_chat(generator=FakeGenerator("I built Botfolio."))
+        chat.generate_response("what have you built?")
+        chat.generate_response("tell me more about that project")
+        prompt = chat.batcher.calls[1][0]
+        self.assertIn("Question: what have you built?\nAnswer: I built Botfolio.", prompt)
+        self.assertTrue(prompt.rstrip().endswith("Question: tell me more about that project\n\nAnswer:"))
+
+    def test_conversations_are_separate(self):
+        """A session's own memory keeps its history out of other sessions"""
+        chat = make_chat(generator=FakeGenerator("I built Botfolio."))
+        other = chat.new_memory()
+        chat.generate_response("what have you built?")
+        chat.generate_response("tell me more about that", memory=other)
+        self.assertNotIn("what have you built", chat.batcher.calls[1][0])
+        self.assertEqual((len(chat.memory), len(other)), (1, 1))
+
+    def test_follow_ups_bypass_cache(self):
+        """Standalone questions still come from cache; follow-ups depend on history"""
+        chat = make_chat()
+        chat.generate_response("What languages do you know?")
+        chat.generate_response("what languages do you know")
+        chat.generate_response("tell me more about that")
+        chat.generate_response("tell me more about that")
+        self.assertEqual(len(chat.batcher.calls), 3)
+
+    def test_streamed_answers_remembered(self):
+        """Streaming adds the cleaned answer to the conversation too"""
+        chat = make_chat()
+        with unittest.mock.patch.object(ai_chat, "stream_pipeline", return_value=iter([" I like", " C."])):
+            "".join(chat.stream_response("which language?"))
+        self.assertEqual(chat.memory.last_question, "which language?")
+        self.assertIn("Answer: I like C.", chat.memory.render())
+
+
+class TestPrecomputedAnswers(unittest.TestCase):
+    """Test cases for answering common questions from the answer table"""
+
+    def setUp(self):
+        self.chat = make_chat()
+        self.chat.store.replace(dict(self.chat.store.data, location="Bhubaneswar, India"))
+
+    def test_smart_response_uses_table(self):
+        """A common question never reaches the model"""
+        self.assertEqual(self.chat.get_smart_response("Where are you based?"), "I'm based in Bhubaneswar, India.")
+        self.assertEqual(self.chat.batcher.calls, [])
+        self.assertEqual(len(self.chat.memory), 1)
+
+    def test_streamed_response_uses_table(self):
+        self.assertEqual("".join(self.chat.stream_response("where are you located")),
+                         "I'm based in Bhubaneswar, India.")
+
+    def test_other_questions_generated(self):
+        self.chat.get_smart_response("what is your favourite food?")
+        self.assertEqual(len(self.chat.batcher.calls), 1)
+
+
+class TestStreamCleaner(unittest.TestCase):
+    """Test cases for incremental response cleanup"""
+
+    def feed_all(self, chunks, **kwargs):
+        cleaner = StreamCleaner(**kwargs)
+        shown = [cleaner.feed(chunk) for chunk in chunks]
+        shown.append(cleaner.finish())
+        return "".join(shown), cleaner
+
+    def test_artifacts_split_across_chunks(self):
+        """Artifacts are removed even when split between tokens"""
+        shown, _ = self.feed_all(["  Ans", "wer:", " I code", " in C."])
+        self.assertEqual(shown, "I code in C.")
+
+    def test_stops_at_sentence_budget(self):
+        """Nothing past the third full stop is shown"""
+        shown, cleaner = self.feed_all(["One. Two.", " Three. Four", ". Five."])
+        self.assertEqual(shown, "One. Two. Three.")
+        self.assertTrue(cleaner.done)
+
+    def test_result_drops_trailing_fragment(self):
+        """The final answer omits an unfinished last sentence"""
+        _, cleaner = self.feed_all(["I like AI. I also", " like"])
+        self.assertEqual(cleaner.result(), "I like AI.")
+
+    def test_held_back_text_is_flushed(self):
+        """A tail that only looked like an artifact is still shown"""
+        shown, _ = self.feed_all(["Quest"])
+        self.assertEqual(shown, "Quest")
+
+
+class TestAIChatStreaming(unittest.TestCase):
+    """Test cases for streamed AI answers"""
+
+    def test_stream_response_yields_clean_pieces(self):
+        """Pieces are cleaned as they stream and the result is cached"""
+        chat = make_chat()
+        chunks = ["Answer:", " I know", " C. I", " build CLIs. I", " like AI. More"]
+        with unittest.mock.patch.object(ai_chat, "stream_pipeline", return_value=iter(chunks)):
+            pieces = list(chat.stream_response("languages?"))
+        self.assertGreater(len(pieces), 1)
+        self.assertEqual("".join(pieces), "I know C. I build CLIs. I like AI.")
+        self.assertEqual(list(chat.stream_response("languages?")), ["I know C. I build CLIs. I like AI."])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the precomputed answer table
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import gzip
+import json
+import tempfile
+import os
+import sys
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from answers import AnswerTable, PrecomputedAnswers, Question, build_table, default_table_path, main, questions_for
+from datastore import DataStore, drop_store
+from support import isolate_data_cache
+
+DATA = {
+    "name": "Test User",
+    "title": "Developer",
+    "school": "Test University",
+    "degree": "Computer Science",
+    "graduation_year": "2026",
+    "location": "Bhubaneswar, India",
+    "bio": "I like building tools.",
+    "skills": ["C", "Java"],
+    "projects": [
+        {"name": "Alpha", "tech": ["Python", "CLI"]},
+        {"name": "Beta", "tech": ["Python", "OpenCV"]},
+    ],
+}
+
+
+setUpModule = isolate_data_cache
+
+
+class FakeModel:
+    """Counts the questions it is asked to answer"""
+
+    def __init__(self):
+        self.asked = []
+
+    def __call__(self, question):
+        self.asked.append(question)
+        return f"Model answer to '{question}'."
+
+
+class TestBuildTable(unittest.TestCase):
+    """Test cases for building and incrementally rebuilding the table"""
+
+    def test_templated_answers_from_fields(self):
+        """Location, graduation, bio and project tech come from data.json"""
+        table, rebuilt = build_table(DATA, threshold=0.6)
+        self.assertEqual(table.answer('location'), "I'm based in Bhubaneswar, India.")
+        self.assertEqual(table.answer('graduation'),
+                         "I graduate in 2026 with a degree in Computer Science from Test University.")
+        self.assertIn("I like building tools.", table.answer('bio'))
+        self.assertEqual(table.answer('project_tech'),
+                         "Across my projects I've used Python (2 projects), CLI and OpenCV.")
+        self.assertEqual(table.answer('tech:opencv'), "I used OpenCV in Beta.")
+        # Nothing can answer the model-only questions yet
+        self.assertIsNone(table.answer('hire'))
+        self.assertEqual(len(table), len(rebuilt))
+
+    def test_only_changed_fields_rebuilt(self):
+        """A rebuild redoes just the questions whose fields changed"""
+        model = FakeModel()
+        first, _ = build_table(DATA, generate=model, source="gpt2", threshold=0.6)
+        asked = len(model.asked)
+        self.assertGreater(asked, 0)
+        self.assertIn("Model answer", first.answer('hire'))
+
+        changed = dict(DATA, location="Delhi, India", interests=["Chess"])
+        second, rebuilt = build_table(changed, generate=model, source="gpt2", previous=first, threshold=0.6)
+        self.assertEqual(sorted(rebuilt), ['goals', 'location'])
+        self.assertEqual(model.asked[asked:], ["what are your career goals"])
+        self.assertEqual(second.answer('location'), "I'm based in Delhi, India.")
+
+    def test_stale_model_answers_dropped_without_model(self):
+        """Without a model, answers written from old fields are not served"""
+        model = FakeModel()
+        first, _ = build_table(DATA, generate=model, source="gpt2", threshold=0.6)
+        second, _ = build_table(dict(DATA, experience=["Intern"]), previous=first, threshold=0.6)
+        self.assertIsNone(second.answer('hire'))
+        self.assertEqual(second.answer('goals'), first.answer('goals'))
+        self.assertIsNone(second.lookup("why should we hire you"))
+
+    def test_extra_questions(self):
+        """The question set is extensible"""
+        extra = [Question('remote', ("do you work remotely",), {'location'})]
+        table, _ = build_table(DATA, questions_for(DATA, extra), FakeModel(), "gpt2", threshold=0.6)
+        self.assertEqual(table.lookup("can you work remotely")[0], 'remote')
+
+
+class TestLookup(unittest.TestCase):
+    """Test cases for nearest-question matching"""
+
+    def setUp(self):
+        self.table = build_table(DATA, threshold=0.6)[0]
+
+    def test_paraphrases_matched(self):
+        cases = {
+            "where are you based?": 'location',
+            "what's your graduation year": 'graduation',
+            "tell me a bit about yourself": 'bio',
+            "what is your tech stack": 'project_tech',
+            "have you worked with opencv": 'tech:opencv',
+        }
+        for question, key in cases.items():
+            with self.subTest(question=question):
+                self.assertEqual(self.table.lookup(question)[0], key)
+
+    def test_unrelated_or_unanswered_questions_miss(self):
+        """Off-topic questions, and ones nearest an unanswered question, go to the model"""
+        for question in ("what is your favourite food", "do you know rust", "hello",
+                         "where do you see yourself in five years"):
+            with self.subTest(question=question):
+                self.assertIsNone(self.table.lookup(question))
+
+    def test_tech_questions_need_the_tech_named(self):
+        """A question about another technology is not answered with a near one"""
+        self.assertEqual(self.table.lookup("have you used Python?")[0], 'tech:python')
+        for question in ("have you used java", "which projects use kubernetes", "projects with clips"):
+            with self.subTest(question=question):
+                self.assertIsNone(self.table.lookup(question))
+
+
+class TestTableStorage(unittest.TestCase):
+    """Test cases for the on-disk table"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip(self):
+        """A saved table loads back identically"""
+        table = build_table(DATA, generate=FakeModel(), source="gpt2", threshold=0.6)[0]
+        path = self.root / "data.answers.json.gz"
+        table.save(path)
+        loaded = AnswerTable.load(path, threshold=0.6)
+        self.assertEqual(loaded.entries, table.entries)
+        self.assertEqual(loaded.lookup("why should we hire you"), table.lookup("why should we hire you"))
+
+    def test_unreadable_tables_ignored(self):
+        """Missing, corrupt or other-format files read as no table"""
+        self.assertIsNone(AnswerTable.load(self.root / "missing.gz"))
+        (self.root / "corrupt.gz").write_bytes(b"not gzip")
+        self.assertIsNone(AnswerTable.load(self.root / "corrupt.gz"))
+        (self.root / "old.gz").write_bytes(gzip.compress(json.dumps({"format": 0, "entries": {}}).encode()))
+        self.assertIsNone(AnswerTable.load(self.root / "old.gz"))
+
+    def test_build_command_is_incremental(self):
+        """The build step reuses a saved table and reports what it redid"""
+        data_path = self.root / "alice.json"
+        data_path.write_text(json.dumps(DATA))
+        self.addCleanup(drop_store, data_path)
+        with redirect_stdout(StringIO()) as first:
+            self.assertEqual(main(["--data", str(data_path)]), 0)
+        output = default_table_path(data_path)
+        self.assertEqual(output.name, "alice.answers.json.gz")
+        saved = output.read_bytes()
+        with redirect_stdout(StringIO()) as second:
+            main(["--data", str(data_path)])
+        self.assertIn("0 rebuilt", second.getvalue())
+        self.assertNotIn("0 rebuilt", first.getvalue())
+        self.assertEqual(output.read_bytes(), saved)
+
+
+class TestPrecomputedAnswers(unittest.TestCase):
+    """Test cases for serving the table from a live data store"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.store = DataStore(self.root / "data.json")
+        self.store.replace(DATA)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_follows_data_changes(self):
+        """Templated answers are refreshed when the data changes"""
+        answers = PrecomputedAnswers(self.store, threshold=0.6)
+        self.assertEqual(answers.lookup("where are you based"), "I'm based in Bhubaneswar, India.")
+        self.store.replace(dict(DATA, location="Pune, India"))
+        self.assertEqual(answers.lookup("where are you based"), "I'm based in Pune, India.")
+        self.assertEqual(answers.stats()["hits"], 2)
+
+    def test_saved_model_answers_served(self):
+        """Answers built offline with a model are served while their fields are unchanged"""
+        build_table(DATA, generate=FakeModel(), source="gpt2", threshold=0.6)[0].save(
+            default_table_path(self.store.path))
+        answers = PrecomputedAnswers(self.store, threshold=0.6)
+        self.assertIn("Model answer", answers.lookup("why should we hire you"))
+        self.store.replace(dict(DATA, skills=["Rust"]))
+        self.assertIsNone(answers.lookup("why should we hire you"))
+
+    def test_extra_questions_served(self):
+        """Questions added at build time are served without the questions file"""
+        extra = [Question('visa', ("do you need a visa sponsorship",), {'location'})]
+        model = FakeModel()
+        built = build_table(DATA, questions_for(DATA, extra), model, "gpt2", threshold=0.6)[0]
+        # A later build without --questions keeps them
+        rebuilt, redone = build_table(DATA, generate=model, source="gpt2", previous=built, threshold=0.6)
+        self.assertEqual(redone, [])
+        rebuilt.save(default_table_path(self.store.path))
+        answers = PrecomputedAnswers(self.store, threshold=0.6)
+        self.assertIn("visa", answers.lookup("do you need visa sponsorship"))
+        self.store.replace(dict(DATA, location="Berlin, Germany"))
+        self.assertIsNone(answers.lookup("do you need visa sponsorship"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,16 +12,25 @@ import tempfile
 import os
 from pathlib import Path
 import sys
+from unittest import mock
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+from support import isolate_data_cache
+
 try:
+    import assistant as assistant_module
     from assistant import PortfolioAssistant
+    from models import get_registry
+    from workers import GenerationInterrupted, PoolBusy
 except ImportError as e:
     print(f"Failed to import assistant: {e}")
     sys.exit(1)
 
+setUpModule = isolate_data_cache
+
+
 class TestPortfolioAssistant(unittest.TestCase):
     """Test cases for the Portfolio Assistant"""
     
@@ -103,6 +112,15 @@ class TestPortfolioAssistant(unittest.TestCase):
         response = self.assistant.get_certifications_info()
         self.assertIn("Test Certification", response)
         
+    def test_links_come_from_data(self):
+        """Resume and certificate links are shown only when the data has them"""
+        self.assertNotIn("View or download", self.assistant.get_resume_info())
+        self.assertNotIn("View all certificates", self.assistant.get_certifications_info())
+        self.assistant.data = dict(self.assistant.data, resume_url="https://example.com/cv.pdf",
+                                   certifications_url="https://example.com/certs")
+        self.assertIn("https://example.com/cv.pdf", self.assistant.get_resume_info())
+        self.assertIn("https://example.com/certs", self.assistant.get_certifications_info())
+        
     def test_experience_response(self):
         """Test experience information response"""
         response = self.assistant.get_experience_info()
@@ -204,6 +222,16 @@ class TestDataValidation(unittest.TestCase):
         self.assertIn("name", assistant.data)
         self.assertIn("skills", assistant.data)
         
+    def test_sample_data_not_written_over_package(self):
+        """Sample data is only served from memory unless a path is given"""
+        from datastore import DEFAULT_DATA_PATH
+        assistant = PortfolioAssistant()
+        before = DEFAULT_DATA_PATH.read_bytes()
+        assistant.create_sample_data()
+        self.assertEqual(DEFAULT_DATA_PATH.read_bytes(), before)
+        self.assertEqual(assistant.data["name"], "Your Name")
+        assistant.store.load()
+        
     def test_malformed_json_handling(self):
         """Test handling of malformed JSON data"""
         # This would typically be tested with actual file I/O
@@ -248,6 +276,462 @@ class TestResponseFormatting(unittest.TestCase):
         # Should contain ANSI color codes (from colorama)
         self.assertTrue(any(code in response for code in ['\x1b[', 'Fore.']))
 
+class TestLazyAI(unittest.TestCase):
+    """Test deferred AI model loading"""
+    
+    def setUp(self):
+        """Set up test assistant"""
+        self.assistant = PortfolioAssistant()
+        
+    def test_model_not_loaded_at_construction(self):
+        """Constructing the assistant should not build the AI pipeline"""
+        self.assertIsNone(self.assistant.ai_chatbot)
+        self.assertFalse(self.assistant._ai_loaded)
+        
+    def test_ai_modules_not_imported_at_startup(self):
+        """Importing the assistant leaves the AI-only modules for the first AI question"""
+        import subprocess
+
+        src = os.path.join(os.path.dirname(__file__), '..', 'src')
+        code = ("import sys, assistant; print(sorted(m for m in ('ai_cache', 'answers', 'batching', "
+                "'loader', 'prefix_cache', 'workers', 'multiprocessing', 'sqlite3') if m in sys.modules))")
+        result = subprocess.run([sys.executable, "-c", code], cwd=src, capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_load_ai_without_transformers(self):
+        """Loading AI without transformers should fail soft, once"""
+        with mock.patch.object(assistant_module, 'AI_AVAILABLE', False):
+            self.assertIsNone(self.assistant.load_ai())
+            self.assertTrue(self.assistant._ai_loaded)
+            self.assertIsNone(self.assistant.warm_ai())
+            
+    def test_load_ai_builds_pipeline_once(self):
+        """transformers is imported and the pipeline built on first load only"""
+        fake_transformers = mock.MagicMock()
+        with mock.patch.object(assistant_module, 'AI_AVAILABLE', True), \
+                mock.patch.dict(sys.modules, {'transformers': fake_transformers}):
+            first = self.assistant.load_ai()
+            second = self.assistant.load_ai()
+            self.assertIs(first, second)
+            self.assertEqual(fake_transformers.pipeline.call_count, 1)
+            self.assertEqual(get_registry().stats()[0]["refs"], 1)
+            self.assistant.unload_ai()
+        self.assertEqual(get_registry().stats(), [])
+        self.assertFalse(self.assistant._ai_loaded)
+        
+    def test_streamed_ai_response(self):
+        """Streamed AI answers reach the callback piece by piece"""
+        self.assistant._ai_loaded = True
+        self.assistant.ai_chatbot = object()
+        pieces = []
+        with mock.patch.object(assistant_module, 'AI_AVAILABLE', True), \
+                mock.patch.object(assistant_module, 'stream_pipeline', return_value=iter([" I", " know", " C."])):
+            response = self.assistant.get_response("ai: languages?", stream=pieces.append)
+        self.assertEqual(pieces, ["I", " know", " C."])
+        self.assertIn("I know C.", response)
+
+    def test_ai_response_through_worker_pool(self):
+        """With a worker pool the answer comes from it, streamed or not"""
+        pool = mock.MagicMock()
+        pool.generate.side_effect = lambda prompt, stream=None, **kwargs: (
+            stream(" Python.") if stream else None) or " Python."
+        self.assistant._ai_loaded = True
+        self.assistant.ai_chatbot = pool
+        self.assistant.ai_engine.pool = pool
+        pieces = []
+        with mock.patch.object(assistant_module, 'AI_AVAILABLE', True):
+            self.assertIn("Python.", self.assistant.get_response("ai: languages?"))
+            self.assistant.get_response("ai: favourite language?", stream=pieces.append)
+        self.assertEqual(pieces, ["Python."])
+        self.assertEqual(pool.generate.call_count, 2)
+
+    def test_busy_worker_pool(self):
+        """A full queue gets a polite retry message, not an error"""
+        pool = mock.MagicMock()
+        pool.generate.side_effect = PoolBusy("full")
+        self.assistant._ai_loaded = True
+        self.assistant.ai_chatbot = pool
+        self.assistant.ai_engine.pool = pool
+        with mock.patch.object(assistant_module, 'AI_AVAILABLE', True):
+            self.assertIn("busy", self.assistant.get_response("ai: anything?"))
+
+    def test_interrupt_stops_answer_not_session(self):
+        """Ctrl-C during an answer returns to the prompt"""
+        with mock.patch('builtins.input', side_effect=["ai: slow", "skills", "exit"]), \
+                mock.patch.object(self.assistant, 'get_response',
+                                  side_effect=[KeyboardInterrupt, "skills"]) as respond, \
+                mock.patch('builtins.print') as printed:
+            self.assistant.run()
+        self.assertEqual(respond.call_count, 2)
+        output = " ".join(str(call.args[0]) for call in printed.call_args_list if call.args)
+        self.assertIn("Stopped waiting for that answer", output)
+        self.assertIn("Thanks for chatting", output)
+
+    def test_interrupt_message_says_what_stopped(self):
+        """Only a cancelled worker generation is reported as stopped"""
+        self.assertEqual(self.assistant.interrupted_message("ai: slow", GenerationInterrupted()),
+                         "🛑 Stopped that answer.")
+        self.assertIn("may finish it in the background",
+                      self.assistant.interrupted_message("ai: slow", KeyboardInterrupt()))
+        self.assertEqual(self.assistant.interrupted_message("skills", KeyboardInterrupt()), "🛑 Interrupted.")
+
+class TestOptionalDependencies(unittest.TestCase):
+    """Test offline dependency checks and fallbacks"""
+    
+    def setUp(self):
+        """Set up test assistant"""
+        self.assistant = PortfolioAssistant()
+        
+    def test_check_dependencies(self):
+        """Every optional package should be reported as a boolean"""
+        status = assistant_module.check_dependencies()
+        self.assertIn("pyjokes", status)
+        self.assertIn("transformers", status)
+        self.assertTrue(all(isinstance(value, bool) for value in status.values()))
+        
+    def test_joke_fallback_without_pyjokes(self):
+        """Jokes should still work when pyjokes is not installed"""
+        with mock.patch.object(assistant_module, 'JOKES_AVAILABLE', False), \
+                mock.patch.dict(sys.modules, {'pyjokes': None}):
+            response = self.assistant.get_joke()
+        self.assertIn("😄", response)
+        self.assertTrue(len(response) > 10)
+
+class TestSectionCache(unittest.TestCase):
+    """Test cached rendering of portfolio sections"""
+    
+    def setUp(self):
+        """Set up test assistant"""
+        self.assistant = PortfolioAssistant()
+        self.assistant.data = {"name": "Cache User", "skills": ["Python", "Go"]}
+        
+    def test_repeated_render_is_cached(self):
+        """A second request should reuse the rendered text"""
+        first = self.assistant.get_skills_info()
+        self.assertIs(self.assistant.get_skills_info(), first)
+        self.assertIs(self.assistant.get_response("skills"), first)
+        
+    def test_cache_invalidated_on_data_change(self):
+        """Replacing the data should re-render every section"""
+        version = self.assistant.data_version
+        self.assertIn("Cache User", self.assistant.get_about_info())
+        self.assistant.data = {"name": "New User", "skills": ["Rust"]}
+        self.assertGreater(self.assistant.data_version, version)
+        self.assertIn("New User", self.assistant.get_about_info())
+        self.assertIn("Rust", self.assistant.get_skills_info())
+        self.assertNotIn("Python", self.assistant.get_skills_info())
+        
+    def test_only_dependent_sections_invalidated(self):
+        """Changing one field should keep unrelated sections cached"""
+        skills = self.assistant.get_skills_info()
+        about = self.assistant.get_about_info()
+        self.assistant.data = dict(self.assistant.data, name="Renamed User")
+        self.assertIs(self.assistant.get_skills_info(), skills)
+        self.assertIsNot(self.assistant.get_about_info(), about)
+        self.assertIn("Renamed User", self.assistant.get_about_info())
+
+class TestRequestMetrics(unittest.TestCase):
+    """Test request instrumentation and the stats command"""
+    
+    def setUp(self):
+        """Set up test assistant with metrics collection on"""
+        self.assistant = PortfolioAssistant()
+        self.assistant.data = {"name": "Metrics User", "skills": ["Python"]}
+        self.metrics = assistant_module.metrics
+        self.metrics.reset()
+        self.metrics.enabled = True
+        
+    def tearDown(self):
+        """Switch metrics back off for other tests"""
+        self.metrics.enabled = False
+        self.metrics.reset()
+        
+    def counter(self, name, **labels):
+        """Value of one counter in the current snapshot"""
+        for counter in self.metrics.snapshot()["counters"]:
+            if counter["name"] == name and counter["labels"] == labels:
+                return counter["value"]
+        return 0
+        
+    def test_routes_and_section_cache_recorded(self):
+        """Each request is counted by route, with section cache hits and misses"""
+        self.assistant.get_response("skills")
+        self.assistant.get_response("show me your skills")
+        self.assistant.get_response("gibberish")
+        self.assertEqual(self.counter("requests_total", route="get_skills_info"), 2)
+        self.assertEqual(self.counter("requests_total", route="default"), 1)
+        self.assertEqual(self.counter("section_cache_total", section="get_skills_info", result="miss"), 1)
+        self.assertEqual(self.counter("section_cache_total", section="get_skills_info", result="hit"), 1)
+        
+    def test_stats_command(self):
+        """'stats' lists the recorded timings"""
+        self.assistant.get_response("skills")
+        stats = self.assistant.get_response("stats")
+        self.assertIn("request_seconds", stats)
+        self.assertIn("route=get_skills_info", stats)
+        
+    def test_disabled_metrics(self):
+        """With metrics off nothing is recorded and 'stats' says how to enable them"""
+        self.metrics.enabled = False
+        self.assistant.get_response("skills")
+        self.assertEqual(self.metrics.snapshot()["counters"], [])
+        self.assertIn("Metrics are off", self.assistant.get_response("stats"))
+
+class TestPagination(unittest.TestCase):
+    """Test paging and filtering of large portfolios"""
+    
+    def setUp(self):
+        """Set up test assistant with a large portfolio"""
+        self.assistant = PortfolioAssistant()
+        self.assistant.data = {
+            "name": "Big Team",
+            "projects": [{"name": f"Project {i}", "description": f"Thing {i}",
+                          "tech": ["Rust" if i % 4 == 0 else "Python"]} for i in range(1, 13)],
+            "skills": [f"Skill {i}" for i in range(1, 41)],
+            "certifications": [f"Cert {i}" for i in range(1, 26)],
+        }
+        
+    def test_first_page_and_footer(self):
+        """Only one page is shown, with a hint about the rest"""
+        response = self.assistant.get_response("projects")
+        self.assertIn("5. ", response)
+        self.assertNotIn("Project 6", response)
+        self.assertIn("Page 1 of 3 (12 total)", response)
+        self.assertIn("'projects page 2'", response)
+        
+    def test_page_and_next(self):
+        """'page N' picks a page and 'next' continues the last listing"""
+        page_two = self.assistant.get_response("show projects page 2")
+        self.assertIn("6. ", page_two)
+        self.assertIn("Project 10", page_two)
+        self.assertNotIn("Project 11", page_two)
+        page_three = self.assistant.get_response("next")
+        self.assertIn("Page 3 of 3", page_three)
+        self.assertIn("12. ", page_three)
+        self.assertIn("Cert 21", self.assistant.get_response("certifications page 3"))
+        self.assertIn("Cert 11", self.assistant.get_response("page 2"))
+        self.assertIn("Skill 40", self.assistant.get_response("skills page 2"))
+        
+    def test_filter_by_technology(self):
+        """'projects using X' lists only the matching projects"""
+        response = self.assistant.get_response("projects using rust")
+        self.assertIn("Projects using Rust", response)
+        self.assertEqual([n for n in (4, 8, 12) if f"Project {n}\x1b" in response], [4, 8, 12])
+        self.assertNotIn("Project 1\x1b", response)
+        cobol = self.assistant.get_response("projects using cobol")
+        self.assertIn("No projects using 'cobol'", cobol)
+        self.assertIn("Project 1\x1b", cobol)
+
+    def test_filter_ignores_punctuation_and_non_technologies(self):
+        """Only a known tech or tag filters; other 'with ...' phrases list everything"""
+        for query in ("projects using rust?", "Show me the projects you built with Rust."):
+            with self.subTest(query=query):
+                response = self.assistant.get_response(query)
+                self.assertIn("Projects using Rust", response)
+                self.assertNotIn("Project 1\x1b", response)
+        response = self.assistant.get_response("what projects have you worked on with your team")
+        self.assertIn("Recent Projects", response)
+        self.assertIn("Project 1\x1b", response)
+        self.assertNotIn("No projects using", response)
+        
+    def test_sessions_page_independently(self):
+        """Each session continues its own listing"""
+        first, second = {}, {}
+        self.assistant.get_response("projects", session=first)
+        self.assistant.get_response("certifications", session=second)
+        self.assertIn("Project 6", self.assistant.get_response("next", session=first))
+        self.assertIn("Cert 11", self.assistant.get_response("next", session=second))
+        self.assertNotIn("Page", self.assistant.get_response("next", session={}))
+        
+    def test_only_default_view_cached(self):
+        """Pages and filters are rendered on demand; the cache stays bounded"""
+        for page in range(1, 50):
+            self.assistant.get_response(f"projects page {page}")
+        self.assistant.get_response("projects using python")
+        self.assertEqual(set(self.assistant._section_cache), {"get_projects_info"})
+
+class TestIntentRouting(unittest.TestCase):
+    """Test free-text questions routed by intent rather than keywords"""
+    
+    def setUp(self):
+        """Set up test assistant"""
+        self.assistant = PortfolioAssistant()
+        self.assistant.data = {
+            "name": "Test User",
+            "school": "Test University",
+            "projects": [{"name": "Py Bot", "tech": ["Python"]}, {"name": "Go Tool", "tech": ["Go"]}],
+        }
+        
+    def test_intent_answers_without_alias(self):
+        """'where did you study' gets the education section"""
+        route, response = self.assistant.route_response("Where did you study?")
+        self.assertEqual(route, "get_education_info")
+        self.assertIn("Test University", response)
+        
+    def test_intent_keeps_listing_filters(self):
+        """Listings reached by intent still honour 'using X'"""
+        route, response = self.assistant.route_response("what have you built using go")
+        self.assertEqual(route, "get_projects_info")
+        self.assertIn("Go Tool", response)
+        self.assertNotIn("Py Bot", response)
+        
+    def test_low_confidence_escalates_to_ai(self):
+        """Only text no command or intent covers goes to the model"""
+        with mock.patch.object(assistant_module, 'AI_AVAILABLE', True):
+            self.assertTrue(self.assistant.is_ai_query("what is your favourite food"))
+            self.assertTrue(self.assistant.is_ai_query("ai: where did you study"))
+            self.assertFalse(self.assistant.is_ai_query("where did you study"))
+            self.assertFalse(self.assistant.is_ai_query("skills"))
+            self.assertFalse(self.assistant.is_ai_query("next"))
+            with mock.patch.dict(os.environ, {"BOTFOLIO_INTENT_AI_FALLBACK": "0"}):
+                self.assertFalse(self.assistant.is_ai_query("what is your favourite food"))
+        # Without a model, unmatched text still gets the default reply
+        self.assertEqual(self.assistant.route_response("what is your favourite food")[0], "default")
+
+class TestSpellingCorrection(unittest.TestCase):
+    """Test typo-tolerant command matching"""
+    
+    def setUp(self):
+        """Set up test assistant"""
+        self.assistant = PortfolioAssistant()
+        self.assistant.data = {
+            "name": "Test User",
+            "skills": ["Python", "Rust"],
+            "projects": [{"name": f"Project {i}", "tech": ["Python"]} for i in range(1, 8)],
+        }
+        
+    def test_typo_answered_with_correction_noted(self):
+        """'skils' shows the skills section and says what it was read as"""
+        route, response = self.assistant.route_response("skils")
+        self.assertEqual(route, "get_skills_info")
+        self.assertIn("Showing results for 'skills' (you typed 'skils')", response)
+        self.assertIn("Rust", response)
+        
+    def test_corrected_listing_keeps_paging(self):
+        """The rest of the query still applies after the fix"""
+        response = self.assistant.get_response("projcts page 2")
+        self.assertIn("Project 6", response)
+        self.assertIn("Page 2 of 2", response)
+        
+    def test_typos_not_escalated_to_ai(self):
+        """A correctable command never costs an AI generation"""
+        with mock.patch.object(assistant_module, 'AI_AVAILABLE', True):
+            self.assertFalse(self.assistant.is_ai_query("certifcates"))
+
+    def test_real_words_not_corrected(self):
+        """Words close to an alias but not typos of it keep their meaning"""
+        route, response = self.assistant.route_response("what content do you create")
+        self.assertNotEqual(route, "get_contact_info")
+        self.assertNotIn("Showing results for", response)
+
+    def test_portfolio_words_not_corrected(self):
+        """A word from the portfolio itself is never read as a typo"""
+        self.assertIn("Showing results for 'contact'", self.assistant.get_response("contract"))
+        self.assistant.data = dict(self.assistant.data, projects=[{"name": "Contract Analyzer"}])
+        self.assertNotIn("Showing results for", self.assistant.get_response("contract"))
+
+    def test_confident_intent_beats_two_edit_correction(self):
+        """A correction two edits away gives way to an intent match"""
+        self.assertEqual(self.assistant.route_response("expereance")[0], "get_experience_info")
+        with mock.patch.object(self.assistant.intents, 'classify', return_value=('get_projects_info', 0.9)):
+            route, response = self.assistant.route_response("expereance")
+        self.assertEqual(route, "get_projects_info")
+        self.assertNotIn("Showing results for", response)
+
+class TestAIConversation(unittest.TestCase):
+    """Test per-session memory of AI turns"""
+
+    def setUp(self):
+        self.assistant = PortfolioAssistant()
+        self.prompts = []
+
+        def batcher(prompt, **kwargs):
+            self.prompts.append(prompt)
+            return [{"generated_text": prompt + f" Answer {len(self.prompts)}."}]
+        self.assistant._ai_loaded = True
+        self.assistant.ai_chatbot = object()
+        self.assistant.ai_batcher = batcher
+
+    def ask(self, question, session=None):
+        with mock.patch.object(assistant_module, 'AI_AVAILABLE', True):
+            return self.assistant.get_response(f"ai: {question}", session=session)
+
+    def test_follow_up_sees_history(self):
+        """The second question's prompt carries the first turn"""
+        self.ask("what have you built?")
+        self.ask("tell me more about that")
+        self.assertNotIn("Question:", self.prompts[0])
+        self.assertTrue(self.prompts[1].startswith("Question: what have you built?\nAnswer: Answer 1.\n\n"))
+
+    def test_sessions_do_not_share_history(self):
+        """Each server session remembers only its own turns"""
+        first, second = {}, {}
+        self.ask("what have you built?", session=first)
+        self.ask("tell me more about that", session=second)
+        self.assertNotIn("built", self.prompts[1])
+        self.assertEqual(len(first['memory']), 1)
+
+    def test_history_prefix_prepared(self):
+        """With a prefix cache the history is prefilled under the session's key"""
+        prefix_cache = mock.Mock()
+        self.assistant.ai_engine.prefix_cache = prefix_cache
+        self.ask("what have you built?")
+        prefix_cache.prepare.assert_not_called()
+        self.ask("why that one?")
+        memory = self.assistant.session['memory']
+        prefix_cache.prepare.assert_called_once_with("Question: what have you built?\nAnswer: Answer 1.\n\n",
+                                                     key=memory.key)
+
+    def test_streamed_follow_up_reuses_history_prefix(self):
+        """Streamed answers prefill only the new question as well"""
+        prefix_cache = mock.Mock()
+        self.assistant.ai_engine.prefix_cache = prefix_cache
+        self.ask("what have you built?")
+        with mock.patch.object(assistant_module, 'stream_pipeline', return_value=iter([" It", " works."])) as stream, \
+                mock.patch.object(assistant_module, 'AI_AVAILABLE', True):
+            self.assistant.get_response("ai: why that one?", stream=lambda text: None)
+        memory = self.assistant.session['memory']
+        prefix_cache.prepare.assert_called_once_with("Question: what have you built?\nAnswer: Answer 1.\n\n",
+                                                     key=memory.key)
+        self.assertIs(stream.call_args.kwargs["prefix_cache"], prefix_cache)
+
+    def test_common_questions_skip_the_model(self):
+        """Questions in the answer table are answered without loading the model"""
+        self.assistant._ai_loaded = False
+        self.assistant.data = dict(self.assistant.data, location="Bhubaneswar, India")
+        with mock.patch.object(self.assistant, 'load_ai') as load_ai:
+            response = self.ask("where are you based?")
+        load_ai.assert_not_called()
+        self.assertIn("I'm based in Bhubaneswar, India.", response)
+        self.assertEqual(self.prompts, [])
+        self.assertEqual(self.assistant.conversation().last_question, "where are you based?")
+
+    def test_common_questions_answered_without_transformers(self):
+        """The answer table serves 'ai:' questions even when no model can be installed"""
+        self.assistant._ai_loaded = False
+        self.assistant.data = dict(self.assistant.data, location="Bhubaneswar, India")
+        with mock.patch.object(assistant_module, 'AI_AVAILABLE', False):
+            self.assertTrue(self.assistant.is_ai_query("ai: where are you based?"))
+            response = self.assistant.get_response("ai: where are you based?")
+            missing = self.assistant.get_response("ai: why should we hire you?")
+        self.assertIn("I'm based in Bhubaneswar, India.", response)
+        self.assertIn("AI mode not available", missing)
+
+    def test_in_process_answer_time_limited(self):
+        """Without workers the timeout still bounds generation, and workers stay unloaded"""
+        batcher = mock.Mock(return_value=[{"generated_text": "Python."}])
+        self.assistant.ai_batcher = batcher
+        with mock.patch.dict(os.environ, {"BOTFOLIO_AI_TIMEOUT": "5"}), \
+                mock.patch.dict(sys.modules, {'workers': None}):
+            self.assertIn("Python.", self.ask("what languages do you know?"))
+        self.assertEqual(batcher.call_args.kwargs["max_time"], 5.0)
+
+    def test_errors_not_remembered(self):
+        """Failed generations leave the conversation as it was"""
+        self.assistant.ai_batcher = mock.Mock(side_effect=RuntimeError("out of memory"))
+        self.assertIn("AI error", self.ask("what have you built?"))
+        self.assertEqual(len(self.assistant.conversation()), 0)
+
 def run_tests():
     """Run all tests"""
     print("🧪 Running Portfolio Assistant Tests...")
@@ -260,6 +744,14 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestPortfolioAssistant))
     suite.addTests(loader.loadTestsFromTestCase(TestDataValidation))
     suite.addTests(loader.loadTestsFromTestCase(TestResponseFormatting))
+    suite.addTests(loader.loadTestsFromTestCase(TestLazyAI))
+    suite.addTests(loader.loadTestsFromTestCase(TestOptionalDependencies))
+    suite.addTests(loader.loadTestsFromTestCase(TestSectionCache))
+    suite.addTests(loader.loadTestsFromTestCase(TestRequestMetrics))
+    suite.addTests(loader.loadTestsFromTestCase(TestPagination))
+    suite.addTests(loader.loadTestsFromTestCase(TestIntentRouting))
+    suite.addTests(loader.loadTestsFromTestCase(TestSpellingCorrection))
+    suite.addTests(loader.loadTestsFromTestCase(TestAIConversation))
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
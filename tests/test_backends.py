@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the AI inference backends
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import os
+import sys
+from unittest import mock
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import backends
+from backends import BACKENDS, apply_backend, load_pipeline, resolve_backend, set_num_threads
+from deps import is_available
+
+
+class TestBackendSelection(unittest.TestCase):
+    """Test cases for choosing a backend through config"""
+
+    def test_default_backend(self):
+        """Without configuration the original fp32 weights are used"""
+        with mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("BOTFOLIO_AI_BACKEND", None)
+            self.assertEqual(resolve_backend(), "fp32")
+
+    def test_backend_from_environment(self):
+        """BOTFOLIO_AI_BACKEND picks the backend"""
+        with mock.patch.dict(os.environ, {"BOTFOLIO_AI_BACKEND": " INT8 "}):
+            self.assertEqual(resolve_backend(), "int8")
+
+    def test_every_backend_is_known(self):
+        for backend in BACKENDS:
+            self.assertEqual(resolve_backend(backend), backend)
+
+    def test_unknown_backend(self):
+        """Typos are reported with the valid choices"""
+        with self.assertRaises(ValueError) as error:
+            resolve_backend("int4")
+        self.assertIn("bettertransformer", str(error.exception))
+
+    def test_default_threads_left_alone(self):
+        """A thread count of 0 never imports torch"""
+        with mock.patch.dict(sys.modules, {"torch": None}):
+            self.assertIsNone(set_num_threads(0))
+
+    def test_load_pipeline_tags_backend(self):
+        """The model is converted for the chosen backend before it is wrapped"""
+        fake_transformers = mock.MagicMock()
+        model = fake_transformers.AutoModelForCausalLM.from_pretrained.return_value
+        with mock.patch.dict(sys.modules, {"transformers": fake_transformers}), \
+                mock.patch.object(backends, "apply_backend", side_effect=lambda model, name: ("converted", name)):
+            pipe = load_pipeline("gpt2", backend="int8", num_threads=0, max_new_tokens=10)
+        model.eval.assert_called_once_with()
+        fake_transformers.pipeline.assert_called_once_with(
+            "text-generation", model=("converted", "int8"),
+            tokenizer=fake_transformers.AutoTokenizer.from_pretrained.return_value, max_new_tokens=10)
+        self.assertEqual(pipe.backend, "int8")
+
+
+@unittest.skipUnless(is_available("torch"), "torch is not installed")
+class TestBackendConversion(unittest.TestCase):
+    """Test cases for the torch model conversions"""
+
+    def setUp(self):
+        import torch
+
+        self.torch = torch
+        self.model = torch.nn.Sequential(torch.nn.Linear(16, 16), torch.nn.ReLU(), torch.nn.Linear(16, 4))
+
+    def test_fp32_is_untouched(self):
+        self.assertIs(apply_backend(self.model, "fp32"), self.model)
+
+    def test_int8_quantizes_linear_layers(self):
+        """Dynamic quantization swaps Linear layers and keeps outputs close"""
+        inputs = self.torch.randn(2, 16)
+        expected = self.model(inputs)
+        quantized = apply_backend(self.model, "int8")
+        self.assertNotIsInstance(quantized[0], self.torch.nn.Linear)
+        self.assertTrue(self.torch.allclose(quantized(inputs), expected, atol=0.1))
+
+
+if __name__ == "__main__":
+    unittest.main()
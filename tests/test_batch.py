@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the non-interactive batch mode
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import tempfile
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from unittest import mock
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from assistant import AI_AVAILABLE, PortfolioAssistant, Route
+from batch import BatchRunner, iter_queries
+from support import isolate_data_cache
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+
+setUpModule = isolate_data_cache
+
+
+class FakeAIAssistant:
+    """Answers 'ai:' questions slowly, tracking how many overlap"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.ended = 0
+        self.lock = threading.Lock()
+
+    def route(self, text, session=None):
+        return Route('ai' if text.startswith('ai:') else 'keyword', text)
+
+    def get_response(self, text, session=None, route=None):
+        if text == 'boom':
+            raise RuntimeError("broken")
+        if route.handler != 'ai':
+            return f"\x1b[34m{text.upper()}\x1b[0m"
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+        return f"answer to {text[3:].strip()}"
+
+    def end_session(self, session):
+        with self.lock:
+            self.ended += 1
+
+
+class CountingWriter(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+class TestBatchMode(unittest.TestCase):
+    """Test cases for JSONL batch answering"""
+
+    def run_batch(self, lines, assistant=None, **kwargs):
+        out = CountingWriter()
+        runner = BatchRunner(assistant or FakeAIAssistant(), **kwargs)
+        counts = runner.run(lines, out)
+        return [json.loads(line) for line in out.getvalue().splitlines()], counts, out
+
+    def test_input_formats(self):
+        """Plain lines, JSON strings and JSON objects are all accepted"""
+        queries = list(iter_queries(['skills\n', '\n', '{"id": "q7", "query": "contact"}', '"ai: hi"', '{oops']))
+        self.assertEqual(queries, [(1, 'skills'), ('q7', 'contact'), (4, 'ai: hi'), (5, '{oops')])
+
+    def test_results_in_input_order(self):
+        """AI answers overlap with each other but come out in order"""
+        lines = [f"ai: q{i}" if i % 3 else f"cmd{i}" for i in range(30)]
+        records, counts, _ = self.run_batch(lines, max_pending_ai=8)
+        self.assertEqual([record['query'] for record in records], lines)
+        self.assertEqual(records[1], {"id": 2, "query": "ai: q1", "route": "ai", "response": "answer to q1"})
+        self.assertEqual(records[0]['response'], "CMD0")
+        self.assertEqual(counts, {"queries": 30, "keyword": 10, "ai": 20, "errors": 0})
+
+    def test_ai_queries_in_flight_together(self):
+        """Several AI questions wait on the model at once, never more than the window"""
+        assistant = FakeAIAssistant()
+        self.run_batch([f"ai: q{i}" for i in range(20)], assistant, max_pending_ai=4)
+        self.assertGreater(assistant.peak, 1)
+        self.assertLessEqual(assistant.peak, 4)
+        # Every record's one-question conversation is ended
+        self.assertEqual(assistant.ended, 20)
+
+    def test_chunked_output_and_errors(self):
+        """Output is written a chunk at a time; failures become error records"""
+        records, counts, out = self.run_batch(["skills"] * 9 + ["boom"], chunk_size=4)
+        self.assertEqual(out.writes, 3)
+        self.assertEqual(records[-1]["error"], "broken")
+        self.assertEqual(counts["errors"], 1)
+
+    def test_real_assistant_keyword_queries(self):
+        """Portfolio commands come back without colour codes"""
+        assistant = PortfolioAssistant(banner=False)
+        assistant.data = {"name": "Batch User", "skills": ["Python"]}
+        records, _, _ = self.run_batch(["skills", "contact"], assistant)
+        self.assertIn("Python", records[0]["response"])
+        self.assertNotIn("\x1b[", records[0]["response"])
+
+    def test_ai_failures_are_errors(self):
+        """A generation that fails is an error record, not an answer"""
+        assistant = PortfolioAssistant(banner=False)
+        assistant.data = {"name": "Batch User", "skills": ["Python"]}
+        assistant._ai_loaded = True
+        assistant.ai_chatbot = object()
+        assistant.ai_batcher = mock.Mock(side_effect=RuntimeError("out of memory"))
+        records, counts, _ = self.run_batch(["ai: what is your favourite food", "skills"], assistant)
+        self.assertEqual(records[0]["error"], "AI error: out of memory")
+        self.assertNotIn("response", records[0])
+        self.assertIn("Python", records[1]["response"])
+        self.assertEqual(counts["errors"], 1)
+
+    @unittest.skipIf(AI_AVAILABLE, "would load the real model")
+    def test_exit_status_reports_failures(self):
+        """python assistant.py --batch exits non-zero when any record failed"""
+        with tempfile.TemporaryDirectory() as root:
+            queries = os.path.join(root, "queries.txt")
+            for lines, status in ((["skills"], 0), (["skills", "ai: what is your favourite food"], 1)):
+                with open(queries, "w") as file:
+                    file.write("\n".join(lines))
+                env = dict(os.environ, BOTFOLIO_DATA_CACHE_DIR=root)
+                result = subprocess.run([sys.executable, os.path.join(SRC_DIR, "assistant.py"), "--batch", queries],
+                                        capture_output=True, text=True, env=env, timeout=60)
+                self.assertEqual(result.returncode, status, result.stderr)
+                self.assertEqual(len(result.stdout.splitlines()), len(lines))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for AI micro-batching
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import os
+import sys
+import threading
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from batching import MicroBatcher
+
+
+class FakeModel:
+    """Records batch sizes and echoes prompts like a text-generation pipeline"""
+
+    def __init__(self):
+        self.batches = []
+        self.release = threading.Event()
+
+    def __call__(self, prompts, **kwargs):
+        self.release.wait(5)
+        self.batches.append((len(prompts), kwargs))
+        return [[{"generated_text": f"{prompt}!"}] for prompt in prompts]
+
+
+class TestMicroBatcher(unittest.TestCase):
+    """Test cases for the micro-batching queue"""
+
+    def setUp(self):
+        self.model = FakeModel()
+        self.batcher = MicroBatcher(self.model, max_batch_size=4, max_wait_ms=50)
+
+    def tearDown(self):
+        self.model.release.set()
+        self.batcher.close()
+
+    def test_single_prompt(self):
+        """A lone prompt resolves like an unbatched call"""
+        self.model.release.set()
+        self.assertEqual(self.batcher("hi", max_length=10), [{"generated_text": "hi!"}])
+
+    def test_concurrent_prompts_share_a_batch(self):
+        """Prompts arriving together run as one forward pass"""
+        futures = [self.batcher.submit(f"q{i}", max_length=10) for i in range(4)]
+        self.model.release.set()
+        results = [future.result(5)[0]["generated_text"] for future in futures]
+        self.assertEqual(results, ["q0!", "q1!", "q2!", "q3!"])
+        self.assertEqual(self.model.batches, [(4, {"max_length": 10})])
+        self.assertEqual(self.batcher.stats()["avg_batch_size"], 4.0)
+
+    def test_batch_size_limit_and_option_groups(self):
+        """Batches respect the size cap and never mix generation options"""
+        futures = [self.batcher.submit("a", max_length=10) for _ in range(5)]
+        futures.append(self.batcher.submit("b", max_length=20))
+        self.model.release.set()
+        for future in futures:
+            future.result(5)
+        sizes = sorted(size for size, _ in self.model.batches)
+        self.assertEqual(sum(sizes), 6)
+        self.assertTrue(all(size <= 4 for size in sizes))
+        self.assertIn((1, {"max_length": 20}), self.model.batches)
+
+    def test_errors_reach_every_caller(self):
+        """A failed batch fails each of its futures"""
+        def broken(prompts, **kwargs):
+            raise RuntimeError("model crashed")
+        batcher = MicroBatcher(broken, max_batch_size=2, max_wait_ms=1)
+        try:
+            with self.assertRaises(RuntimeError):
+                batcher("hi")
+        finally:
+            batcher.close()
+
+    def test_bad_requests_fail_alone(self):
+        """Unusable options or a short output fail their futures; the worker carries on"""
+        self.model.release.set()
+        with self.assertRaises(TypeError):
+            self.batcher("hi", stop_words=["bye"])
+        batcher = MicroBatcher(lambda prompts, **kwargs: [], max_batch_size=2, max_wait_ms=1)
+        try:
+            with self.assertRaisesRegex(RuntimeError, "0 outputs for 1 prompts"):
+                batcher.submit("hi").result(5)
+        finally:
+            batcher.close()
+        self.assertEqual(self.batcher("again"), [{"generated_text": "again!"}])
+
+    def test_submit_after_close_rejected(self):
+        self.model.release.set()
+        self.batcher("hi")
+        self.batcher.close()
+        with self.assertRaises(RuntimeError):
+            self.batcher.submit("late")
+
+    def test_submit_racing_close_never_hangs(self):
+        """Every prompt accepted while closing is still answered"""
+        self.model.release.set()
+        accepted = []
+
+        def submit_many():
+            for i in range(200):
+                try:
+                    accepted.append(self.batcher.submit(f"q{i}"))
+                except RuntimeError:
+                    return
+        threads = [threading.Thread(target=submit_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        self.batcher.close()
+        for thread in threads:
+            thread.join()
+        for future in accepted:
+            self.assertTrue(future.result(5)[0]["generated_text"].endswith("!"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the benchmark suite
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import json
+import os
+import sys
+from unittest import mock
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from assistant import SECTION_FIELDS
+from benchmark import bench_answers, bench_backends, bench_render, compare, make_data, result
+from support import isolate_data_cache
+
+
+setUpModule = isolate_data_cache
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """Test cases for the machine-readable benchmark report"""
+
+    def test_synthetic_data_scales(self):
+        data = make_data(50)
+        for key in ('skills', 'projects', 'experience', 'certifications'):
+            self.assertEqual(len(data[key]), 50)
+
+    def test_render_results_are_json(self):
+        """Every section is timed per size, and the report serialises cleanly"""
+        results = bench_render([3])
+        self.assertEqual({record['name'] for record in results}, set(SECTION_FIELDS))
+        self.assertTrue(all(record['seconds'] > 0 and record['params'] == {'size': 3} for record in results))
+        self.assertEqual(json.loads(json.dumps(results)), results)
+
+    def test_compare_flags_slowdowns_only(self):
+        """Results slower than the threshold are regressions; skipped ones are ignored"""
+        baseline = {"results": [result("render", "get_skills_info", 1.0, size=10),
+                                result("routing", "get_response", 1.0, command="skills"),
+                                {"suite": "ai", "name": "generate_response", "params": {}, "skipped": "no model"}]}
+        current = {"results": [result("render", "get_skills_info", 1.5, size=10),
+                               result("routing", "get_response", 0.5, command="skills"),
+                               result("ai", "generate_response", 9.0)]}
+        regressions = compare(baseline, current, threshold=0.25)
+        self.assertEqual([(record['name'], round(change, 2)) for record, change in regressions],
+                         [("get_skills_info", 0.5)])
+
+    def test_answer_lookups_timed(self):
+        """Hits, tech questions and misses are separate, comparable results"""
+        results = bench_answers(size=5)
+        self.assertEqual([record['params'].get('query') for record in results], [None, '<hit>', '<tech>', '<miss>'])
+        self.assertTrue(all(record['seconds'] > 0 for record in results))
+
+    def test_backend_results_from_child_process(self):
+        """Each backend's child measurement becomes result records; failures are skipped, not fatal"""
+        sample = {"threads": 4, "load": 2.0, "first_call": 0.5, "token": 0.01, "rss_mb": 500.0, "model_rss_mb": 400.0}
+        outputs = [mock.Mock(returncode=0, stdout=json.dumps(sample) + "\n", stderr=""),
+                   mock.Mock(returncode=1, stdout="", stderr="Traceback\nImportError: optimum")]
+        with mock.patch("benchmark.is_available", return_value=True), \
+                mock.patch("benchmark.subprocess.run", side_effect=outputs):
+            results = bench_backends("gpt2", ["fp32", "bettertransformer"])
+        self.assertEqual([(record['name'], record.get('seconds')) for record in results],
+                         [("load", 2.0), ("first_call", 0.5), ("token", 0.01), ("load", None)])
+        self.assertEqual(results[2]['rss_mb'], 500.0)
+        self.assertEqual(results[3]['skipped'], "ImportError: optimum")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the hot-reloading data store
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import json
+import tempfile
+import os
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from datastore import DataStore, changed_keys
+from support import isolate_data_cache
+
+
+setUpModule = isolate_data_cache
+
+
+class TestDataStore(unittest.TestCase):
+    """Test cases for the watched data store"""
+
+    def setUp(self):
+        """Create a temporary data file"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "data.json")
+        self.write({"name": "Test User", "skills": ["Python"]})
+        self.store = DataStore(self.path)
+        self.store.ensure_loaded()
+
+    def tearDown(self):
+        self.store.stop()
+        self.tmpdir.cleanup()
+
+    def write(self, data, text=None):
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write(text if text is not None else json.dumps(data))
+        # Make sure the change is visible even on coarse mtime filesystems
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_initial_load(self):
+        """The file should be parsed once on first use"""
+        self.assertEqual(self.store.data["name"], "Test User")
+        self.assertEqual(self.store.version, 1)
+        self.assertFalse(self.store.check())
+
+    def test_reload_on_change(self):
+        """A modified file should be swapped in with the changed keys reported"""
+        events = []
+        self.store.subscribe(lambda changed, snapshot: events.append(changed))
+        old_snapshot = self.store.snapshot
+
+        self.write({"name": "Test User", "skills": ["Python", "Go"]})
+        self.assertTrue(self.store.check())
+
+        self.assertEqual(self.store.data["skills"], ["Python", "Go"])
+        self.assertEqual(events, [frozenset({"skills"})])
+        # Readers holding the old snapshot keep a consistent view
+        self.assertEqual(old_snapshot.data["skills"], ["Python"])
+
+    def test_malformed_file_keeps_previous_data(self):
+        """A broken edit should not replace the served data"""
+        self.write(None, text="{not json")
+        self.assertFalse(self.store.check())
+        self.assertEqual(self.store.data["name"], "Test User")
+        # The broken file isn't retried until it changes again
+        self.assertFalse(self.store.check())
+
+    def test_changed_keys(self):
+        """Only differing top-level keys are reported"""
+        old = {"a": 1, "b": [1], "c": 3}
+        new = {"a": 1, "b": [2], "d": 4}
+        self.assertEqual(changed_keys(old, new), frozenset({"b", "c", "d"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the intent classifier
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import os
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deps import is_available
+from intents import IntentClassifier, char_ngrams
+
+
+class TestIntentClassifier(unittest.TestCase):
+    """Test cases for char n-gram TF-IDF intent matching"""
+
+    def setUp(self):
+        self.classifier = IntentClassifier(threshold=0.5, use_numpy=False)
+
+    def test_ngrams_skip_filler_words(self):
+        """Only content words contribute n-grams, with word edges marked"""
+        grams = char_ngrams("Where did you STUDY?")
+        self.assertIn(" stu", grams)
+        self.assertIn("dy ", grams)
+        self.assertFalse(any("whe" in gram or "you" in gram for gram in grams))
+
+    def test_paraphrases_reach_handlers(self):
+        """Questions without any command alias map to the right section"""
+        cases = {
+            "where did you study": "get_education_info",
+            "what's your graduation year": "get_education_info",
+            "what have you built": "get_projects_info",
+            "which programming languages": "get_skills_info",
+            "did you do any internships": "get_experience_info",
+            "how do I reach you": "get_contact_info",
+            "got any awards?": "get_certifications_info",
+            "can you make me laugh": "get_joke",
+        }
+        for question, handler in cases.items():
+            with self.subTest(question=question):
+                self.assertEqual(self.classifier.classify(question)[0], handler)
+
+    def test_unrelated_text_below_threshold(self):
+        """Off-topic input is left for the model or the default reply"""
+        for question in ("what is your favourite food", "hello", "who are you",
+                         "what is the airspeed velocity of an unladen swallow", "", "?!"):
+            with self.subTest(question=question):
+                self.assertIsNone(self.classifier.classify(question))
+
+    def test_threshold_controls_escalation(self):
+        """Confidence is reported and compared with the threshold"""
+        handler, confidence = self.classifier.classify("where did you go to university")
+        self.assertEqual(handler, "get_education_info")
+        self.assertTrue(0.5 <= confidence <= 1.0)
+        strict = IntentClassifier(threshold=1.01, use_numpy=False)
+        self.assertIsNone(strict.classify("where did you go to university"))
+
+    def test_custom_examples(self):
+        """The example table is extensible"""
+        classifier = IntentClassifier({"get_stats": ("how fast are you",), "get_help": ("what can you do",)},
+                                      threshold=0.5, use_numpy=False)
+        self.assertEqual(classifier.classify("how fast")[0], "get_stats")
+
+    @unittest.skipUnless(is_available("numpy"), "numpy is not installed")
+    def test_numpy_matches_pure_python(self):
+        """The vectorized path scores exactly like the inverted index"""
+        vectorized = IntentClassifier(threshold=0.5, use_numpy=True)
+        for question in ("where did you study", "what tools do you use", "hello there"):
+            pure, fast = self.classifier.scores(question), vectorized.scores(question)
+            self.assertEqual(set(pure), set(fast))
+            for handler in pure:
+                self.assertAlmostEqual(pure[handler], fast[handler], places=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
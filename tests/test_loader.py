@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the data loader and compiled snapshots
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import json
+import tempfile
+import os
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import loader
+from loader import DataError, load_file, parse, validate
+
+
+class TestValidation(unittest.TestCase):
+    """Test cases for parsing and the schema check"""
+
+    def test_malformed_json_reports_position(self):
+        """Bad JSON raises DataError (a ValueError) saying where"""
+        with self.assertRaises(DataError) as caught:
+            parse(b'{"name": "Test",\n "skills": [}', "data.json")
+        self.assertIsInstance(caught.exception, ValueError)
+        self.assertIn("data.json is not valid JSON", str(caught.exception))
+
+    def test_schema_problems_listed_together(self):
+        """Every wrongly-typed field is reported at once"""
+        with self.assertRaises(DataError) as caught:
+            validate({"name": ["Test"], "skills": "Python", "projects": [{"name": "A"}, 3],
+                      "contact": "me@example.com"})
+        message = str(caught.exception)
+        for problem in ("'name' should be text", "'skills' should be a list",
+                        "'projects[1]' should be text or an object", "'contact' should be an object"):
+            self.assertIn(problem, message)
+        with self.assertRaises(DataError):
+            validate(["not", "an", "object"])
+
+    def test_valid_data_passes_through(self):
+        """Extra keys and mixed project entries are fine"""
+        data = {"name": "Test", "graduation_year": 2026, "projects": ["Plain", {"name": "A"}],
+                "favourite_editor": "vim"}
+        self.assertIs(validate(data), data)
+
+
+class TestCompiledSnapshots(unittest.TestCase):
+    """Test cases for the content-hash keyed snapshot cache"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.tmpdir.name) / "cache"
+        self.path = Path(self.tmpdir.name) / "data.json"
+        self.path.write_text(json.dumps({"name": "Test User",
+                                         "projects": [{"name": "Bot", "tech": ["Python"]}]}))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_only_large_files_cached_by_default(self):
+        """Small files are parsed every time and leave nothing in the cache"""
+        with mock.patch.dict(os.environ, {"BOTFOLIO_DATA_CACHE_DIR": str(self.cache_dir)}):
+            load_file(self.path)
+            self.assertFalse(self.cache_dir.exists())
+            with mock.patch.dict(os.environ, {"BOTFOLIO_DATA_SNAPSHOT_MIN_BYTES": "16"}):
+                load_file(self.path)
+        self.assertEqual(len(list(self.cache_dir.glob("*.pickle"))), 1)
+
+    def test_second_load_skips_parsing(self):
+        """An unchanged file is served from the snapshot without parse or validate"""
+        data, portfolio = load_file(self.path, self.cache_dir, use_snapshot=True)
+        self.assertEqual(portfolio.projects_matching("python")[0].name, "Bot")
+        self.assertEqual(len(list(self.cache_dir.glob("*.pickle"))), 1)
+
+        with mock.patch.object(loader, "parse") as parse_mock, \
+             mock.patch.object(loader, "validate") as validate_mock:
+            cached, cached_portfolio = load_file(self.path, self.cache_dir, use_snapshot=True)
+        parse_mock.assert_not_called()
+        validate_mock.assert_not_called()
+        self.assertEqual(cached, data)
+        self.assertEqual(cached_portfolio.by_tech, {"python": (0,)})
+
+    def test_changed_content_recompiles(self):
+        """Editing the file changes the key, so stale snapshots are never used"""
+        load_file(self.path, self.cache_dir, use_snapshot=True)
+        self.path.write_text(json.dumps({"name": "Renamed"}))
+        data, _ = load_file(self.path, self.cache_dir, use_snapshot=True)
+        self.assertEqual(data["name"], "Renamed")
+        self.assertEqual(len(list(self.cache_dir.glob("*.pickle"))), 2)
+
+    def test_corrupt_snapshot_rebuilt(self):
+        """A truncated snapshot is ignored and rewritten"""
+        load_file(self.path, self.cache_dir, use_snapshot=True)
+        snapshot, = self.cache_dir.glob("*.pickle")
+        snapshot.write_bytes(b"\x80\x05garbage")
+        data, _ = load_file(self.path, self.cache_dir, use_snapshot=True)
+        self.assertEqual(data["name"], "Test User")
+
+    def test_old_snapshots_pruned(self):
+        """Only the most recently used snapshots are kept"""
+        with mock.patch.object(loader, "SNAPSHOT_KEEP", 2):
+            for name in ("First", "Second", "Third"):
+                self.path.write_text(json.dumps({"name": name}))
+                load_file(self.path, self.cache_dir, use_snapshot=True)
+        self.assertEqual(len(list(self.cache_dir.glob("*.pickle"))), 2)
+        data, _ = load_file(self.path, self.cache_dir, use_snapshot=True)
+        self.assertEqual(data["name"], "Third")
+
+    def test_failed_write_leaves_no_temp_file(self):
+        with mock.patch.object(loader.os, "replace", side_effect=OSError("disk full")):
+            load_file(self.path, self.cache_dir, use_snapshot=True)
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+    @unittest.skipUnless(os.name == "posix", "needs POSIX permissions")
+    def test_writable_by_others_not_trusted(self):
+        """The cache is private, and a snapshot others could have changed is never unpickled"""
+        load_file(self.path, self.cache_dir, use_snapshot=True)
+        self.assertEqual(self.cache_dir.stat().st_mode & 0o777, 0o700)
+        snapshot, = self.cache_dir.glob("*.pickle")
+        snapshot.chmod(0o666)
+        with mock.patch.object(loader.pickle, "load") as pickle_load:
+            data, _ = load_file(self.path, self.cache_dir, use_snapshot=True)
+        pickle_load.assert_not_called()
+        self.assertEqual(data["name"], "Test User")
+
+    def test_invalid_file_not_cached(self):
+        """Malformed files raise and leave nothing behind"""
+        self.path.write_text('{"name": ')
+        with self.assertRaises(DataError):
+            load_file(self.path, self.cache_dir, use_snapshot=True)
+        self.assertFalse(self.cache_dir.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for conversation memory
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import os
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from memory import ConversationMemory, is_follow_up
+
+
+def words(text):
+    return len(text.split())
+
+
+class TestConversationMemory(unittest.TestCase):
+    """Test cases for the token-budgeted rolling window"""
+
+    def setUp(self):
+        self.memory = ConversationMemory(budget=60, count=words)
+
+    def test_history_grows_at_the_end(self):
+        """Until a compaction, each render extends the previous one"""
+        self.memory.add("what have you built?", "A portfolio bot.")
+        first = self.memory.render()
+        self.memory.add("tell me more", "It answers questions.")
+        self.assertTrue(self.memory.render().startswith(first))
+        self.assertEqual(first, "Question: what have you built?\nAnswer: A portfolio bot.\n\n")
+        self.assertEqual(self.memory.last_question, "tell me more")
+
+    def test_compaction_keeps_budget_and_summarizes(self):
+        """Old turns are dropped to half the budget, their questions summarized"""
+        for i in range(10):
+            self.memory.add(f"question number {i} about projects", "An answer of a few words here.")
+            self.assertLessEqual(self.memory.tokens + self.memory.summary_tokens, 60)
+        stats = self.memory.stats()
+        self.assertGreater(stats["compactions"], 0)
+        text = self.memory.render()
+        self.assertTrue(text.startswith("Earlier questions: "))
+        self.assertIn("Question: question number 9 about projects", text)
+        self.assertNotIn("Question: question number 0", text)
+        self.assertLessEqual(self.memory.summary_tokens, 15)
+
+    def test_compactions_are_rare(self):
+        """Dropping to half the budget leaves room for several more turns"""
+        for i in range(20):
+            self.memory.add(f"question {i}", "short answer")
+        self.assertLessEqual(self.memory.compactions, 5)
+
+    def test_zero_budget_remembers_nothing(self):
+        memory = ConversationMemory(budget=0)
+        memory.add("hi", "hello")
+        self.assertEqual((len(memory), memory.render()), (0, ""))
+
+    def test_clear(self):
+        self.memory.add("hi", "hello")
+        self.memory.clear()
+        self.assertEqual((len(self.memory), self.memory.render(), self.memory.tokens), (0, "", 0))
+
+    def test_follow_up_detection(self):
+        """References to an earlier turn are recognized; standalone questions are not"""
+        for question in ("tell me more about that project", "why?", "what else", "how does it work"):
+            with self.subTest(question=question):
+                self.assertTrue(is_follow_up(question))
+        for question in ("what languages do you know", "where did you study"):
+            with self.subTest(question=question):
+                self.assertFalse(is_follow_up(question))
+
+
+if __name__ == "__main__":
+    unittest.main()
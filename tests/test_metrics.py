@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for request metrics
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from metrics import NULL_TIMER, Histogram, Metrics
+
+
+class TestMetrics(unittest.TestCase):
+    """Test cases for histograms, counters and their export formats"""
+
+    def setUp(self):
+        self.metrics = Metrics(enabled=True)
+
+    def test_histogram_quantiles(self):
+        """Quantiles report the upper bound of their bucket"""
+        histogram = Histogram()
+        for value in [0.0002] * 90 + [0.3] * 10:
+            histogram.observe(value)
+        self.assertEqual(histogram.count, 100)
+        self.assertEqual(histogram.quantile(0.5), 0.0005)
+        self.assertEqual(histogram.quantile(0.99), 0.5)
+
+    def test_disabled_is_a_no_op(self):
+        metrics = Metrics(enabled=False)
+        self.assertIs(metrics.timer("request_seconds"), NULL_TIMER)
+        metrics.observe("request_seconds", 1.0, route="x")
+        metrics.inc("requests_total", route="x")
+        self.assertEqual(metrics.snapshot(), {"enabled": False, "histograms": [], "counters": []})
+
+    def test_timer_and_labels(self):
+        """Series are kept apart by their labels"""
+        with self.metrics.timer("request_seconds", route="skills"):
+            pass
+        self.metrics.observe("request_seconds", 0.2, route="ai")
+        self.metrics.inc("tokens_total", 5, model="gpt2")
+        self.metrics.inc("tokens_total", 7, model="gpt2")
+        snapshot = self.metrics.snapshot()
+        self.assertEqual([h["labels"]["route"] for h in snapshot["histograms"]], ["ai", "skills"])
+        self.assertEqual(snapshot["counters"], [{"name": "tokens_total", "labels": {"model": "gpt2"}, "value": 12}])
+
+    def test_prometheus_text(self):
+        """Buckets are cumulative and end with +Inf, followed by sum and count"""
+        self.metrics.observe("request_seconds", 0.002, route="skills")
+        self.metrics.observe("request_seconds", 0.2, route="skills")
+        text = self.metrics.to_prometheus()
+        self.assertIn("# TYPE botfolio_request_seconds histogram", text)
+        self.assertIn('botfolio_request_seconds_bucket{route="skills",le="0.005"} 1', text)
+        self.assertIn('botfolio_request_seconds_bucket{route="skills",le="+Inf"} 2', text)
+        self.assertIn('botfolio_request_seconds_count{route="skills"} 2', text)
+
+    def test_dump_formats(self):
+        """*.json paths get JSON, anything else Prometheus text"""
+        self.metrics.inc("requests_total", route="skills")
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, "metrics.json")
+            prom_path = os.path.join(directory, "metrics.prom")
+            self.metrics.dump(json_path)
+            self.metrics.dump(prom_path)
+            with open(json_path, encoding="utf-8") as file:
+                self.assertEqual(json.load(file)["counters"][0]["value"], 1)
+            with open(prom_path, encoding="utf-8") as file:
+                self.assertIn('botfolio_requests_total{route="skills"} 1', file.read())
+            self.assertEqual(sorted(os.listdir(directory)), ["metrics.json", "metrics.prom"])
+
+
+if __name__ == "__main__":
+    unittest.main()
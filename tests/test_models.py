@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the shared model registry
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import gc
+import os
+import sys
+import threading
+import time
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models import ModelRegistry
+
+
+class FakePipeline:
+    """Stands in for a text-generation pipeline over a shared model"""
+
+    def __init__(self, model, tokenizer, backend, **kwargs):
+        self.model = model
+        self.tokenizer = tokenizer
+        self.backend = backend
+        self.kwargs = kwargs
+
+
+class TestModelRegistry(unittest.TestCase):
+    """Test cases for sharing one model per process"""
+
+    def setUp(self):
+        self.loads = []
+        self.registry = ModelRegistry(loader=self.load, builder=FakePipeline)
+
+    def load(self, model_name, backend):
+        self.loads.append((model_name, backend))
+        time.sleep(0.01)
+        return object(), f"{model_name}-tokenizer", backend
+
+    def test_same_model_loaded_once(self):
+        """Callers with different generation defaults share the weights"""
+        first = self.registry.acquire("gpt2", max_length=150)
+        second = self.registry.acquire("gpt2", backend="fp32", max_new_tokens=120)
+        self.assertIsNot(first, second)
+        self.assertIs(first.model, second.model)
+        self.assertEqual(second.kwargs, {"max_new_tokens": 120})
+        self.assertEqual(self.loads, [("gpt2", "fp32")])
+        self.assertEqual(self.registry.stats(), [{"model": "gpt2", "backend": "fp32", "refs": 2}])
+
+    def test_backends_are_separate(self):
+        """An int8 copy is a different model from the fp32 one"""
+        fp32 = self.registry.acquire("gpt2")
+        int8 = self.registry.acquire("gpt2", backend="int8")
+        self.assertIsNot(fp32.model, int8.model)
+        self.assertEqual(len(self.registry), 2)
+
+    def test_concurrent_acquire_loads_once(self):
+        """Racing first users wait for a single load"""
+        pipes = []
+        threads = [threading.Thread(target=lambda: pipes.append(self.registry.acquire("gpt2")))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(self.loads), 1)
+        self.assertEqual(len({id(pipe.model) for pipe in pipes}), 1)
+
+    def test_release_frees_after_last_user(self):
+        first = self.registry.acquire("gpt2")
+        second = self.registry.acquire("gpt2")
+        self.assertFalse(self.registry.release(first))
+        self.assertFalse(self.registry.release(first))
+        self.assertTrue(self.registry.release(second))
+        self.assertEqual(len(self.registry), 0)
+        self.registry.acquire("gpt2")
+        self.assertEqual(len(self.loads), 2)
+
+    def test_unload_and_preload(self):
+        """Explicit unload drops a model even while in use; preload pins it"""
+        pipe = self.registry.acquire("gpt2")
+        self.assertTrue(self.registry.unload("gpt2"))
+        self.assertFalse(self.registry.unload("gpt2"))
+        self.assertFalse(self.registry.release(pipe))
+
+        key = self.registry.preload("gpt2")
+        self.registry.release(self.registry.acquire("gpt2"))
+        self.assertIn(key, self.registry)
+        self.assertEqual(self.registry.prepare_fork(), [key])
+        gc.unfreeze()
+
+    def test_release_after_unload_spares_the_reload(self):
+        """Releasing a pipe from before an unload leaves the newly loaded copy alone"""
+        old = self.registry.acquire("gpt2")
+        self.registry.unload("gpt2")
+        new = self.registry.acquire("gpt2")
+        self.assertFalse(self.registry.release(old))
+        self.assertEqual(self.registry.stats(), [{"model": "gpt2", "backend": "fp32", "refs": 1}])
+        self.assertIs(self.registry.acquire("gpt2").model, new.model)
+        self.assertEqual(len(self.loads), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the typed portfolio model
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import os
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from portfolio import Portfolio, paginate, parse_listing_query
+
+
+class TestPortfolioModel(unittest.TestCase):
+    """Test cases for normalisation, indexes and paging"""
+
+    def setUp(self):
+        self.portfolio = Portfolio.from_data({
+            "projects": [
+                {"name": "Alpha", "description": "CLI tool", "tech": ["Python", "Click"], "tags": ["CLI"]},
+                "Plain Project",
+                {"name": "Gamma", "tech": ["Rust"], "tags": ["cli", "Systems"]},
+                {"name": "Delta", "description": "Web app", "tech": ["python", "Django"]},
+            ],
+            "experience": [{"role": "Intern", "company": "Acme"}, "Volunteer tutor"],
+            "skills": ["Python", "Rust"],
+        })
+
+    def test_entries_normalised_once(self):
+        """Mixed string/dict entries become uniform records with defaults filled in"""
+        alpha, plain, gamma, _ = self.portfolio.projects
+        self.assertEqual((alpha.name, alpha.tech, alpha.tags), ("Alpha", ("Python", "Click"), ("CLI",)))
+        self.assertIsNone(plain.description)
+        self.assertEqual(gamma.description, "No description available")
+        intern, tutor = self.portfolio.experience
+        self.assertEqual((intern.company, intern.duration), ("Acme", "Not specified"))
+        self.assertIsNone(tutor.company)
+        self.assertEqual(self.portfolio.certifications, ())
+
+    def test_tech_and_tag_indexes(self):
+        """Filters are case-insensitive and keep data order"""
+        self.assertEqual([p.name for p in self.portfolio.projects_matching("PYTHON")], ["Alpha", "Delta"])
+        self.assertEqual([p.name for p in self.portfolio.projects_matching("cli")], ["Alpha", "Gamma"])
+        self.assertEqual(self.portfolio.projects_matching("cobol"), ())
+
+    def test_paginate(self):
+        items = tuple(range(23))
+        page = paginate(items, 3, 10)
+        self.assertEqual((page.items, page.number, page.pages, page.total, page.start), ((20, 21, 22), 3, 3, 23, 20))
+        self.assertEqual(paginate(items, 99, 10).number, 3)
+        self.assertEqual(paginate((), 2, 10).pages, 1)
+
+    def test_parse_listing_query(self):
+        self.assertEqual(parse_listing_query("projects"), (1, None))
+        self.assertEqual(parse_listing_query("projects using python page 2"), (2, "python"))
+        self.assertEqual(parse_listing_query("page 3 of projects built with react"), (3, "react"))
+        self.assertEqual(parse_listing_query("what projects are in your portfolio"), (1, None))
+        self.assertEqual(parse_listing_query("projects using python?"), (1, "python"))
+        self.assertEqual(parse_listing_query("show me the projects you built with python."), (1, "python"))
+        self.assertEqual(parse_listing_query("projects using c++?"), (1, "c++"))
+
+
+if __name__ == "__main__":
+    unittest.main()
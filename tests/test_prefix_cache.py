@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for persona prefix caching
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import os
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from deps import is_available
+from prefix_cache import PrefixCache, prefix_generate
+
+
+class FakePipeline:
+    """Batched pipeline stand-in that records what it was asked"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, prompts, **kwargs):
+        self.calls.append(prompts)
+        return [[{"generated_text": prompt + " batched"}] for prompt in prompts]
+
+
+class FakePrefixCache:
+    def __init__(self, prefix):
+        self.prefix = prefix
+
+    def generate(self, prompt, **kwargs):
+        if not prompt.startswith(self.prefix):
+            return None
+        return [{"generated_text": prompt + " cached"}]
+
+
+class TestPrefixGenerate(unittest.TestCase):
+    """Test cases for routing prompts to the prefix cache"""
+
+    def setUp(self):
+        self.pipe = FakePipeline()
+        self.generate = prefix_generate(self.pipe, FakePrefixCache("You are Test."))
+
+    def test_lone_prompt_uses_cache(self):
+        outputs = self.generate(["You are Test. Question: hi"], max_new_tokens=5)
+        self.assertEqual(outputs, [[{"generated_text": "You are Test. Question: hi cached"}]])
+        self.assertEqual(self.pipe.calls, [])
+
+    def test_batches_and_other_prompts_use_pipeline(self):
+        """Batches, and prompts without the cached prefix, take the batched path"""
+        self.generate(["You are Test. a", "You are Test. b"])
+        self.generate(["Answer this question professionally: hi"])
+        self.assertEqual(self.pipe.calls, [["You are Test. a", "You are Test. b"],
+                                           ["Answer this question professionally: hi"]])
+
+
+class ByteTokenizer:
+    """One token per byte, enough to drive a tiny randomly initialised model"""
+
+    eos_token_id = 0
+
+    def __call__(self, text, return_tensors=None):
+        import torch
+
+        class Encoding:
+            input_ids = torch.tensor([list(text.encode("utf-8"))])
+        return Encoding()
+
+    def decode(self, ids, skip_special_tokens=True):
+        return bytes(int(i) for i in ids).decode("utf-8", errors="replace")
+
+
+@unittest.skipUnless(is_available("torch") and is_available("transformers"), "torch/transformers not installed")
+class TestPrefixCache(unittest.TestCase):
+    """Test cases for reusing a prefix's past_key_values"""
+
+    def setUp(self):
+        import torch
+        from transformers import GPT2Config, GPT2LMHeadModel
+
+        torch.manual_seed(0)
+
+        class Pipe:
+            model = GPT2LMHeadModel(GPT2Config(vocab_size=256, n_positions=256, n_embd=32, n_layer=2, n_head=2)).eval()
+            tokenizer = ByteTokenizer()
+        self.pipe = Pipe()
+        self.cache = PrefixCache(self.pipe)
+        self.prefix = "\nYou are Test User, a developer.\n\n"
+
+    def test_same_tokens_as_full_prefill(self):
+        """Greedy output is identical with and without the cached prefix"""
+        import torch
+
+        prompt = self.prefix + "Question: skills?\n\nAnswer:"
+        options = dict(max_new_tokens=8, do_sample=False, pad_token_id=0)
+        ids = self.pipe.tokenizer(prompt).input_ids
+        with torch.no_grad():
+            full = self.pipe.model.generate(ids, attention_mask=torch.ones_like(ids), **options)
+        expected = prompt + self.pipe.tokenizer.decode(full[0, ids.shape[1]:])
+
+        self.assertTrue(self.cache.prepare(self.prefix))
+        self.assertFalse(self.cache.prepare(self.prefix))
+        for _ in range(2):
+            self.assertEqual(self.cache.generate(prompt, **options), [{"generated_text": expected}])
+        self.assertEqual(self.cache.stats()["hits"], 2)
+
+    def test_history_extends_cached_prefix(self):
+        """A conversation's growing prefix reuses the persona's and its own last state"""
+        import torch
+
+        turn = "Question: skills?\nAnswer: C.\n\n"
+        prompt = self.prefix + turn + turn + "Question: why?\n\nAnswer:"
+        options = dict(max_new_tokens=8, do_sample=False, pad_token_id=0)
+        ids = self.pipe.tokenizer(prompt).input_ids
+        with torch.no_grad():
+            full = self.pipe.model.generate(ids, attention_mask=torch.ones_like(ids), **options)
+        expected = prompt + self.pipe.tokenizer.decode(full[0, ids.shape[1]:])
+
+        self.cache.prepare(self.prefix)
+        self.assertTrue(self.cache.prepare(self.prefix + turn, key=1))
+        self.assertTrue(self.cache.prepare(self.prefix + turn + turn, key=1))
+        self.assertEqual(self.cache.stats()["extensions"], 2)
+        self.assertEqual(self.cache.generate(prompt, **options), [{"generated_text": expected}])
+        self.assertEqual(self.cache.stats()["reused_tokens"], len(self.prefix + turn + turn) - 1)
+
+    def test_bounded_by_tokens_and_forgotten(self):
+        """Old conversations are dropped past max_tokens, and ended ones at once"""
+        cache = PrefixCache(self.pipe, max_tokens=3 * len(self.prefix))
+        cache.prepare(self.prefix)
+        for key in (1, 2, 3):
+            cache.prepare(self.prefix + f"Question: {key}?\nAnswer: C.\n\n", key=key)
+        self.assertLessEqual(cache.tokens, cache.max_tokens)
+        self.assertLess(cache.stats()["entries"], 4)
+        cache.forget(3)
+        cache.forget(3)
+        self.assertEqual(cache.tokens, sum(entry[1].shape[1] for entry in cache._entries.values()))
+        self.assertNotIn(3, cache._entries)
+
+    def test_streaming_uses_cached_prefix(self):
+        """Streamed text matches the cached generate() without calling the pipeline"""
+        from streaming import stream_pipeline
+
+        prompt = self.prefix + "Question: skills?\n\nAnswer:"
+        options = dict(max_new_tokens=8, do_sample=False, pad_token_id=0)
+        self.cache.prepare(self.prefix)
+        expected = self.cache.generate(prompt, **options)[0]["generated_text"][len(prompt):]
+        streamed = "".join(stream_pipeline(self.pipe, prompt, prefix_cache=self.cache, **options))
+        self.assertEqual(streamed, expected)
+        self.assertEqual(self.cache.stats()["hits"], 2)
+
+    def test_other_prompts_miss(self):
+        self.cache.prepare(self.prefix)
+        self.assertIsNone(self.cache.generate("Answer this: hi", max_new_tokens=2))
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
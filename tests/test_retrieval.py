@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the portfolio retrieval index
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import os
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from retrieval import RetrievalIndex, iter_snippets, tokenize
+
+SAMPLE_DATA = {
+    "name": "Test User",
+    "title": "Test Developer",
+    "school": "Test University",
+    "degree": "Computer Science",
+    "graduation_year": "2026",
+    "location": "Bhubaneswar, India",
+    "skills": ["Python", "Cybersecurity", "Leadership"],
+    "projects": [
+        {"name": "Image Classifier", "description": "Deep learning image recognition",
+         "tech": ["Python", "TensorFlow"], "github": "https://github.com/test/classifier"},
+        {"name": "Static Site", "description": "Personal homepage", "tech": ["HTML", "CSS"]},
+        "Plain String Project",
+    ],
+    "experience": [
+        {"role": "Content Lead", "company": "Red Cross", "description": "Managed a writing team"},
+        {"role": "Security Intern", "company": "InfoTech", "description": "Cybersecurity analysis"},
+    ],
+    "certifications": ["Cloud Basics - IBM (2023)", "Scrum Fundamentals (2023)"],
+}
+
+
+class TestRetrievalIndex(unittest.TestCase):
+    """Test cases for BM25 retrieval over data.json"""
+
+    def setUp(self):
+        self.index = RetrievalIndex.from_data(SAMPLE_DATA)
+
+    def test_every_field_indexed(self):
+        """Projects (with tech and links), experience, certs and bio-like fields are covered"""
+        kinds = {snippet.kind for snippet in iter_snippets(SAMPLE_DATA)}
+        self.assertTrue({'project', 'experience', 'certification', 'skill', 'location', 'education'} <= kinds)
+        texts = " ".join(snippet.text for snippet in self.index.snippets)
+        self.assertIn("TensorFlow", texts)
+        self.assertIn("github.com/test/classifier", texts)
+        self.assertNotIn("Test User", texts)
+
+    def test_relevant_snippet_ranked_first(self):
+        """The best-matching fact comes first"""
+        self.assertEqual(self.index.search("image recognition project")[0].item["name"], "Image Classifier")
+        self.assertIn("Bhubaneswar", self.index.search("where are you located")[0].text)
+        self.assertIn("graduating 2026", self.index.search("when do you graduate")[0].text)
+
+    def test_kind_filter_and_limit(self):
+        """Results can be restricted to one kind of fact"""
+        results = self.index.search("cybersecurity", k=1, kinds={'experience'})
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].item["role"], "Security Intern")
+
+    def test_no_match(self):
+        """Questions with no known terms retrieve nothing"""
+        self.assertEqual(self.index.search("what do you"), [])
+        self.assertEqual(tokenize("What are your projects?"), ["project"])
+
+
+if __name__ == "__main__":
+    unittest.main()
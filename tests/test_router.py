@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the keyword router
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import os
+import random
+import sys
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from router import FuzzyIndex, KeywordRouter, edit_distance
+from assistant import COMMAND_ALIASES
+
+
+def linear_scan(query):
+    """Reference implementation: the original first-alias-wins substring scan"""
+    for alias, target in COMMAND_ALIASES:
+        if alias in query:
+            return alias, target
+    return None
+
+
+class TestKeywordRouter(unittest.TestCase):
+    """Test cases for the compiled keyword router"""
+
+    def setUp(self):
+        self.router = KeywordRouter(COMMAND_ALIASES)
+
+    def test_matches_linear_scan(self):
+        """Router should agree with the original linear scan"""
+        queries = [
+            "resume", "tell me about school", "network engineering",
+            "experience at work", "what tech do you know", "cvs and jobs",
+            "certificates please", "info about your job", "nothing here",
+            "", "helpful commands", "email or social", "funny joke",
+        ]
+        for query in queries:
+            self.assertEqual(self.router.match(query), linear_scan(query), query)
+
+    def test_priority_beats_position(self):
+        """An earlier alias wins even if it appears later in the query"""
+        alias, target = self.router.match("my experience at work")
+        self.assertEqual(alias, "work")
+        self.assertEqual(target, "get_projects_info")
+
+    def test_substring_inside_words(self):
+        """Aliases still match inside longer words"""
+        self.assertEqual(self.router.match("network")[0], "work")
+        self.assertEqual(self.router.match("tcv")[0], "cv")
+
+    def test_overlapping_suffixes(self):
+        """Aliases that are suffixes of other trie paths are found"""
+        router = KeywordRouter([("she", "a"), ("he", "b"), ("hers", "c")])
+        self.assertEqual(router.match("ushers"), ("she", "a"))
+        self.assertEqual(router.match("hers"), ("he", "b"))
+
+    def test_many_aliases_match_linear_scan(self):
+        """With hundreds of overlapping aliases the automaton still agrees with a scan"""
+        rng = random.Random(7)
+        aliases = list(dict.fromkeys("".join(rng.choice("abc") for _ in range(rng.randint(1, 6)))
+                                     for _ in range(300)))
+        router = KeywordRouter((alias, i) for i, alias in enumerate(aliases))
+        for _ in range(200):
+            query = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 40)))
+            expected = next(((alias, i) for i, alias in enumerate(aliases) if alias in query), None)
+            self.assertEqual(router.match(query), expected, query)
+
+    def test_add_after_build(self):
+        """Aliases registered after the first match are picked up"""
+        self.assertIsNone(self.router.match("portfolio"))
+        self.router.add("portfolio", "get_about_info")
+        self.assertEqual(self.router.match("portfolio"), ("portfolio", "get_about_info"))
+        self.assertIn("portfolio", self.router)
+
+
+class TestFuzzyIndex(unittest.TestCase):
+    """Test cases for typo-tolerant alias lookup"""
+
+    def setUp(self):
+        # The assistant passes every word of its intent examples
+        self.index = FuzzyIndex(COMMAND_ALIASES, ignore={"teaching", "show", "me", "your"})
+
+    def test_edit_distance(self):
+        """Insertions, deletions, substitutions and swaps each cost one"""
+        self.assertEqual(edit_distance("skils", "skills", 2), 1)
+        self.assertEqual(edit_distance("hlep", "help", 2), 1)
+        self.assertEqual(edit_distance("cirtifcates", "certificates", 2), 2)
+        self.assertEqual(edit_distance("python", "skills", 2), 3)
+
+    def test_common_typos_corrected(self):
+        """Misspelt aliases map to their command, reporting what was typed"""
+        cases = {
+            "skils": ("skils", "skills", "get_skills_info"),
+            "show me your projcts": ("projcts", "projects", "get_projects_info"),
+            "certifcates please": ("certifcates", "certificates", "get_certifications_info"),
+            "hlep": ("hlep", "help", "get_help"),
+            "resumé": ("resumé", "resume", "get_resume_info"),
+        }
+        for query, expected in cases.items():
+            with self.subTest(query=query):
+                self.assertEqual(self.index.match(query), expected)
+
+    def test_ordinary_words_left_alone(self):
+        """Short aliases only forgive swapped letters; ignored words never match"""
+        for query in ("into the wild", "teach me", "word up", "bob", "good morning", "teaching",
+                      "what content do you create", "sign the contract", "sunny day",
+                      "stars", "stays", "funky", "abort", "how many stars does your repo have"):
+            with self.subTest(query=query):
+                self.assertIsNone(self.index.match(query))
+
+    def test_known_words_left_alone(self):
+        """Words the caller knows (e.g. from the portfolio) are never corrected"""
+        self.assertEqual(self.index.match("contract")[1], "contact")
+        self.assertIsNone(self.index.match("contract", known={"contract"}))
+
+    def test_agrees_with_brute_force(self):
+        """The delete index finds what scanning every alias would"""
+        for word in ("skils", "projcts", "expereince", "contcat", "abuot", "metircs", "swallow"):
+            found = self.index.correct(word)
+            limit = FuzzyIndex.max_distance(len(word))
+            distances = {alias: edit_distance(word, alias, limit) for alias, _ in COMMAND_ALIASES}
+            best = min(distances.values())
+            if best > limit:
+                self.assertIsNone(found)
+            else:
+                self.assertEqual(found[2], best)
+                self.assertEqual(distances[found[0]], best)
+
+
+if __name__ == "__main__":
+    unittest.main()
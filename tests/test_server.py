@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the session server
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import asyncio
+import os
+import sys
+import threading
+from unittest import mock
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from server import PortfolioServer, ResponseFramer, encode_response, iter_response, listen_socket, read_response
+import assistant as assistant_module
+from assistant import PortfolioAssistant
+from tenants import TenantRegistry
+from support import isolate_data_cache
+
+
+setUpModule = isolate_data_cache
+
+
+class SlowAIAssistant(PortfolioAssistant):
+    """Assistant whose AI answers block until released"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def ai_response(self, query, stream=None, session=None):
+        self.release.wait(5)
+        if stream:
+            for piece in ("AI ", "says", ":\n.", " ", query):
+                stream(piece)
+        return f"AI says:\n. {query}"
+
+
+class HistoryAIAssistant(PortfolioAssistant):
+    """Assistant whose AI answers record the history they were given"""
+
+    def __init__(self):
+        super().__init__()
+        self.histories = []
+
+    def ai_response(self, query, stream=None, session=None):
+        memory = self.conversation(session)
+        self.histories.append(memory.render())
+        memory.add(query, f"Answer to {query}")
+        return f"Answer to {query}"
+
+
+class TestPortfolioServer(unittest.TestCase):
+    """Test cases for the asyncio session server"""
+
+    def setUp(self):
+        self.assistant = SlowAIAssistant()
+        self.assistant.data = {"name": "Server User", "skills": ["Python"]}
+
+    def tearDown(self):
+        self.assistant.release.set()
+
+    def run_async(self, coroutine):
+        return asyncio.run(asyncio.wait_for(coroutine, 10))
+
+    async def connect(self, port):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        await read_response(reader)  # greeting
+        return reader, writer
+
+    async def ask(self, session, text):
+        reader, writer = session
+        writer.write((text + '\n').encode('utf-8'))
+        await writer.drain()
+        return await read_response(reader)
+
+    def test_framing_round_trip(self):
+        """Responses with dots and blank lines survive framing"""
+        async def scenario():
+            reader = asyncio.StreamReader()
+            reader.feed_data(encode_response(".hidden\n\nline"))
+            reader.feed_eof()
+            return await read_response(reader)
+        self.assertEqual(self.run_async(scenario()), ".hidden\n\nline")
+
+    def test_streamed_framing(self):
+        """Chunked responses decode the same whether read whole or streamed"""
+        framer = ResponseFramer()
+        wire = b"".join([framer.chunk("a\n"), framer.chunk(".b"), framer.chunk("\n\n"), framer.end()])
+
+        async def scenario():
+            whole = asyncio.StreamReader()
+            whole.feed_data(wire)
+            whole.feed_eof()
+            pieces = asyncio.StreamReader()
+            pieces.feed_data(wire)
+            pieces.feed_eof()
+            return await read_response(whole), "".join([text async for text in iter_response(pieces)])
+        whole, streamed = self.run_async(scenario())
+        self.assertEqual(whole, "a\n.b\n\n")
+        self.assertEqual(streamed, whole)
+
+    def test_keyword_replies_not_blocked_by_ai(self):
+        """A slow AI answer in one session doesn't stall another session"""
+        async def scenario():
+            server = PortfolioServer(self.assistant, ai_workers=2)
+            await server.start(port=0)
+            port = server.server.sockets[0].getsockname()[1]
+            try:
+                first = await self.connect(port)
+                second = await self.connect(port)
+                ai_task = asyncio.ensure_future(self.ask(first, "ai: hello"))
+                await asyncio.sleep(0.05)
+                skills = await self.ask(second, "skills")
+                self.assertFalse(ai_task.done())
+                self.assistant.release.set()
+                ai_answer = await ai_task
+                for _, writer in (first, second):
+                    writer.close()
+                return skills, ai_answer
+            finally:
+                await server.close()
+
+        skills, ai_answer = self.run_async(scenario())
+        self.assertIn("Python", skills)
+        self.assertEqual(ai_answer, "AI says:\n. hello")
+
+    def test_ai_backpressure(self):
+        """AI questions beyond the pending limit get a busy reply"""
+        async def scenario():
+            server = PortfolioServer(self.assistant, ai_workers=1, max_pending_ai=1)
+            server.pending_ai = 1
+            try:
+                return await server.respond("ai: anything")
+            finally:
+                await server.close()
+        self.assertIn("busy", self.run_async(scenario()))
+
+    def test_ai_history_kept_per_session(self):
+        """One visitor's AI questions never show up in another's prompt"""
+        assistant = HistoryAIAssistant()
+
+        async def scenario():
+            server = PortfolioServer(assistant, ai_workers=1)
+            alice, bob = {}, {}
+            try:
+                await server.respond("ai: what is your salary expectation", session=alice)
+                await server.respond("ai: where are you based", session=bob)
+                await server.respond("ai: tell me more", session=alice)
+            finally:
+                await server.close()
+        self.run_async(scenario())
+        self.assertEqual(assistant.histories[1], "")
+        self.assertIn("salary", assistant.histories[2])
+        self.assertNotIn("based", assistant.histories[2])
+
+    def test_free_text_routed_once(self):
+        """Deciding whether a question needs the model is not repeated to answer it"""
+        assistant = HistoryAIAssistant()
+        assistant.data = {"name": "Server User", "school": "Test University"}
+        intents, spelling = assistant.intents, assistant.spelling
+
+        async def scenario(text):
+            server = PortfolioServer(assistant, ai_workers=1)
+            try:
+                return await server.respond(text, session={})
+            finally:
+                await server.close()
+
+        with mock.patch.object(assistant_module, 'AI_AVAILABLE', True):
+            for text, expected in (("where did you study", "Test University"),
+                                   ("what is your favourite food", "Answer to what is your favourite food")):
+                with self.subTest(text=text), \
+                        mock.patch.object(intents, 'classify', wraps=intents.classify) as classify, \
+                        mock.patch.object(spelling, 'match', wraps=spelling.match) as match:
+                    self.assertIn(expected, self.run_async(scenario(text)))
+                    self.assertEqual((classify.call_count, match.call_count), (1, 1))
+
+    def test_ended_session_forgets_its_history_prefix(self):
+        """A visitor leaving drops their conversation's cached key/values"""
+        assistant = HistoryAIAssistant()
+        assistant.ai_engine.prefix_cache = mock.Mock()
+
+        async def scenario():
+            server = PortfolioServer(assistant, ai_workers=1)
+            await server.start(port=0)
+            port = server.server.sockets[0].getsockname()[1]
+            try:
+                session = await self.connect(port)
+                await self.ask(session, "ai: where are you based")
+                session[1].close()
+                while server.sessions:
+                    await asyncio.sleep(0.01)
+            finally:
+                await server.close()
+        self.run_async(scenario())
+        assistant.ai_engine.prefix_cache.forget.assert_called_once()
+
+    def test_serve_on_inherited_socket(self):
+        """Preforked workers accept on a socket created before fork()"""
+        sock = listen_socket(port=0)
+        port = sock.getsockname()[1]
+
+        async def scenario():
+            server = PortfolioServer(self.assistant)
+            await server.start(sock=sock)
+            try:
+                session = await self.connect(port)
+                answer = await self.ask(session, "skills")
+                session[1].close()
+                return answer
+            finally:
+                await server.close()
+        self.assertIn("Python", self.run_async(scenario()))
+
+    def test_sessions_pick_a_tenant(self):
+        """With a tenant registry each session names the portfolio it wants"""
+        import json
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as root:
+            for name in ("alice", "bob"):
+                with open(os.path.join(root, f"{name}.json"), "w") as file:
+                    json.dump({"name": name.title(), "skills": [f"{name} skill"]}, file)
+            tenants = TenantRegistry(root)
+
+            async def scenario():
+                server = PortfolioServer(tenants=tenants)
+                await server.start(port=0)
+                port = server.server.sockets[0].getsockname()[1]
+                try:
+                    first, second = await self.connect(port), await self.connect(port)
+                    missing = await self.ask(first, "mallory")
+                    welcome = await self.ask(first, "alice")
+                    await self.ask(second, "bob")
+                    answers = (await self.ask(first, "skills"), await self.ask(second, "skills"))
+                    first[1].close()
+                    second[1].close()
+                    return missing, welcome, answers
+                finally:
+                    await server.close()
+            try:
+                missing, welcome, (alice, bob) = self.run_async(scenario())
+            finally:
+                tenants.close()
+        self.assertIn("Try one of: alice, bob", missing)
+        self.assertIn("Welcome to Alice", welcome)
+        self.assertIn("alice skill", alice)
+        self.assertIn("bob skill", bob)
+
+
+if __name__ == "__main__":
+    unittest.main()
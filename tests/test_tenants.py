@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for multi-tenant portfolio hosting
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import json
+import tempfile
+import os
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from datastore import _stores
+from loader import DataError
+from tenants import TenantRegistry, UnknownTenant
+from support import isolate_data_cache
+
+
+setUpModule = isolate_data_cache
+
+
+class TestTenantRegistry(unittest.TestCase):
+    """Test cases for lazy loading, LRU eviction and shared AI"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        for name in ("alice", "bob", "carol"):
+            self.write(name, {"name": name.title(), "skills": [f"{name} skill"],
+                              "resume_url": f"https://example.com/{name}.pdf"})
+        self.registry = TenantRegistry(self.root, capacity=2)
+
+    def tearDown(self):
+        self.registry.close()
+        self.tmpdir.cleanup()
+
+    def write(self, name, data):
+        (self.root / f"{name}.json").write_text(json.dumps(data))
+
+    def test_tenants_load_lazily_with_own_data(self):
+        """Nothing loads up front; each tenant answers from its own file"""
+        self.assertEqual(len(self.registry), 0)
+        self.assertEqual(self.registry.names(), ["alice", "bob", "carol"])
+        alice = self.registry.get("alice")
+        self.assertIs(self.registry.get("alice"), alice)
+        self.assertIn("alice skill", alice.get_response("skills"))
+        self.assertIn("https://example.com/alice.pdf", alice.get_response("resume"))
+        self.assertIn("bob skill", self.registry.get("bob").get_response("skills"))
+        self.assertEqual(self.registry.stats()["loads"], 2)
+
+    def test_least_recently_used_evicted(self):
+        """Loading past capacity drops the coldest tenant and its data"""
+        self.registry.get("alice")
+        self.registry.get("bob")
+        self.registry.get("alice")
+        self.registry.get("carol")
+        self.assertEqual(self.registry.stats()["loaded"], ["alice", "carol"])
+        self.assertNotIn("bob", self.registry)
+        self.assertNotIn((self.root / "bob.json").resolve(), _stores)
+        self.assertEqual(self.registry.stats()["evictions"], 1)
+        # An evicted tenant loads again on demand
+        self.assertIn("bob skill", self.registry.get("bob").get_response("skills"))
+
+    def test_caches_are_per_tenant_model_is_shared(self):
+        """Rendered sections stay separate while the AI engine and answer cache are common"""
+        alice, bob = self.registry.get("alice"), self.registry.get("bob")
+        alice.get_response("skills")
+        self.assertNotIn("get_skills_info", bob._section_cache)
+        self.assertIs(alice.ai_cache, bob.ai_cache)
+        self.assertIs(alice.ai_engine, bob.ai_engine)
+        self.assertIs(alice.ai_engine, self.registry.ai_engine)
+
+    def test_ai_answers_kept_per_tenant(self):
+        """Tenants sharing one persistent AI cache never see or drop each other's answers"""
+        self.write("bob", json.loads((self.root / "alice.json").read_text()))
+        settings = {"BOTFOLIO_AI_CACHE_PATH": str(self.root / "answers.sqlite"), "BOTFOLIO_AI_CACHE_SIZE": "3"}
+        with mock.patch.dict(os.environ, settings):
+            alice = self.registry.get("alice")
+            for question in ("q1", "q2"):
+                alice.ai_cache.put(question, f"Alice's {question}", alice.cache_namespace())
+            bob = self.registry.get("bob")
+            self.assertNotEqual(bob.cache_namespace(), alice.cache_namespace())
+            self.assertIsNone(bob.ai_cache.get("q1", bob.cache_namespace()))
+            bob.ai_cache.put("q3", "Bob's q3", bob.cache_namespace())
+            self.assertEqual(alice.ai_cache.get("q1", alice.cache_namespace()), "Alice's q1")
+            self.assertIs(bob.ai_cache, alice.ai_cache)
+            self.assertEqual(len(bob.ai_cache), 3)
+
+            # Both tenants' answers are on disk for the next process
+            self.registry.close()
+            self.registry = TenantRegistry(self.root, capacity=2)
+            alice, bob = self.registry.get("alice"), self.registry.get("bob")
+            self.assertEqual(alice.ai_cache.get("q2", alice.cache_namespace()), "Alice's q2")
+            self.assertEqual(bob.ai_cache.get("q3", bob.cache_namespace()), "Bob's q3")
+
+    def test_unknown_and_unsafe_names(self):
+        """Missing tenants and path tricks raise UnknownTenant"""
+        for name in ("dave", "../alice", ".hidden", ""):
+            with self.assertRaises(UnknownTenant):
+                self.registry.get(name)
+        self.assertEqual(len(self.registry), 0)
+
+    def test_malformed_tenant_reported(self):
+        """A broken file raises DataError instead of serving sample data"""
+        (self.root / "eve.json").write_text('{"name": ')
+        with self.assertRaises(DataError):
+            self.registry.get("eve")
+        self.assertNotIn("eve", self.registry)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the AI worker process pool
+
+Author: SSV
+Date: October 2026
+"""
+
+import unittest
+import os
+import signal
+import sys
+import threading
+import time
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from workers import (GenerationCancelled, GenerationInterrupted, GenerationTimeout, PoolBusy, WorkerCrashed,
+                     WorkerPool)
+
+
+# Worker factories must be importable by name: 'spawn' re-imports this module
+
+def echo_worker():
+    """Upper-cases the prompt; a few magic prompts misbehave on purpose"""
+    def generate(prompt, stream=None, **kwargs):
+        if prompt == "crash":
+            os._exit(3)
+        if prompt == "hang":
+            time.sleep(60)
+        if prompt == "boom":
+            raise ValueError("bad prompt")
+        if stream:
+            for word in prompt.split():
+                stream(word + " ")
+        return prompt.upper()
+    return generate
+
+
+def broken_worker():
+    raise ImportError("no model here")
+
+
+class TestWorkerPool(unittest.TestCase):
+    """Test cases for timeouts, cancellation and crash recovery"""
+
+    def setUp(self):
+        self.pool = WorkerPool(echo_worker, processes=1, timeout=5, max_pending=2)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_generate_and_stream(self):
+        """Answers come back whole, or piece by piece as they are produced"""
+        self.assertEqual(self.pool.generate("hello there"), "HELLO THERE")
+        pieces = []
+        self.assertEqual(self.pool.generate("one two", stream=pieces.append), "ONE TWO")
+        self.assertEqual(pieces, ["one ", "two "])
+        self.assertEqual(self.pool.stats()["completed"], 2)
+
+    def test_timeout_restarts_worker(self):
+        """A generation past its deadline fails, and the next one still runs"""
+        with self.assertRaises(GenerationTimeout):
+            self.pool.generate("hang", timeout=0.5)
+        self.assertEqual(self.pool.generate("after"), "AFTER")
+        stats = self.pool.stats()
+        self.assertEqual((stats["timeouts"], stats["restarts"]), (1, 1))
+
+    def test_crash_and_errors_are_contained(self):
+        """A dead worker is replaced; an exception only fails its own request"""
+        with self.assertRaises(WorkerCrashed):
+            self.pool.generate("crash")
+        with self.assertRaisesRegex(RuntimeError, "ValueError: bad prompt"):
+            self.pool.generate("boom")
+        self.assertEqual(self.pool.generate("still here"), "STILL HERE")
+        self.assertEqual(self.pool.stats()["restarts"], 1)
+
+    def test_cancel_running_and_queued(self):
+        """Cancelling stops a running answer and drops a queued one"""
+        running = self.pool.submit("hang")
+        queued = self.pool.submit("never")
+        while self.pool.stats()["busy"] == 0:
+            time.sleep(0.01)
+        self.assertTrue(self.pool.cancel(queued))
+        self.assertTrue(queued.cancelled())
+        self.assertTrue(self.pool.cancel(running))
+        with self.assertRaises(GenerationCancelled):
+            running.result(5)
+        self.assertEqual(self.pool.generate("next"), "NEXT")
+        self.assertEqual(self.pool.stats()["cancellations"], 2)
+
+    @unittest.skipUnless(os.name == "posix", "needs POSIX signals")
+    def test_interrupt_cancels_generation(self):
+        """Ctrl-C while waiting cancels the generation and propagates"""
+        timer = threading.Timer(0.5, os.kill, (os.getpid(), signal.SIGINT))
+        timer.start()
+        with self.assertRaises(GenerationInterrupted):
+            self.pool.generate("hang")
+        timer.join()
+        self.assertEqual(self.pool.generate("next"), "NEXT")
+        self.assertEqual(self.pool.stats()["cancellations"], 1)
+
+    def test_bounded_queue(self):
+        """Submitting past max_pending raises PoolBusy instead of queueing"""
+        futures = [self.pool.submit("hang")]
+        while self.pool.stats()["busy"] == 0:
+            time.sleep(0.01)
+        futures += [self.pool.submit("a"), self.pool.submit("b")]
+        with self.assertRaises(PoolBusy):
+            self.pool.submit("c")
+        for future in futures:
+            self.pool.cancel(future)
+
+    def test_load_failure_reported(self):
+        """A model that can't load fails requests instead of restarting forever"""
+        pool = WorkerPool(broken_worker, processes=1, timeout=5)
+        try:
+            with self.assertRaisesRegex(RuntimeError, "no model here"):
+                pool.generate("hi")
+            with self.assertRaisesRegex(RuntimeError, "no model here"):
+                pool.submit("again")
+            self.assertEqual(pool.stats()["restarts"], 0)
+        finally:
+            pool.close()
+
+
+if __name__ == "__main__":
+    unittest.main()